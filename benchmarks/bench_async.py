@@ -0,0 +1,80 @@
+"""Benchmark how long opening and saving a large document stalls an asyncio event loop.
+
+Run from the project root, e.g. `python benchmarks/bench_async.py --paragraphs 100000`.
+A ticker task wakes every millisecond while a generated document is opened and saved,
+first with the blocking `docx.Document()` and `Document.save()` called from a coroutine,
+then with `docx.open_async()` and `Document.save_async()`. The longest gap between
+ticks is how long any other request on the loop would have waited.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+import docx
+
+
+def make_document(path: str, paragraph_count: int) -> None:
+    """Save a document having `paragraph_count` paragraphs to `path`."""
+    document = docx.Document()
+    for i in range(paragraph_count):
+        document.add_paragraph("paragraph %d of a large document being served" % i)
+    document.save(path)
+
+
+async def blocking(path: str) -> None:
+    """Open and save the document at `path` with the blocking API."""
+    docx.Document(path).save(io.BytesIO())
+
+
+async def non_blocking(path: str) -> None:
+    """Open and save the document at `path` with the asyncio API."""
+    document = await docx.open_async(path)
+    await document.save_async(io.BytesIO())
+
+
+async def longest_stall(fn: Callable[[str], Awaitable[None]], path: str) -> tuple[float, float]:
+    """Return the seconds taken by `fn(path)` and the longest gap between ticks meanwhile."""
+    ticks: List[float] = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await fn(path)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)
+    ticker_task.cancel()
+    return elapsed, max(b - a for a, b in zip(ticks, ticks[1:]))
+
+
+async def run(path: str) -> None:
+    for fn in (blocking, non_blocking):
+        elapsed, stall = await longest_stall(fn, path)
+        print("  %-20s %9.3fs   longest stall %7.3fs" % (fn.__name__, elapsed, stall))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "large.docx")
+        make_document(path, args.paragraphs)
+        print("%d paragraphs, %.1f MB file" % (args.paragraphs, os.path.getsize(path) / 1e6))
+        asyncio.run(run(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark processing many documents with `docx.batch.map_documents()` vs. a serial loop.
+
+Run from the project root, e.g. `python benchmarks/bench_batch.py --documents 200 --workers 8`.
+`--documents` small generated documents are written once, then the words in each are
+counted, first by opening them one after another in this process and then in a pool of
+worker processes. The pool helps only on a machine with more than one core. Last,
+`--timeouts` of the documents are processed by a function that never returns, to time
+interrupting each after `--timeout` seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+import docx
+from docx.batch import map_documents
+from docx.document import Document
+
+
+def make_documents(dirpath: str, document_count: int, paragraph_count: int) -> List[str]:
+    """Return the paths of `document_count` documents saved in `dirpath`."""
+    document = docx.Document()
+    for i in range(paragraph_count):
+        document.add_paragraph("paragraph %d of a document to be processed in a batch" % i)
+    paths = [os.path.join(dirpath, "doc%04d.docx" % n) for n in range(document_count)]
+    for path in paths:
+        document.save(path)
+    return paths
+
+
+def word_count(document: Document) -> int:
+    """Return the number of words in the paragraphs of `document`."""
+    return sum(len(paragraph.text.split()) for paragraph in document.paragraphs)
+
+
+def sleep(document: Document) -> None:
+    """Sleep for far longer than any batch timeout."""
+    time.sleep(3600)
+
+
+def time_serial(paths: List[str]) -> float:
+    """Return the wall-clock seconds taken to count words in each document in turn."""
+    start = time.perf_counter()
+    for path in paths:
+        word_count(docx.Document(path))
+    return time.perf_counter() - start
+
+
+def time_batch(paths: List[str], workers: int, chunksize: int) -> float:
+    """Return the wall-clock seconds taken to count words with `map_documents()`."""
+    start = time.perf_counter()
+    for result in map_documents(word_count, paths, workers=workers, chunksize=chunksize):
+        if not result.ok:
+            raise RuntimeError("%s failed: %s" % (result.path, result.error))
+    return time.perf_counter() - start
+
+
+def time_timeouts(paths: List[str], workers: int, timeout: float) -> float:
+    """Return the wall-clock seconds taken to interrupt processing each of `paths`."""
+    start = time.perf_counter()
+    for result in map_documents(sleep, paths, workers=workers, timeout=timeout):
+        if not isinstance(result.error, TimeoutError):
+            raise RuntimeError("%s was not interrupted: %r" % (result.path, result.error))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=4)
+    parser.add_argument("--timeouts", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = make_documents(tmpdir, args.documents, args.paragraphs)
+        print(
+            "%d documents of %d paragraphs, %d cores"
+            % (args.documents, args.paragraphs, os.cpu_count() or 1)
+        )
+        for label, seconds in (
+            ("serial", time_serial(paths)),
+            ("%d workers" % args.workers, time_batch(paths, args.workers, args.chunksize)),
+        ):
+            print("  %-20s %9.3fs %9.1f docs/s" % (label, seconds, args.documents / seconds))
+        timeout_paths = paths[: args.timeouts]
+        seconds = time_timeouts(timeout_paths, args.workers, args.timeout)
+        print(
+            "  %-20s %9.3fs %9.3fs over the timeout each"
+            % ("timeouts", seconds, seconds * args.workers / len(timeout_paths) - args.timeout)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark copying a document with `Document.clone()` vs. saving and reopening it.
+
+Run from the project root, e.g. `python benchmarks/bench_clone.py --paragraphs 2000`.
+A base document having `--paragraphs` paragraphs, a table every 50 paragraphs, and
+`--images` pictures is generated once, then `--copies` variants of it are made each way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import time
+from typing import Callable
+
+import docx
+from docx.document import Document
+
+PNG_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files", "monty-truth.png"
+)
+
+
+def make_document(paragraph_count: int, image_count: int) -> Document:
+    """Return a new document having `paragraph_count` paragraphs and `image_count` pictures."""
+    with open(PNG_PATH, "rb") as f:
+        png = f.read()
+    document = docx.Document()
+    for i in range(paragraph_count):
+        document.add_paragraph("paragraph %d " % i).add_run("second run").bold = True
+        if i % 50 == 49:
+            document.add_table_from_rows([["r%d c%d" % (r, c) for c in range(4)] for r in range(5)])
+    for i in range(image_count):
+        document.add_picture(io.BytesIO(png + b"%08d" % i))
+    return document
+
+
+def round_trip(document: Document) -> Document:
+    """Return a copy of `document` made by saving it to memory and loading it again."""
+    stream = io.BytesIO()
+    document.save(stream)
+    return docx.Document(stream)
+
+
+def clone(document: Document) -> Document:
+    """Return a copy of `document` made with `Document.clone()`."""
+    return document.clone()
+
+
+def time_copies(fn: Callable[[Document], Document], document: Document, copies: int) -> float:
+    """Return the wall-clock seconds taken to make `copies` variants of `document` with `fn`."""
+    start = time.perf_counter()
+    for i in range(copies):
+        fn(document).paragraphs[0].text = "variant %d" % i
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--copies", type=int, default=50)
+    args = parser.parse_args()
+
+    document = make_document(args.paragraphs, args.images)
+    print(
+        "%d copies of %d paragraphs, %d images"
+        % (args.copies, len(document.paragraphs), len(document.inline_shapes))
+    )
+    for fn in (round_trip, clone):
+        print("  %-20s %9.3fs" % (fn.__name__, time_copies(fn, document, args.copies)))
+
+
+if __name__ == "__main__":
+    main()
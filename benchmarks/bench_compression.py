@@ -0,0 +1,79 @@
+"""Benchmark saving a media-heavy document, deflating its images vs. storing them as-is.
+
+Run from the project root, e.g. `python benchmarks/bench_compression.py --images 24`.
+A document holding `--images` distinct PNG images is generated once and then saved to
+memory with each compression policy. PNG data is already deflated, so deflating it again
+takes time for next to no reduction in size; the default policy stores it instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import struct
+import time
+import zlib
+from typing import Mapping
+
+import docx
+from docx.document import Document
+
+
+def png_image(width: int, height: int, seed: int) -> bytes:
+    """Return a 24-bit PNG image of `width` x `height` pixels, different for each `seed`."""
+    rand = random.Random(seed)
+    ramp = bytes(range(256)) * (width * 3 // 256 + 2)
+    # -- each row is a filter-type byte then half noise, half gradient --
+    raw = b"".join(
+        b"\x00"
+        + rand.randbytes(width * 3 // 2)
+        + ramp[y % 256 : y % 256 + width * 3 - width * 3 // 2]
+        for y in range(height)
+    )
+
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(chunk_type + data)
+        return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def make_media_heavy_document(image_count: int, image_size: int) -> Document:
+    """Return a new document having `image_count` distinct square PNG images."""
+    document = docx.Document()
+    for i in range(image_count):
+        document.add_paragraph("Figure %d" % (i + 1))
+        document.add_picture(io.BytesIO(png_image(image_size, image_size, i)))
+    return document
+
+
+def time_save(document: Document, compression: Mapping[str, int] | None) -> tuple[float, int]:
+    """Return seconds taken to save `document` with `compression`, and the saved size."""
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    document.save(stream, compression=compression)
+    return time.perf_counter() - start, len(stream.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=24)
+    parser.add_argument("--image-size", type=int, default=1000, help="pixels per side")
+    args = parser.parse_args()
+
+    document = make_media_heavy_document(args.images, args.image_size)
+    print("%d PNG images" % args.images)
+    for name, compression in (("deflate all", {}), ("store images", None)):
+        seconds, size = time_save(document, compression)
+        print("  %-20s %9.3fs %8.1f MB" % (name, seconds, size / 1e6))
+
+
+if __name__ == "__main__":
+    main()
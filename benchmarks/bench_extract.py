@@ -0,0 +1,67 @@
+"""Benchmark streaming the blocks of a document body against loading the whole document.
+
+Run from the project root, e.g. `python benchmarks/bench_extract.py --paragraphs 20000`.
+A document with a table every 50 paragraphs is saved once, then the text and style of
+each block is read with `docx.extract.iter_blocks()`, and the text alone of each
+paragraph and cell with `Document()`, both starting from the file. Streaming should take
+less time than the full load despite also looking up the style of each block.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import docx
+from docx.extract import iter_blocks
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_text import make_document  # noqa: E402
+
+
+def stream_blocks(path: str) -> None:
+    """Read the text and style of each body block with `iter_blocks()`."""
+    for _ in iter_blocks(path):
+        pass
+
+
+def load_document(path: str) -> None:
+    """Read the text of each paragraph and cell with `Document()`."""
+    document = docx.Document(path)
+    for paragraph in document.paragraphs:
+        paragraph.text
+    for table in document.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text
+
+
+def time_it(fn: Callable[[str], None], path: str) -> float:
+    """Return the wall-clock seconds taken by `fn(path)`."""
+    start = time.perf_counter()
+    fn(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "text.docx")
+        make_document(args.paragraphs).save(path)
+        print("%d paragraphs, %.1f MB file" % (args.paragraphs, os.path.getsize(path) / 1e6))
+        timings = {fn.__name__: time_it(fn, path) for fn in (stream_blocks, load_document)}
+        for name, seconds in timings.items():
+            print("  %-20s %9.3fs" % (name, seconds))
+        print("  %-20s %9.2fx" % ("speedup", timings["load_document"] / timings["stream_blocks"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark adding many distinct pictures to a document.
+
+Run from the project root, e.g. `python benchmarks/bench_images.py --images 2000`.
+Each picture is a copy of a small test PNG made distinct by trailing bytes, so every
+`add_picture()` call must check for a matching image already in the package and then
+add a new image part.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import time
+
+import docx
+
+PNG_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files", "monty-truth.png"
+)
+
+
+def add_pictures(image_count: int) -> float:
+    """Return the wall-clock seconds taken to add `image_count` distinct pictures."""
+    with open(PNG_PATH, "rb") as f:
+        png = f.read()
+    document = docx.Document()
+    start = time.perf_counter()
+    for i in range(image_count):
+        document.add_picture(io.BytesIO(png + b"%08d" % i))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("%d distinct images" % args.images)
+    print("  %-20s %9.3fs" % ("add_picture", add_pictures(args.images)))
+
+
+if __name__ == "__main__":
+    main()
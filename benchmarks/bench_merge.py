@@ -0,0 +1,110 @@
+"""Benchmark mail-merge throughput of `docx.merge.MergeTemplate` vs. editing each document.
+
+Run from the project root, e.g. `python benchmarks/bench_merge.py --records 500`. A letter
+template is generated having placeholders in the body, in a table, and in the header,
+some split across runs, along with `--paragraphs` paragraphs of fixed text and a picture.
+A document is then rendered for each of `--records` records, first the usual way, opening
+the template, replacing the text of each placeholder, and saving, and then with a
+`MergeTemplate`. Throughput is reported in documents per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List
+
+import docx
+from docx.merge import DEFAULT_PATTERN, MergeTemplate
+
+PNG_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files", "monty-truth.png"
+)
+
+
+def make_template(paragraph_count: int) -> bytes:
+    """Return the bytes of a letter template having `paragraph_count` fixed paragraphs."""
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Account {{account}}"
+    paragraph = document.add_paragraph("Dear ")
+    paragraph.add_run("{{first_")
+    paragraph.add_run("name}} {{last_name}},").bold = True
+    document.add_paragraph("Your balance on {{date}} is {{balance}}.")
+    table = document.add_table(rows=2, cols=2)
+    for r, (label, field) in enumerate((("Street", "street"), ("City", "city"))):
+        table.cell(r, 0).text = label
+        table.cell(r, 1).text = "{{%s}}" % field
+    for i in range(paragraph_count):
+        document.add_paragraph("Fixed paragraph %d of the terms and conditions of the letter." % i)
+    document.add_picture(PNG_PATH)
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def make_records(record_count: int) -> List[Dict[str, Any]]:
+    """Return `record_count` records having a value for each field of the template."""
+    return [
+        {
+            "account": "AC-%06d" % i,
+            "first_name": "First%d" % i,
+            "last_name": "Last%d" % i,
+            "date": "2024-01-31",
+            "balance": "%.2f" % (i * 1.5),
+            "street": "%d High Street" % i,
+            "city": "Leeds",
+        }
+        for i in range(record_count)
+    ]
+
+
+def render_by_editing(template: bytes, records: List[Dict[str, Any]]) -> None:
+    """Open the template, replace each placeholder, and save, for each of `records`."""
+    pattern = re.compile(DEFAULT_PATTERN)
+    for record in records:
+        document = docx.Document(io.BytesIO(template))
+        paragraphs = list(document.paragraphs)
+        for table in document.tables:
+            for row in table.rows:
+                paragraphs.extend(p for cell in row.cells for p in cell.paragraphs)
+        paragraphs.extend(document.sections[0].header.paragraphs)
+        for paragraph in paragraphs:
+            text = paragraph.text
+            if "{{" in text:
+                paragraph.text = pattern.sub(lambda m: str(record[m.group(1)]), text)
+        document.save(io.BytesIO())
+
+
+def render_with_merge_template(template: bytes, records: List[Dict[str, Any]]) -> None:
+    """Index the template once, then render a document from each of `records`."""
+    merge_template = MergeTemplate(io.BytesIO(template))
+    for _ in merge_template.iter_render(records):
+        pass
+
+
+def measure(fn: Callable[[bytes, List[Dict[str, Any]]], None], *args: Any) -> float:
+    """Return the wall-clock seconds taken by `fn(*args)`."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    args = parser.parse_args()
+
+    template = make_template(args.paragraphs)
+    records = make_records(args.records)
+    print("%d records, %.1f KB template" % (args.records, len(template) / 1e3))
+    for fn in (render_by_editing, render_with_merge_template):
+        seconds = measure(fn, template, records)
+        print("  %-28s %9.3fs %9.1f docs/s" % (fn.__name__, seconds, args.records / seconds))
+
+
+if __name__ == "__main__":
+    main()
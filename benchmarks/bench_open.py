@@ -0,0 +1,72 @@
+"""Benchmark opening an image-heavy document, decompressing parts serially vs. in threads.
+
+Run from the project root, e.g. `python benchmarks/bench_open.py --images 24 --workers 8`.
+A document holding `--images` distinct uncompressed (BMP) images is generated once; the
+images compress well, so inflating them dominates the time taken to open it. Parallel
+decompression helps only on a machine with more than one core.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import random
+import struct
+import tempfile
+import time
+
+import docx
+
+
+def bmp_image(width: int, height: int, seed: int) -> bytes:
+    """Return a 24-bit BMP image of `width` x `height` pixels, different for each `seed`."""
+    row_size = (width * 3 + 3) & ~3
+    # -- half noise, half gradient, so the image compresses to about half its size --
+    rand = random.Random(seed)
+    ramp = bytes(range(256)) * (row_size // 256 + 2)
+    pixels = b"".join(
+        rand.randbytes(row_size // 2) + ramp[y % 256 : y % 256 + row_size - row_size // 2]
+        for y in range(height)
+    )
+    header = b"BM" + struct.pack("<IHHI", 54 + len(pixels), 0, 0, 54)
+    info = struct.pack("<IiiHHIIiiII", 40, width, height, 1, 24, 0, len(pixels), 2835, 2835, 0, 0)
+    return header + info + pixels
+
+
+def make_image_heavy_docx(path: str, image_count: int, image_size: int) -> None:
+    """Save a document having `image_count` distinct square BMP images to `path`."""
+    document = docx.Document()
+    for i in range(image_count):
+        document.add_paragraph("Figure %d" % (i + 1))
+        document.add_picture(io.BytesIO(bmp_image(image_size, image_size, i)))
+    document.save(path)
+
+
+def time_open(path: str, workers: int | None) -> float:
+    """Return the wall-clock seconds taken to open the document at `path`."""
+    start = time.perf_counter()
+    docx.Document(path, workers=workers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=24)
+    parser.add_argument("--image-size", type=int, default=1000, help="pixels per side")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "images.docx")
+        make_image_heavy_docx(path, args.images, args.image_size)
+        print(
+            "%d images, %.1f MB file, %d cores"
+            % (args.images, os.path.getsize(path) / 1e6, os.cpu_count() or 1)
+        )
+        print("  %-20s %9.3fs" % ("serial", time_open(path, None)))
+        print("  %-20s %9.3fs" % ("%d workers" % args.workers, time_open(path, args.workers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark reading the part graph of a package having thousands of parts.
+
+Run from the project root, e.g. `python benchmarks/bench_reader.py --images 5000`.
+A document holding `--images` distinct small pictures is generated once, then its
+relationship graph is walked without reading any part blobs, as when a document is
+opened with `lazy=True`, and its manifest is read from the zip directory alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from typing import Callable
+
+import docx
+from docx.opc.pkgreader import PackageManifest, PackageReader
+
+PNG_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files", "monty-truth.png"
+)
+
+
+def make_many_part_docx(path: str, image_count: int) -> None:
+    """Save a document having `image_count` distinct pictures, each its own part, to `path`."""
+    with open(PNG_PATH, "rb") as f:
+        png = f.read()
+    document = docx.Document()
+    for i in range(image_count):
+        document.add_picture(io.BytesIO(png + b"%08d" % i))
+    document.save(path)
+
+
+def walk_lazily(path: str) -> None:
+    """Walk the relationship graph of the package at `path` without reading part blobs."""
+    PackageReader.from_file(path, lazy=True)
+
+
+def read_manifest(path: str) -> None:
+    """Index the members of the package at `path` from its zip directory."""
+    PackageManifest.from_file(path)
+
+
+def time_it(fn: Callable[[str], None], path: str) -> float:
+    """Return the wall-clock seconds taken by `fn(path)`."""
+    start = time.perf_counter()
+    fn(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "parts.docx")
+        make_many_part_docx(path, args.images)
+        print("%d image parts, %.1f MB file" % (args.images, os.path.getsize(path) / 1e6))
+        for fn in (walk_lazily, read_manifest):
+            print("  %-20s %9.3fs" % (fn.__name__, time_it(fn, path)))
+
+
+if __name__ == "__main__":
+    main()
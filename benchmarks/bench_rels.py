@@ -0,0 +1,43 @@
+"""Benchmark adding many relationships to the main document part.
+
+Run from the project root, e.g. `python benchmarks/bench_rels.py --rels 10000`.
+Adds distinct external hyperlink relationships, then looks each one up again, as is
+done for each hyperlink or picture inserted into a document.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import docx
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+
+def relate_to_urls(rel_count: int) -> tuple[float, float]:
+    """Return seconds taken to add `rel_count` hyperlink relationships, then to find them."""
+    part = docx.Document().part
+    urls = ["https://example.com/%d" % n for n in range(rel_count)]
+
+    start = time.perf_counter()
+    for url in urls:
+        part.relate_to(url, RT.HYPERLINK, is_external=True)
+    added = time.perf_counter()
+    for url in urls:
+        part.relate_to(url, RT.HYPERLINK, is_external=True)
+    return added - start, time.perf_counter() - added
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rels", type=int, default=10000)
+    args = parser.parse_args()
+
+    add_seconds, find_seconds = relate_to_urls(args.rels)
+    print("%d external relationships" % args.rels)
+    print("  %-20s %9.3fs" % ("add", add_seconds))
+    print("  %-20s %9.3fs" % ("find", find_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark saving the same document again, unchanged and after a small change.
+
+Run from the project root, e.g. `python benchmarks/bench_resave.py --paragraphs 4000`.
+A generated document is saved once, then saved `--saves` more times each way. The XML
+of each part is serialized on every save and compared with the XML it was last saved as;
+a part whose XML is unchanged is written in the compressed form kept from that save
+rather than being deflated again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+import docx
+from docx.document import Document
+
+
+def make_document(paragraph_count: int) -> Document:
+    """Return a new document having `paragraph_count` paragraphs of two runs each."""
+    document = docx.Document()
+    for i in range(paragraph_count):
+        paragraph = document.add_paragraph("paragraph %d of a document saved again " % i)
+        paragraph.add_run("and again").bold = True
+    return document
+
+
+def time_saves(document: Document, save_count: int, change: bool) -> float:
+    """Return the mean seconds taken to save `document`, changing it first when `change`."""
+    paragraph = document.paragraphs[0]
+    total = 0.0
+    for i in range(save_count):
+        if change:
+            paragraph.text = "changed %d times" % (i + 1)
+        start = time.perf_counter()
+        document.save(io.BytesIO())
+        total += time.perf_counter() - start
+    return total / save_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=4000)
+    parser.add_argument("--saves", type=int, default=20)
+    args = parser.parse_args()
+
+    document = make_document(args.paragraphs)
+    start = time.perf_counter()
+    document.save(io.BytesIO())
+    first = time.perf_counter() - start
+
+    print("%d paragraphs, mean of %d saves" % (args.paragraphs, args.saves))
+    print("  %-20s %9.3fs" % ("first save", first))
+    print("  %-20s %9.3fs" % ("unchanged", time_saves(document, args.saves, change=False)))
+    print("  %-20s %9.3fs" % ("one paragraph", time_saves(document, args.saves, change=True)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark saving an image-heavy document, compressing parts serially vs. in threads.
+
+Run from the project root, e.g. `python benchmarks/bench_save.py --images 24 --workers 8`.
+A document holding `--images` distinct uncompressed (BMP) images is generated and opened
+once, then saved to memory each way; deflating the images dominates the time taken to
+save it. Parallel compression helps only on a machine with more than one core.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from bench_open import make_image_heavy_docx
+
+import docx
+from docx.document import Document
+
+
+def time_save(document: Document, workers: int | None) -> float:
+    """Return the wall-clock seconds taken to save `document` to an in-memory stream."""
+    start = time.perf_counter()
+    document.save(io.BytesIO(), workers=workers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=24)
+    parser.add_argument("--image-size", type=int, default=1000, help="pixels per side")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "images.docx")
+        make_image_heavy_docx(path, args.images, args.image_size)
+        document = docx.Document(path)
+    print("%d images, %d cores" % (args.images, os.cpu_count() or 1))
+    print("  %-20s %9.3fs" % ("serial", time_save(document, None)))
+    print("  %-20s %9.3fs" % ("%d workers" % args.workers, time_save(document, args.workers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark peak memory of saving an image-heavy document to a buffer vs. a chunk at a time.
+
+Run from the project root, e.g. `python benchmarks/bench_save_stream.py --images 24`.
+A document holding `--images` distinct uncompressed (BMP) images is generated and opened
+once, then saved both to an in-memory buffer, as is done to send a document over a
+network without a file, and with `Document.iter_save_chunks()` to a sink discarding each
+chunk. Peak memory allocated while saving is measured with `tracemalloc`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from bench_open import make_image_heavy_docx
+
+import docx
+from docx.document import Document
+
+
+def save_to_buffer(document: Document) -> None:
+    """Save `document` to a buffer holding the whole file in memory."""
+    document.save(io.BytesIO())
+
+
+def save_a_chunk_at_a_time(document: Document) -> None:
+    """Save `document` a chunk at a time, discarding each chunk as it is sent."""
+    for _ in document.iter_save_chunks():
+        pass
+
+
+def measure(fn: Callable[[Document], None], document: Document) -> tuple[float, float]:
+    """Return wall-clock seconds taken by `fn(document)` and the peak MB it allocated."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(document)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=24)
+    parser.add_argument("--image-size", type=int, default=1000, help="pixels per side")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "images.docx")
+        make_image_heavy_docx(path, args.images, args.image_size)
+        print("%d images, %.1f MB file" % (args.images, os.path.getsize(path) / 1e6))
+        document = docx.Document(path)
+        for fn in (save_to_buffer, save_a_chunk_at_a_time):
+            seconds, peak_mb = measure(fn, document)
+            print("  %-24s %9.3fs %8.1f MB peak" % (fn.__name__, seconds, peak_mb))
+
+
+if __name__ == "__main__":
+    main()
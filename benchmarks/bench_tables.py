@@ -0,0 +1,70 @@
+"""Benchmark table construction, cell by cell vs. in a batch from rows of cell text.
+
+Run from the project root, e.g. `python benchmarks/bench_tables.py --rows 1000 --cols 10`.
+The per-cell path is quadratic in the size of the table, so keep the row count modest
+when it is included; use `--bulk-only` to time large tables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+import docx
+
+
+def rows_of_text(row_count: int, col_count: int) -> list[list[str]]:
+    """Return `row_count` rows of `col_count` distinct cell-text strings."""
+    return [["r%d c%d" % (r, c) for c in range(col_count)] for r in range(row_count)]
+
+
+def fill_cell_by_cell(rows: list[list[str]]) -> None:
+    """Build a table with `Document.add_table()` and assign the text of each cell."""
+    document = docx.Document()
+    table = document.add_table(rows=len(rows), cols=len(rows[0]))
+    for r, texts in enumerate(rows):
+        for c, text in enumerate(texts):
+            table.cell(r, c).text = text
+
+
+def fill_row_by_row(rows: list[list[str]]) -> None:
+    """Build a table with `Table.add_row()` and assign the text of each new cell."""
+    document = docx.Document()
+    table = document.add_table(rows=0, cols=len(rows[0]))
+    for texts in rows:
+        for cell, text in zip(table.add_row().cells, texts):
+            cell.text = text
+
+
+def fill_in_bulk(rows: list[list[str]]) -> None:
+    """Build a table with `Document.add_table_from_rows()`."""
+    document = docx.Document()
+    document.add_table_from_rows(rows)
+
+
+def time_it(fn: Callable[[list[list[str]]], None], rows: list[list[str]]) -> float:
+    """Return the wall-clock seconds taken by `fn(rows)`."""
+    start = time.perf_counter()
+    fn(rows)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--bulk-only", action="store_true", help="skip the per-cell paths")
+    args = parser.parse_args()
+
+    rows = rows_of_text(args.rows, args.cols)
+    benchmarks = [fill_cell_by_cell, fill_row_by_row, fill_in_bulk]
+    if args.bulk_only:
+        benchmarks = [fill_in_bulk]
+    print("%d x %d table (%d cells)" % (args.rows, args.cols, args.rows * args.cols))
+    for fn in benchmarks:
+        print("  %-20s %9.3fs" % (fn.__name__, time_it(fn, rows)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark extraction of the text of a document, paragraph by paragraph.
+
+Run from the project root, e.g. `python benchmarks/bench_text.py --paragraphs 20000`.
+A document is generated with runs of text, tabs, breaks, and a table every 50
+paragraphs, then its text is extracted through the proxy objects and in one pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+import docx
+from docx.document import Document
+from docx.enum.text import WD_BREAK
+
+
+def make_document(paragraph_count: int) -> Document:
+    """Return a new document having `paragraph_count` paragraphs of mixed run content."""
+    document = docx.Document()
+    for i in range(paragraph_count):
+        paragraph = document.add_paragraph("paragraph %d\tfirst run " % i)
+        paragraph.add_run("second run").bold = True
+        paragraph.add_run().add_break(WD_BREAK.LINE)
+        paragraph.add_run("third run")
+        if i % 50 == 49:
+            document.add_table_from_rows([["r%d c%d" % (r, c) for c in range(4)] for r in range(5)])
+    return document
+
+
+def paragraph_text(document: Document) -> None:
+    """Get the text of each top-level paragraph with `Paragraph.text`."""
+    for paragraph in document.paragraphs:
+        paragraph.text
+
+
+def cell_text(document: Document) -> None:
+    """Get the text of each table cell with `_Cell.text`."""
+    for table in document.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text
+
+
+def document_text(document: Document) -> None:
+    """Get the text of the whole body with `Document.text`."""
+    document.text
+
+
+def time_it(fn: Callable[[Document], None], document: Document) -> float:
+    """Return the wall-clock seconds taken by `fn(document)`."""
+    start = time.perf_counter()
+    fn(document)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    args = parser.parse_args()
+
+    document = make_document(args.paragraphs)
+    print("%d paragraphs, %d tables" % (len(document.paragraphs), len(document.tables)))
+    for fn in (paragraph_text, cell_text, document_text):
+        print("  %-20s %9.3fs" % (fn.__name__, time_it(fn, document)))
+
+
+if __name__ == "__main__":
+    main()
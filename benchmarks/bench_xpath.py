@@ -0,0 +1,73 @@
+"""Benchmark `BaseOxmlElement.xpath()` with and without the compiled-expression cache.
+
+Run from the project root, e.g. `python benchmarks/bench_xpath.py --paragraphs 20000`.
+Evaluates the XPath expressions behind a few common element properties on each
+paragraph of a large body, once recompiling each expression on every call as
+`lxml` `_Element.xpath()` does, and once through the cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+from lxml import etree
+
+import docx
+from docx.oxml.ns import nsmap
+from docx.oxml.text.paragraph import CT_P
+from docx.oxml.xmlchemy import compiled_xpath
+
+# -- used by CT_P.inner_content_elements, CT_P.lastRenderedPageBreaks, and CT_R.text --
+XPATH_STRS = (
+    "./w:r | ./w:hyperlink",
+    "./w:r/w:lastRenderedPageBreak | ./w:hyperlink/w:r/w:lastRenderedPageBreak",
+    "w:r/w:t",
+)
+
+
+def make_paragraphs(paragraph_count: int) -> List[CT_P]:
+    """Return the `w:p` elements of a new document having `paragraph_count` paragraphs."""
+    document = docx.Document()
+    for i in range(paragraph_count):
+        paragraph = document.add_paragraph("paragraph %d " % i)
+        paragraph.add_run("second run").bold = True
+    return document.element.body.p_lst
+
+
+def recompiled(ps: List[CT_P]) -> None:
+    """Evaluate each expression on each paragraph, compiling it on every call."""
+    for p in ps:
+        for xpath_str in XPATH_STRS:
+            etree.ElementBase.xpath(p, xpath_str, namespaces=nsmap)
+
+
+def cached(ps: List[CT_P]) -> None:
+    """Evaluate each expression on each paragraph with `BaseOxmlElement.xpath()`."""
+    for p in ps:
+        for xpath_str in XPATH_STRS:
+            p.xpath(xpath_str)
+
+
+def time_it(fn: Callable[[List[CT_P]], None], ps: List[CT_P]) -> float:
+    """Return the wall-clock seconds taken by `fn(ps)`."""
+    start = time.perf_counter()
+    fn(ps)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    args = parser.parse_args()
+
+    ps = make_paragraphs(args.paragraphs)
+    print("%d paragraphs x %d expressions" % (len(ps), len(XPATH_STRS)))
+    for fn in (recompiled, cached):
+        print("  %-20s %9.3fs" % (fn.__name__, time_it(fn, ps)))
+    print("  %s" % (compiled_xpath.cache_info(),))
+
+
+if __name__ == "__main__":
+    main()
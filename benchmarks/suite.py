@@ -0,0 +1,340 @@
+"""Run the benchmark suite over the hot paths of python-docx and record the results.
+
+Run from the project root, e.g. `python benchmarks/suite.py --json results.json`, or
+`python benchmarks/suite.py open save` to run only some cases. Each case builds a
+synthetic document whose size is multiplied by `--scale`, then times one operation on it,
+keeping the best of `--repeat` runs, each on a freshly built document. The peak memory
+allocated by the operation is measured with `tracemalloc` in one more run, apart from the
+timed ones because tracing slows Python down.
+
+`--json` writes the results, along with the commit, Python version, and platform they were
+measured on, as JSON. `--compare` reads results written that way, from an earlier commit
+say, and reports the ratio of each time and peak to it. The exit status is 1 when any case
+is slower than the baseline by more than `--threshold`, so the suite can gate a CI job;
+timings are only comparable between runs on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import docx
+from docx.document import Document
+from docx.enum.section import WD_SECTION
+
+PNG_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "test_files", "monty-truth.png"
+)
+
+STYLE_NAMES = ["Normal", "Heading 1", "Heading 2", "Title", "Quote", "List Bullet", "Caption"]
+
+# -- a case is a function taking the scale and returning the operation to time, with its
+# -- document already built; it is called again for each run --
+Case = Callable[[float], Callable[[], Any]]
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register the decorated function as the benchmark case `name`."""
+
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+# -- synthetic documents ---------------------------------------------------------------
+
+
+def png_images(image_count: int) -> List[bytes]:
+    """Return `image_count` distinct copies of a small test PNG, each its own image."""
+    with open(PNG_PATH, "rb") as f:
+        png = f.read()
+    return [png + b"%08d" % i for i in range(image_count)]
+
+
+def make_document(paragraph_count: int, image_count: int = 0, section_count: int = 1) -> Document:
+    """Return a new document having `paragraph_count` paragraphs of mixed run content.
+
+    A five-row table follows every 50 paragraphs, `image_count` pictures follow the
+    paragraphs, and the body is divided into `section_count` sections.
+    """
+    document = docx.Document()
+    paragraphs_per_section = max(1, paragraph_count // section_count)
+    for i in range(paragraph_count):
+        paragraph = document.add_paragraph("paragraph %d\tfirst run " % i, STYLE_NAMES[i % 7])
+        paragraph.add_run("second run").bold = True
+        if i % 50 == 49:
+            document.add_table_from_rows([["r%d c%d" % (r, c) for c in range(4)] for r in range(5)])
+        if i % paragraphs_per_section == paragraphs_per_section - 1 and i < paragraph_count - 1:
+            document.add_section(WD_SECTION.NEW_PAGE)
+    for png in png_images(image_count):
+        document.add_picture(io.BytesIO(png))
+    return document
+
+
+def saved(document: Document) -> bytes:
+    """Return the bytes of `document` saved as a .docx file."""
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def scaled(count: int, scale: float) -> int:
+    """Return `count` multiplied by `scale`, but at least 1."""
+    return max(1, int(count * scale))
+
+
+# -- cases -----------------------------------------------------------------------------
+
+
+@case("open")
+def open_document(scale: float) -> Callable[[], Any]:
+    """Open a document of paragraphs, tables, and pictures from memory."""
+    blob = saved(make_document(scaled(2000, scale), scaled(20, scale)))
+    return lambda: docx.Document(io.BytesIO(blob))
+
+
+@case("save")
+def save_document(scale: float) -> Callable[[], Any]:
+    """Save a document of paragraphs, tables, and pictures to memory."""
+    document = make_document(scaled(2000, scale), scaled(20, scale))
+    return lambda: document.save(io.BytesIO())
+
+
+@case("add_paragraph")
+def build_paragraphs(scale: float) -> Callable[[], Any]:
+    """Add styled paragraphs having two runs each to a new document."""
+    document = docx.Document()
+    paragraph_count = scaled(2000, scale)
+
+    def add_paragraphs():
+        for i in range(paragraph_count):
+            paragraph = document.add_paragraph("paragraph %d " % i, STYLE_NAMES[i % 7])
+            paragraph.add_run("second run").bold = True
+
+    return add_paragraphs
+
+
+@case("table_fill")
+def build_table(scale: float) -> Callable[[], Any]:
+    """Set the text of each cell of a new table, cell by cell with `Table.cell()`."""
+    row_count, col_count = scaled(100, scale), 8
+    table = docx.Document().add_table(rows=row_count, cols=col_count)
+
+    def fill():
+        for r in range(row_count):
+            for c in range(col_count):
+                table.cell(r, c).text = "r%d c%d" % (r, c)
+
+    return fill
+
+
+@case("add_picture")
+def build_pictures(scale: float) -> Callable[[], Any]:
+    """Add distinct pictures to a new document, each in its own image part."""
+    document = docx.Document()
+    pngs = png_images(scaled(200, scale))
+
+    def add_pictures():
+        for png in pngs:
+            document.add_picture(io.BytesIO(png))
+
+    return add_pictures
+
+
+@case("text")
+def extract_text(scale: float) -> Callable[[], Any]:
+    """Extract the text of a document, paragraph by paragraph and cell by cell."""
+    document = make_document(scaled(5000, scale))
+
+    def extract():
+        for paragraph in document.paragraphs:
+            paragraph.text
+        for table in document.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text
+
+    return extract
+
+
+@case("style_lookup")
+def look_up_styles(scale: float) -> Callable[[], Any]:
+    """Look up styles by name and get the style of each paragraph of a document."""
+    document = make_document(scaled(2000, scale))
+    styles = document.styles
+    lookup_count = scaled(5000, scale)
+
+    def look_up():
+        for i in range(lookup_count):
+            styles[STYLE_NAMES[i % 7]]
+        for paragraph in document.paragraphs:
+            paragraph.style
+
+    return look_up
+
+
+@case("sections")
+def iterate_sections(scale: float) -> Callable[[], Any]:
+    """Iterate the sections of a document, reading page layout and headers of each."""
+    document = make_document(scaled(2000, scale), section_count=scaled(500, scale))
+
+    def iterate():
+        for section in document.sections:
+            section.orientation
+            section.page_width
+            section.left_margin
+            section.header.is_linked_to_previous
+            section.footer.is_linked_to_previous
+
+    return iterate
+
+
+@case("add_comment")
+def build_comments(scale: float) -> Callable[[], Any]:
+    """Add a comment anchored to the runs of each paragraph of a document."""
+    document = make_document(scaled(500, scale))
+    paragraphs = document.paragraphs
+
+    def add_comments():
+        for i, paragraph in enumerate(paragraphs):
+            document.add_comment(paragraph.runs, "comment %d" % i, "Author", "AU")
+
+    return add_comments
+
+
+# -- runner ----------------------------------------------------------------------------
+
+
+def run_case(fn: Case, scale: float, repeat: int) -> Dict[str, float]:
+    """Return the best and mean seconds and the peak MB allocated running case `fn`."""
+    times: List[float] = []
+    for _ in range(repeat):
+        operation = fn(scale)
+        gc.collect()
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+
+    operation = fn(scale)
+    gc.collect()
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": min(times),
+        "mean_seconds": sum(times) / len(times),
+        "peak_mb": peak / 1e6,
+    }
+
+
+def commit() -> str | None:
+    """Return the abbreviated hash of the commit checked out, |None| outside a git repo."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """Print the ratio of each of `results` to `baseline`; return the names that regressed."""
+    regressed: List[str] = []
+    print("  %-20s %9s %9s %7s %9s" % ("vs. baseline", "was", "now", "ratio", "peak"))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        was = baseline[name]
+        ratio = result["seconds"] / was["seconds"] if was["seconds"] else float("inf")
+        peak_ratio = result["peak_mb"] / was["peak_mb"] if was["peak_mb"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressed.append(name)
+            flag = "  REGRESSED"
+        print(
+            "  %-20s %8.3fs %8.3fs %6.2fx %8.2fx%s"
+            % (name, was["seconds"], result["seconds"], ratio, peak_ratio, flag)
+        )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", metavar="case", help="cases to run, default all")
+    parser.add_argument("--scale", type=float, default=1.0, help="document size multiplier")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each case")
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare to results JSON at PATH")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio reported as regression"
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, fn in CASES.items():
+            print("  %-20s %s" % (name, (fn.__doc__ or "").strip()))
+        return
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error("unknown case(s): %s" % ", ".join(unknown))
+
+    results: Dict[str, Dict[str, float]] = {}
+    print("  %-20s %9s %9s %9s" % ("case", "best", "mean", "peak"))
+    for name in args.cases or CASES:
+        result = results[name] = run_case(CASES[name], args.scale, args.repeat)
+        print(
+            "  %-20s %8.3fs %8.3fs %6.1f MB"
+            % (name, result["seconds"], result["mean_seconds"], result["peak_mb"])
+        )
+
+    if args.json:
+        report = {
+            "meta": {
+                "commit": commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "scale": args.scale,
+                "repeat": args.repeat,
+                "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+            },
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["meta"]["scale"] != args.scale:
+            print("warning: baseline was run at scale %s" % baseline["meta"]["scale"])
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
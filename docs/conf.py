@@ -73,6 +73,8 @@ rst_epilog = """
 
 .. |BaseStyle| replace:: :class:`.BaseStyle`
 
+.. |BatchResult| replace:: :class:`.BatchResult`
+
 .. |BlockItemContainer| replace:: :class:`.BlockItemContainer`
 
 .. |_Body| replace:: :class:`._Body`
@@ -103,10 +105,14 @@ rst_epilog = """
 
 .. |DocumentPart| replace:: :class:`.DocumentPart`
 
+.. |DocumentStreamWriter| replace:: :class:`.DocumentStreamWriter`
+
 .. |docx| replace:: ``python-docx``
 
 .. |Emu| replace:: :class:`.Emu`
 
+.. |Event| replace:: :class:`.Event`
+
 .. |False| replace:: :class:`False`
 
 .. |float| replace:: :class:`.float`
@@ -141,6 +147,10 @@ rst_epilog = """
 
 .. |Length| replace:: :class:`.Length`
 
+.. |MemoryReport| replace:: :class:`.MemoryReport`
+
+.. |MergeTemplate| replace:: :class:`.MergeTemplate`
+
 .. |None| replace:: :class:`.None`
 
 .. |NumberingPart| replace:: :class:`.NumberingPart`
@@ -151,6 +161,8 @@ rst_epilog = """
 
 .. |Paragraph| replace:: :class:`.Paragraph`
 
+.. |ParagraphBlock| replace:: :class:`.ParagraphBlock`
+
 .. |ParagraphFormat| replace:: :class:`.ParagraphFormat`
 
 .. |_ParagraphStyle| replace:: :class:`.ParagraphStyle`
@@ -159,10 +171,14 @@ rst_epilog = """
 
 .. |Part| replace:: :class:`.Part`
 
+.. |PartMemory| replace:: :class:`.PartMemory`
+
 .. |Pt| replace:: :class:`.Pt`
 
 .. |_Relationship| replace:: :class:`._Relationship`
 
+.. |Recorder| replace:: :class:`.Recorder`
+
 .. |Relationships| replace:: :class:`._Relationships`
 
 .. |RenderedPageBreak| replace:: :class:`.RenderedPageBreak`
@@ -189,6 +205,8 @@ rst_epilog = """
 
 .. |Table| replace:: :class:`.Table`
 
+.. |TableBlock| replace:: :class:`.TableBlock`
+
 .. |_TableStyle| replace:: :class:`._TableStyle`
 
 .. |TabStop| replace:: :class:`.TabStop`
@@ -197,6 +215,8 @@ rst_epilog = """
 
 .. |_Text| replace:: :class:`._Text`
 
+.. |TimeoutError| replace:: :class:`TimeoutError`
+
 .. |True| replace:: :class:`True`
 
 .. |ValueError| replace:: :class:`ValueError`
@@ -10,6 +10,13 @@ Feature: Open a document
      Then document is a Document object
 
 
+  Scenario: Open a specified document lazily
+    Given I have python-docx installed
+     When I call docx.Document() with the path of a .docx file and lazy=True
+     Then document is a Document object
+      And the document image parts are not yet loaded
+
+
   Scenario: Open the default document
     Given I have python-docx installed
      When I call docx.Document() with no arguments
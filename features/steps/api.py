@@ -28,6 +28,11 @@ def when_I_call_docx_Document_with_the_path_of_a_docx_file(context):
     context.document = Document(test_docx("doc-default"))
 
 
+@when("I call docx.Document() with the path of a .docx file and lazy=True")
+def when_I_call_docx_Document_with_the_path_of_a_docx_file_and_lazy_True(context):
+    context.document = Document(test_docx("shp-inline-shape-access"), lazy=True)
+
+
 # then =====================================================
 
 
@@ -37,6 +42,14 @@ def then_document_is_a_Document_object(context):
     assert isinstance(document, docx.document.Document)
 
 
+@then("the document image parts are not yet loaded")
+def then_the_document_image_parts_are_not_yet_loaded(context):
+    image_parts = list(context.document.part.package.image_parts)
+    assert len(image_parts) > 0
+    for image_part in image_parts:
+        assert image_part._blob is None
+
+
 @then("the last paragraph contains the text I specified")
 def then_last_p_contains_specified_text(context):
     document = context.document
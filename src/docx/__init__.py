@@ -1,6 +1,7 @@
 """Initialize `docx` package.
 
-Export the `Document` constructor function and establish the mapping of part-type to
+Export the `Document` constructor function, its `open_async()` asyncio counterpart, and
+the `iter_blocks()` text-extraction function, and establish the mapping of part-type to
 the part-classe that implements that type.
 """
 
@@ -8,7 +9,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type
 
-from docx.api import Document
+from docx.api import Document, open_async
+from docx.extract import iter_blocks
 
 if TYPE_CHECKING:
     from docx.opc.part import Part
@@ -16,7 +18,7 @@ if TYPE_CHECKING:
 __version__ = "1.2.0"
 
 
-__all__ = ["Document"]
+__all__ = ["Document", "iter_blocks", "open_async"]
 
 
 # -- register custom Part classes with opc package reader --
@@ -5,32 +5,190 @@ Provides a syntactically more convenient API for interacting with the OpcPackage
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
 import os
-from typing import IO, TYPE_CHECKING, cast
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Tuple, cast
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.package import Package
+from docx.shared import is_async_readable, spool_from_async
 
 if TYPE_CHECKING:
+    import docx.types as t
     from docx.document import Document as DocumentObject
     from docx.parts.document import DocumentPart
 
 
-def Document(docx: str | IO[bytes] | None = None) -> DocumentObject:
+def Document(
+    docx: str | IO[bytes] | None = None,
+    lazy: bool = False,
+    workers: int | None = None,
+    cached: bool = False,
+) -> DocumentObject:
     """Return a |Document| object loaded from `docx`, where `docx` can be either a path
     to a ``.docx`` file (a string) or a file-like object.
 
     If `docx` is missing or ``None``, the built-in default document "template" is
-    loaded.
+    loaded. It is read from its file only once per process and held in
+    :data:`docx.api.template_cache`; each later call gets a fresh copy of it.
+
+    When `cached` is True and `docx` is a path, the file it names is treated the same
+    way, as a template used to create many documents. It is read again only when its
+    modification time or size has changed. `cached` has no effect when `docx` is a
+    file-like object.
+
+    When `lazy` is True, each part (image, header, styles, etc.) is read from the file
+    and parsed only when first used, so reading the body of a large document costs
+    about the size of its main document part. The file must remain open and unchanged
+    while the document is in use in that case. It is held open until
+    :meth:`.Document.close` is called, the document is used as a context manager and its
+    block ends, or the document is saved over it.
+
+    When `workers` is given, the parts of the package are decompressed concurrently by
+    a pool of that many threads rather than one after the other. This can shorten the
+    time taken to open a large document, especially one having many images, on a
+    machine with several cores. `workers` has no effect when `lazy` is True, and
+    neither has any effect when the document is created from a cached template.
     """
-    docx = _default_docx_path() if docx is None else docx
-    document_part = cast("DocumentPart", Package.open(docx).main_document_part)
+    if docx is None:
+        docx, cached = _default_docx_path(), True
+    if cached and isinstance(docx, str):
+        package = template_cache.package(docx)
+    elif workers is None:
+        package = Package.open(docx, lazy)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            package = Package.open(docx, lazy, executor)
+    document_part = cast("DocumentPart", package.main_document_part)
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
         tmpl = "file '%s' is not a Word file, content type is '%s'"
         raise ValueError(tmpl % (docx, document_part.content_type))
     return document_part.document
 
 
+async def open_async(
+    docx: str | IO[bytes] | t.AsyncReadable | None = None,
+    lazy: bool = False,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> DocumentObject:
+    """Return a |Document| object loaded from `docx` without blocking the event loop.
+
+    Same as :func:`Document`, but a coroutine for use in asyncio code. Reading the file,
+    decompressing its parts, and parsing their XML are done in `executor`, or the running
+    loop's default executor when `executor` is |None|. A thread pool is the only kind of
+    executor that makes sense here; the document has to come back to this process.
+
+    `docx` can also be an async binary stream, one whose `read()` method is a coroutine,
+    like `asyncio.StreamReader` or an upload in a web framework. It is read in chunks as
+    they arrive, into a buffer held in memory only up to a size limit and on disk beyond
+    that, so a large upload is not held in memory in full. When `lazy` is True, that
+    buffer is kept until the document is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    if not is_async_readable(docx):
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(Document, cast("str | IO[bytes] | None", docx), lazy, workers),
+        )
+    spool = await spool_from_async(cast("t.AsyncReadable", docx), executor)
+    try:
+        document = await loop.run_in_executor(
+            executor, functools.partial(Document, spool, lazy, workers)
+        )
+    except BaseException:
+        spool.close()
+        raise
+    if not lazy:
+        spool.close()
+    else:
+        # -- parts are still to be read from the spool, so keep it as long as the package --
+        weakref.finalize(document.part.package, spool.close)
+    return document
+
+
+class TemplateCache:
+    """Process-wide cache of the packages loaded from template files, keyed by path.
+
+    A template file is read and parsed once, then each request for it gets a copy of its
+    package, made with `OpcPackage.clone()`, which is much faster than reading and parsing
+    the file again. The XML of a part is only copied when that copy first uses it. A
+    cached package is reloaded when the modification time or size of its file changes.
+    When more than `maxsize` packages are cached, the least-recently used one is dropped.
+
+    Safe for use from multiple threads.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        # -- (file-stamp, package) pair for each path, least-recently used first --
+        self._packages: collections.OrderedDict[str, Tuple[Tuple[int, int], Package]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self):
+        return self._packages.__len__()
+
+    def clear(self):
+        """Remove all packages from this cache."""
+        with self._lock:
+            self._packages.clear()
+
+    @property
+    def maxsize(self) -> int:
+        """The number of packages this cache can hold.
+
+        Read/write. When reduced, least-recently used packages are dropped as necessary.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        with self._lock:
+            self._maxsize = value
+            self._trim()
+
+    def package(self, path: str) -> Package:
+        """Return a new copy of the package in the file at `path`.
+
+        The file is read and parsed only when its package is not already cached or the
+        file has changed since it was.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._packages.get(path)
+            if entry is not None and entry[0] == stamp:
+                self._packages.move_to_end(path)
+                return entry[1].clone(lazy=True)
+        # -- loaded outside the lock, so another thread may also load it; that's ok --
+        entry = (stamp, Package.open(path))
+        with self._lock:
+            self._packages[path] = entry
+            self._packages.move_to_end(path)
+            self._trim()
+            # -- cloning reads the cached package, but also builds state on it, like its part
+            # -- registry, on first use; the lock keeps two threads from doing that at once --
+            return entry[1].clone(lazy=True)
+
+    def _trim(self):
+        """Drop least-recently used packages until no more than `maxsize` remain."""
+        packages = self._packages
+        while len(packages) > max(self._maxsize, 0):
+            packages.popitem(last=False)
+
+
+#: The :class:`TemplateCache` used by :func:`docx.Document`.
+template_cache = TemplateCache()
+
+
 def _default_docx_path():
     """Return the path to the built-in default .docx package."""
     _thisdir = os.path.split(__file__)[0]
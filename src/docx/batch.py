@@ -0,0 +1,217 @@
+"""Batch processing of many documents in a pool of worker processes.
+
+Provides `map_documents()`, which opens each of many .docx files with `docx.Document()` in
+a worker process, calls a function on it, and generates a |BatchResult| for each file as
+soon as it is complete.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import pickle
+import signal
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sized
+
+import docx
+from docx.document import Document
+
+
+class BatchResult:
+    """Read-only record of the outcome of processing one file of a batch."""
+
+    def __init__(
+        self,
+        path: str,
+        value: Any = None,
+        error: BaseException | None = None,
+        traceback: str | None = None,
+    ):
+        self._path = path
+        self._value = value
+        self._error = error
+        self._traceback = traceback
+
+    def __repr__(self) -> str:
+        outcome = "value=%r" % (self._value,) if self.ok else "error=%r" % (self._error,)
+        return "BatchResult(%r, %s)" % (self._path, outcome)
+
+    @property
+    def error(self) -> BaseException | None:
+        """Exception raised while processing this file, |None| if processing succeeded.
+
+        This is |TimeoutError| when processing took longer than the batch timeout, and
+        `BrokenProcessPool` when the worker process processing it died.
+        """
+        return self._error
+
+    @property
+    def ok(self) -> bool:
+        """True if this file was processed without error."""
+        return self._error is None
+
+    @property
+    def path(self) -> str:
+        """Path of the file this result is for, as it was given to `map_documents()`."""
+        return self._path
+
+    @property
+    def traceback(self) -> str | None:
+        """Formatted traceback of :attr:`error`, |None| if processing succeeded."""
+        return self._traceback
+
+    @property
+    def value(self) -> Any:
+        """Value returned by the batch function for this file, |None| on error."""
+        return self._value
+
+
+def map_documents(
+    fn: Callable[[Document], Any],
+    paths: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = 1,
+    timeout: float | None = None,
+    max_in_flight: int | None = None,
+    progress: Callable[[int, int | None], None] | None = None,
+    lazy: bool = False,
+) -> Iterator[BatchResult]:
+    """Generate a |BatchResult| of calling `fn` on the document at each of `paths`.
+
+    Each document is opened with `docx.Document(path, lazy=lazy)` and passed to `fn` in one
+    of `workers` worker processes, by default one for each CPU. Results are generated in
+    the order files are completed, not the order of `paths`; each carries the path it is
+    for. `fn` must be picklable, a function defined at module level for example, and so
+    must the values it returns.
+
+    An exception raised opening or processing a file is captured in the result for that
+    file and processing continues with the next one. When a worker process dies, say
+    from running out of memory, each file it had been given fails with
+    `BrokenProcessPool` and a new pool is started for the remaining files.
+
+    `paths` is consumed lazily, so it can be a generator over a very large number of
+    files. Paths are sent to workers `chunksize` at a time; a larger `chunksize` costs
+    less interprocess communication when `fn` is quick. At most `max_in_flight` files,
+    by default two chunks per worker, are sent to workers before their results are
+    generated, which bounds the memory held in pending paths and results.
+
+    When `timeout` is not |None|, processing a file that takes longer than `timeout`
+    seconds is interrupted with |TimeoutError|. The timeout is raised by `SIGALRM` in the
+    worker, so it is not available on Windows, and it takes effect only between Python
+    bytecodes; a single long call into a C extension is not interrupted until it returns.
+
+    `progress`, when provided, is called in this process as `progress(completed, total)`
+    just before each result is generated, where `total` is the number of paths or |None|
+    when `paths` has no length.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1, got %d" % chunksize)
+    if timeout is not None and not hasattr(signal, "setitimer"):
+        raise ValueError("a timeout is not supported on this platform")
+    max_chunks = max(1, (max_in_flight or 2 * workers * chunksize) // chunksize)
+    total = len(paths) if isinstance(paths, Sized) else None
+    chunks = _iter_chunks(paths, chunksize)
+
+    completed = 0
+    executor = ProcessPoolExecutor(workers)
+    in_flight: Dict[Future[List[BatchResult]], List[str]] = {}
+    try:
+        while True:
+            while len(in_flight) < max_chunks:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                future = executor.submit(_process_chunk, fn, chunk, timeout, lazy)
+                in_flight[future] = chunk
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            pool_is_broken = False
+            for future in done:
+                chunk = in_flight.pop(future)
+                results = _chunk_results(future, chunk)
+                pool_is_broken = pool_is_broken or isinstance(results[0].error, BrokenProcessPool)
+                for result in results:
+                    completed += 1
+                    if progress is not None:
+                        progress(completed, total)
+                    yield result
+            if pool_is_broken:
+                # -- every chunk still in flight fails along with the pool, so those are
+                # -- reported on the next pass and the rest go to a new pool --
+                executor.shutdown(wait=True)
+                executor = ProcessPoolExecutor(workers)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _chunk_results(future: Future[List[BatchResult]], chunk: List[str]) -> List[BatchResult]:
+    """Results of processing `chunk`, one for each of its paths even if `future` failed.
+
+    `future` fails as a whole only when its worker process died or its results could not
+    be sent back from the worker.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+        return [BatchResult(path, error=e, traceback=tb) for path in chunk]
+
+
+def _iter_chunks(paths: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """Generate successive lists of at most `chunksize` paths from `paths`."""
+    paths = iter(paths)
+    while True:
+        chunk = list(itertools.islice(paths, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _picklable(error: BaseException) -> BaseException:
+    """`error`, or a |RuntimeError| describing it when `error` cannot be pickled.
+
+    An exception is sent back from a worker process by pickling it, and some, such as
+    those carrying an open file, cannot be.
+    """
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return RuntimeError("%s: %s" % (type(error).__name__, error))
+    return error
+
+
+def _process_chunk(
+    fn: Callable[[Document], Any], paths: List[str], timeout: float | None, lazy: bool
+) -> List[BatchResult]:
+    """Result of processing each of `paths` in turn; called in a worker process."""
+    return [_process_path(fn, path, timeout, lazy) for path in paths]
+
+
+def _process_path(
+    fn: Callable[[Document], Any], path: str, timeout: float | None, lazy: bool
+) -> BatchResult:
+    """Result of calling `fn` on the document at `path`, interrupted after `timeout` seconds."""
+    if timeout is not None:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        value = fn(docx.Document(path, lazy=lazy))
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except Exception as e:
+        return BatchResult(path, error=_picklable(e), traceback=traceback.format_exc())
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)  # pyright: ignore
+    return BatchResult(path, value)
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    """`SIGALRM` handler interrupting the file being processed."""
+    raise TimeoutError("processing took longer than the batch timeout")
@@ -8,11 +8,12 @@ specialized ones like structured document tags.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
 
 from typing_extensions import TypeAlias
 
 from docx.oxml.table import CT_Tbl
+from docx.oxml.text.extract import iter_block_text
 from docx.oxml.text.paragraph import CT_P
 from docx.shared import StoryChild
 from docx.text.paragraph import Paragraph
@@ -71,6 +72,24 @@ class BlockItemContainer(StoryChild):
         self._element._insert_tbl(tbl)  # pyright: ignore[reportPrivateUsage]
         return Table(tbl, self)
 
+    def add_table_from_rows(self, rows: Iterable[Sequence[str]], width: Length) -> Table:
+        """Return table of `width` having a row for each sequence of cell text in `rows`.
+
+        The table is appended at the end of the content in this container. It has as many
+        columns as the longest row, with `width` evenly distributed between them. Shorter
+        rows are padded with empty cells. The table XML is generated in a single batch,
+        which is much faster than filling the cells of a table from `add_table()` one at a
+        time.
+        """
+        from docx.table import Table
+
+        rows = list(rows)
+        cols = max((len(row) for row in rows), default=0)
+        tbl = CT_Tbl.new_tbl(0, cols, width)
+        tbl.add_trs(rows)
+        self._element._insert_tbl(tbl)  # pyright: ignore[reportPrivateUsage]
+        return Table(tbl, self)
+
     def iter_inner_content(self) -> Iterator[Paragraph | Table]:
         """Generate each `Paragraph` or `Table` in this container in document order."""
         from docx.table import Table
@@ -78,6 +97,19 @@ class BlockItemContainer(StoryChild):
         for element in self._element.inner_content_elements:
             yield (Paragraph(element, self) if isinstance(element, CT_P) else Table(element, self))
 
+    def iter_text(self) -> Iterator[str]:
+        """Generate the text of each paragraph in this container, in document order.
+
+        Paragraphs in tables are included, cell by cell from left to right and top to
+        bottom, visiting each `w:tc` element once. So a cell merged horizontally is
+        visited once, but a cell merged vertically is visited once per row it spans, since
+        its continuation in each row after the first has paragraphs of its own, usually
+        empty. Each string is the same as the `Paragraph.text` of that paragraph, but is
+        produced without constructing |Paragraph| or |Table| objects, which is much faster
+        for a long document.
+        """
+        return iter_block_text(self._element)
+
     @property
     def paragraphs(self):
         """A list containing the paragraphs in this container, in document order.
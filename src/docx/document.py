@@ -5,18 +5,38 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, List, Sequence
+import asyncio
+import copy
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    cast,
+)
+
+from lxml import etree
 
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.memory import memory_report
+from docx.opc.oxml import serialize_part_xml
+from docx.oxml.ns import qn
 from docx.section import Section, Sections
-from docx.shared import ElementProxy, Emu, Inches, Length
+from docx.shared import ElementProxy, Emu, Inches, Length, is_async_writable, write_async
 from docx.text.run import Run
 
 if TYPE_CHECKING:
     import docx.types as t
     from docx.comments import Comment, Comments
+    from docx.memory import MemoryReport
     from docx.oxml.document import CT_Body, CT_Document
     from docx.parts.document import DocumentPart
     from docx.settings import Settings
@@ -37,6 +57,13 @@ class Document(ElementProxy):
         self._element = element
         self._part = part
         self.__body = None
+        self._stream_writer: DocumentStreamWriter | None = None
+
+    def __enter__(self) -> Document:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
 
     def add_comment(
         self,
@@ -116,7 +143,9 @@ class Document(ElementProxy):
         carriage return (``\\r``) characters, each of which is converted to a line
         break.
         """
-        return self._body.add_paragraph(text, style)
+        paragraph = self._body.add_paragraph(text, style)
+        self._block_added()
+        return paragraph
 
     def add_picture(
         self,
@@ -155,8 +184,56 @@ class Document(ElementProxy):
         """
         table = self._body.add_table(rows, cols, self._block_width)
         table.style = style
+        self._block_added()
+        return table
+
+    def add_table_from_rows(
+        self, rows: Iterable[Sequence[str]], style: str | _TableStyle | None = None
+    ) -> Table:
+        """Add a table having a row for each sequence of cell text in `rows`.
+
+        The table has as many columns as the longest row and spans the page width. This is
+        the fast way to add a large data table; the rows are generated in a single batch
+        rather than cell by cell. `style` may be a table style object or a table style
+        name. If `style` is |None|, the table inherits the default table style of the
+        document.
+        """
+        table = self._body.add_table_from_rows(rows, self._block_width)
+        table.style = style
+        self._block_added()
         return table
 
+    def clone(self) -> Document:
+        """Return a copy of this document that can be changed independently of it.
+
+        The copy is made in memory, which is much faster than saving this document and
+        loading it again. The XML of each part is copied, while images and other binary
+        parts are shared, since they are never changed in place. A document loaded lazily
+        shares the file it was loaded from with its copy, so that file must remain open and
+        unchanged while either is in use.
+        """
+        self._raise_if_streamed("cloned")
+        package = self._part.package
+        assert package is not None
+        return cast("DocumentPart", package.clone().main_document_part).document
+
+    def close(self):
+        """Close the file this document was loaded from with `lazy=True`, if still open.
+
+        A document loaded lazily keeps its file open to read each part from it when first
+        used, until this is called or the document is saved over that file. Content not
+        read by then can no longer be read, so the document should not be used afterward.
+        A document is also a context manager that calls this on exit::
+
+            >>> with docx.Document("big.docx", lazy=True) as document:
+            ...     text = document.paragraphs[0].text
+
+        Has no effect on a document not loaded lazily, which keeps no file open.
+        """
+        package = self._part.package
+        assert package is not None
+        package.close()
+
     @property
     def comments(self) -> Comments:
         """A |Comments| object providing access to comments added to the document."""
@@ -181,6 +258,27 @@ class Document(ElementProxy):
         """Generate each `Paragraph` or `Table` in this document in document order."""
         return self._body.iter_inner_content()
 
+    def memory_report(self) -> MemoryReport:
+        """A |MemoryReport| of the memory held by each part of this document.
+
+        For each part, the report gives the size of the blob it holds, the number of nodes
+        in its parsed XML tree and an estimate of the memory that tree takes, and the number
+        of cached values and relationships it has::
+
+            >>> report = document.memory_report()
+            >>> for part in report.largest(3):
+            ...     print(part.partname, part.size, part.element_count)
+            /word/document.xml 48210334 482113
+            /word/media/image12.png 3194880 0
+            /word/styles.xml 1130290 11204
+
+        Nothing is loaded to make the report, so a part of a document opened with
+        `lazy=True` that has not been accessed is reported as holding nothing.
+        """
+        package = self._part.package
+        assert package is not None
+        return memory_report(package)
+
     @property
     def paragraphs(self) -> List[Paragraph]:
         """The |Paragraph| instances in the document, in document order.
@@ -195,13 +293,96 @@ class Document(ElementProxy):
         """The |DocumentPart| object of this document."""
         return self._part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def iter_save_chunks(
+        self, workers: int | None = None, compression: Mapping[str, int] | None = None
+    ) -> Generator[bytes, None, None]:
+        """Generate the bytes of this document, saved as a .docx file, a chunk at a time.
+
+        Same as :meth:`save`, but rather than being written to a file, each chunk of the
+        file is generated as soon as it is complete, generally once for each part of the
+        package. So the document can be sent, in an HTTP response or an object-store
+        multipart upload for example, without first saving the whole file somewhere::
+
+            >>> for chunk in document.iter_save_chunks():
+            ...     response.write(chunk)
+
+        `workers` and `compression` are as for :meth:`save`. The document must not be
+        changed until the last chunk is generated.
+        """
+        self._raise_if_streamed("saved")
+        return self._iter_save_chunks(workers, compression)
+
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        workers: int | None = None,
+        compression: Mapping[str, int] | None = None,
+    ):
         """Save this document to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. A file-like object need only have a `write()` method, so it can be
+        a stream that cannot seek, like a pipe or a socket.
+
+        When `workers` is given, the parts of the document are compressed concurrently
+        by a pool of that many threads rather than one after the other. This can shorten
+        the time taken to save a large document, especially one having many images, on
+        a machine with several cores. The saved file is the same either way.
+
+        `compression` maps a content type such as "image/png", or a lower-case partname
+        extension such as "bin", to `zipfile.ZIP_STORED` to store parts having it
+        uncompressed, or to a deflate level from 1 (fastest) to 9 (smallest). By default
+        JPEG, PNG, and GIF images, which are already compressed, are stored and all other
+        parts are deflated at zlib's default level.
+
+        Raises |ValueError| while the document is being saved by :meth:`stream_to`.
+        """
+        self._raise_if_streamed("saved")
+        if workers is None:
+            self._part.save(path_or_stream, compression=compression)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            self._part.save(path_or_stream, executor, compression)
+
+    async def save_async(
+        self,
+        path_or_stream: str | IO[bytes] | t.AsyncWritable,
+        workers: int | None = None,
+        compression: Mapping[str, int] | None = None,
+        executor: Executor | None = None,
+    ):
+        """Save this document to `path_or_stream` without blocking the event loop.
+
+        Same as :meth:`save`, but a coroutine for use in asyncio code. Serializing the
+        XML, compressing the parts, and writing the file are done in `executor`, or the
+        running loop's default executor when `executor` is |None|. The document must not
+        be changed until saving is complete.
+
+        `path_or_stream` can also be an async binary stream, one whose `write()` method
+        is a coroutine or that has a `drain()` coroutine, like `asyncio.StreamWriter`.
+        Each chunk of the file from :meth:`iter_save_chunks` is produced in `executor` and
+        then written to the stream, awaiting each write, so the whole file is never held in
+        memory.
         """
-        self._part.save(path_or_stream)
+        self._raise_if_streamed("saved")
+        loop = asyncio.get_running_loop()
+        if not is_async_writable(path_or_stream):
+            save = functools.partial(
+                self.save, cast("str | IO[bytes]", path_or_stream), workers, compression
+            )
+            await loop.run_in_executor(executor, save)
+            return
+        stream = cast("t.AsyncWritable", path_or_stream)
+        chunks = self.iter_save_chunks(workers, compression)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(executor, next, chunks, None)
+                if chunk is None:
+                    return
+                await write_async(stream, chunk)
+        finally:
+            # -- closing runs the generator's clean-up, like ending a save in progress --
+            await loop.run_in_executor(executor, chunks.close)
 
     @property
     def sections(self) -> Sections:
@@ -213,6 +394,29 @@ class Document(ElementProxy):
         """A |Settings| object providing access to the document-level settings."""
         return self._part.settings
 
+    def stream_to(
+        self, path_or_stream: str | IO[bytes], buffer_size: int = 100
+    ) -> DocumentStreamWriter:
+        """Start saving this document to `path_or_stream` while its body is still being added.
+
+        Returns a |DocumentStreamWriter|, normally used as a context manager; the document is
+        saved when it is closed. In the meantime, body content added with methods like
+        :meth:`add_paragraph` and :meth:`add_table` is written out in batches of
+        `buffer_size` blocks and removed from the document, so memory use stays bounded no
+        matter how long the document grows. The most recently added paragraph or table is
+        always kept, so it can still be filled in after it is added. Styles, numbering,
+        section properties, headers, footers and so on are written when the writer is
+        closed, so they can be changed at any point.
+
+        Body content written out this way no longer appears in `.paragraphs`, `.tables`,
+        `.sections`, etc. and changes to it are not saved. Until the writer is closed, the
+        document cannot be saved any other way or cloned; |ValueError| is raised.
+        """
+        if self._stream_writer is not None:
+            raise ValueError("document is already being streamed")
+        self._stream_writer = DocumentStreamWriter(self, path_or_stream, buffer_size)
+        return self._stream_writer
+
     @property
     def styles(self):
         """A |Styles| object providing access to the styles in this document."""
@@ -229,6 +433,21 @@ class Document(ElementProxy):
         """
         return self._body.tables
 
+    @property
+    def text(self) -> str:
+        """The text of the document body as a single string.
+
+        This is the text of each paragraph in the body, including those in tables, in
+        document order and separated by a newline ("\\n"). The text of headers, footers,
+        and comments is not included.
+        """
+        return "\n".join(self._body.iter_text())
+
+    def _block_added(self):
+        """Write out completed body content when this document is being streamed."""
+        if self._stream_writer is not None:
+            self._stream_writer.block_added()
+
     @property
     def _block_width(self) -> Length:
         """A |Length| object specifying the space between margins in last section."""
@@ -245,6 +464,125 @@ class Document(ElementProxy):
             self.__body = _Body(self._element.body, self)
         return self.__body
 
+    def _iter_save_chunks(
+        self, workers: int | None, compression: Mapping[str, int] | None
+    ) -> Generator[bytes, None, None]:
+        """Generate the bytes of this document, saved, as for :meth:`iter_save_chunks`."""
+        if workers is None:
+            yield from self._part.iter_save_chunks(compression=compression)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from self._part.iter_save_chunks(executor, compression)
+
+    def _raise_if_streamed(self, action: str):
+        """Raise |ValueError| when this document is being saved by :meth:`stream_to`.
+
+        Until its stream writer is closed, most of its body is not in the document and the
+        package file is still being written.
+        """
+        if self._stream_writer is not None:
+            raise ValueError("document is being streamed, it cannot be %s" % action)
+
+
+class DocumentStreamWriter:
+    """Saves a |Document| while its body content is still being generated.
+
+    Created by :meth:`Document.stream_to`, which describes its use. The main document part,
+    `word/document.xml`, is written first. Its body content is serialized and compressed
+    into the package as blocks are added, and removed from the document once written. The
+    rest of the package is written by :meth:`close`.
+    """
+
+    _BODY_MARKER = "body"
+
+    def __init__(self, document: Document, path_or_stream: str | IO[bytes], buffer_size: int):
+        self._document = document
+        self._document_elm = document._element
+        self._buffer_size = max(buffer_size, 1)
+        self._pending_count = 0
+        part = document.part
+        package = part.package
+        assert package is not None
+        self._package = package
+        self._writer = package.open_part_stream(path_or_stream, part.partname)
+        head, self._tail = self._document_xml_shell()
+        self._writer.write(head)
+
+    def __enter__(self) -> DocumentStreamWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object):
+        if exc_type is None:
+            self.close()
+        else:
+            self._document._stream_writer = None
+            self._writer.abort()
+
+    def block_added(self):
+        """Note a paragraph or table was added to the body; write out a batch when due."""
+        self._pending_count += 1
+        if self._pending_count > self._buffer_size:
+            self.flush()
+
+    def close(self):
+        """Write the remaining body content and the rest of the package, completing the save.
+
+        The body's section properties are written but also kept in the document.
+        """
+        self._write_blocks(self._body_blocks)
+        sectPr = self._document_elm.body.sectPr
+        if sectPr is not None:
+            self._write_blocks([copy.deepcopy(sectPr)])
+        self._writer.write(self._tail)
+        self._document._stream_writer = None
+        self._package.close_part_stream(self._writer)
+
+    def flush(self):
+        """Write out all body content except the most recently added block.
+
+        That block is kept because it may still be being filled in.
+        """
+        blocks = self._body_blocks
+        self._write_blocks(blocks[:-1])
+        self._pending_count = min(len(blocks), 1)
+
+    @property
+    def _body_blocks(self) -> list[etree._Element]:
+        """All child elements of the body except its section properties, in document order."""
+        return [e for e in self._document_elm.body if e.tag != qn("w:sectPr")]
+
+    def _document_xml_shell(self) -> tuple[bytes, bytes]:
+        """The serialized XML of document.xml before and after its body content.
+
+        This includes the XML declaration, the `w:document` element with all its namespace
+        declarations and attributes, and any other children it has, like a background.
+        """
+        document_elm = self._document_elm
+        shell = document_elm.makeelement(document_elm.tag, document_elm.attrib, document_elm.nsmap)
+        for child in document_elm:
+            if child is document_elm.body:
+                body = shell.makeelement(child.tag)
+                body.append(etree.Comment(self._BODY_MARKER))
+                shell.append(body)
+            else:
+                shell.append(copy.deepcopy(child))
+        head, tail = serialize_part_xml(shell).split(b"<!--%s-->" % self._BODY_MARKER.encode())
+        return head, tail
+
+    def _write_blocks(self, blocks: Sequence[etree._Element]):
+        """Serialize `blocks` into the streamed document.xml and remove them from the body.
+
+        The blocks are moved into a stand-in body element that declares all the namespaces of
+        the document so none are redeclared in the serialized blocks themselves.
+        """
+        if not blocks:
+            return
+        document_elm = self._document_elm
+        body = document_elm.makeelement(qn("w:body"), nsmap=document_elm.nsmap)
+        body.extend(blocks)
+        xml = etree.tostring(body, encoding="UTF-8", xml_declaration=False)
+        self._writer.write(xml[xml.index(b">") + 1 : xml.rindex(b"</")])
+
 
 class _Body(BlockItemContainer):
     """Proxy for `<w:body>` element in this document.
@@ -0,0 +1,212 @@
+"""Read-only, streaming access to the text content of a document.
+
+Provides `iter_blocks()`, which reads the main document part of a .docx file
+incrementally, without loading the package or building the whole XML tree of the
+document in memory.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any, Dict, Iterator, List, cast
+
+from lxml import etree
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PACKAGE_URI, PackURI
+from docx.opc.phys_pkg import PhysPkgReader
+from docx.opc.pkgreader import _SerializedRelationships  # pyright: ignore[reportPrivateUsage]
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.parser import parse_xml
+from docx.oxml.styles import CT_Styles
+from docx.oxml.text.extract import paragraph_text
+from docx.styles.styles import Styles
+
+_namespaces = {"w": nsmap["w"]}
+
+_pStyle_val = etree.XPath("./w:pPr/w:pStyle/@w:val", namespaces=_namespaces)
+_tblStyle_val = etree.XPath("./w:tblPr/w:tblStyle/@w:val", namespaces=_namespaces)
+
+# -- bytes of document.xml parsed between generating records of the blocks parsed so far --
+_CHUNK_SIZE = 64 * 1024
+
+_body = qn("w:body")
+_p = qn("w:p")
+_tbl = qn("w:tbl")
+_tc = qn("w:tc")
+_tr = qn("w:tr")
+
+
+class ParagraphBlock:
+    """Read-only record of a paragraph in the body of a document."""
+
+    def __init__(self, text: str, style: str | None):
+        self._text = text
+        self._style = style
+
+    @property
+    def style(self) -> str | None:
+        """UI name of the paragraph style applied to this paragraph.
+
+        This is the name of the default paragraph style when the paragraph has no
+        explicit style. |None| if the document defines no styles (not common).
+        """
+        return self._style
+
+    @property
+    def text(self) -> str:
+        """Text of this paragraph, the same as `Paragraph.text` for it."""
+        return self._text
+
+
+class TableBlock:
+    """Read-only record of a table in the body of a document."""
+
+    def __init__(self, rows: List[List[str]], style: str | None):
+        self._rows = rows
+        self._style = style
+
+    @property
+    def rows(self) -> List[List[str]]:
+        """Text of each `w:tc` element in each row of this table.
+
+        Each text is the same as `_Cell.text` for that cell. A merged cell appears once
+        per `w:tc` element, so rows can differ in length when cells are merged.
+        """
+        return self._rows
+
+    @property
+    def style(self) -> str | None:
+        """UI name of the table style applied to this table.
+
+        This is the name of the default table style when the table has no explicit style.
+        """
+        return self._style
+
+
+def iter_blocks(docx: str | IO[bytes]) -> Iterator[ParagraphBlock | TableBlock]:
+    """Generate a record of each paragraph and table in the body of the .docx file `docx`.
+
+    `docx` can be either a path to a .docx file (a string) or a file-like object. Blocks
+    are generated in document order. Only the top-level blocks of the main document story
+    are generated; like `Document.paragraphs` and `Document.tables`, this excludes
+    blocks in headers, footers, and content controls. The text of a cell is that of its
+    paragraphs only, as for `_Cell.text`, so the text of a table nested in a cell is
+    omitted.
+
+    The body is parsed incrementally and each block is discarded once its record is
+    generated, so memory use does not grow with the length of the document. Apart from
+    document.xml, only the styles part is read; the rest of the package, images and all, is
+    never loaded.
+    """
+    phys_reader = PhysPkgReader(docx)
+    try:
+        document_partname = _partname_related_by(phys_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT)
+        if document_partname is None:
+            raise ValueError("file '%s' is not a Word file, it has no main document" % docx)
+        style_names = _StyleNames(phys_reader, document_partname)
+        with phys_reader.open(document_partname) as stream:
+            yield from _iter_body_blocks(stream, style_names)
+    finally:
+        phys_reader.close()
+
+
+def _iter_body_blocks(
+    stream: IO[bytes], style_names: _StyleNames
+) -> Iterator[ParagraphBlock | TableBlock]:
+    """Generate a record of each `w:p` and `w:tbl` child of `w:body` in document.xml `stream`.
+
+    `stream` is fed to the parser a chunk at a time. After each chunk, every child of the
+    body but the last, which may still be incomplete, is made into a record and removed
+    from the tree. Elements are parsed as plain lxml elements rather than with their
+    custom element classes, and the parser reports no event per element, so the tree is
+    built at the same speed as by `parse_xml()`. The text of a record is extracted by
+    `paragraph_text()`, the same function `CT_P.text` uses.
+    """
+    parser = etree.XMLPullParser(
+        events=("start",), tag=_body, remove_blank_text=True, resolve_entities=False
+    )
+    body = None
+    while True:
+        chunk = stream.read(_CHUNK_SIZE)
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+        if body is None:
+            for _, element in parser.read_events():
+                body = element
+        if body is not None:
+            complete_count = len(body) if not chunk else max(len(body) - 1, 0)
+            for element in body[:complete_count]:
+                if element.tag == _p:
+                    yield _paragraph_block(element, style_names)
+                elif element.tag == _tbl:
+                    yield _table_block(element, style_names)
+            del body[:complete_count]
+        if not chunk:
+            return
+
+
+def _paragraph_block(
+    p: etree._Element,  # pyright: ignore[reportPrivateUsage]
+    style_names: _StyleNames,
+) -> ParagraphBlock:
+    """Record of plain `w:p` element `p`."""
+    return ParagraphBlock(paragraph_text(p), style_names.paragraph_style(_first(_pStyle_val(p))))
+
+
+def _table_block(
+    tbl: etree._Element,  # pyright: ignore[reportPrivateUsage]
+    style_names: _StyleNames,
+) -> TableBlock:
+    """Record of plain `w:tbl` element `tbl`."""
+    rows = [
+        ["\n".join(paragraph_text(p) for p in tc.iterchildren(_p)) for tc in tr.iterchildren(_tc)]
+        for tr in tbl.iterchildren(_tr)
+    ]
+    return TableBlock(rows, style_names.table_style(_first(_tblStyle_val(tbl))))
+
+
+def _first(values: Any) -> str | None:
+    """First item of the XPath result `values`, or |None| when it is empty."""
+    return cast(List[str], values)[0] if values else None
+
+
+def _partname_related_by(
+    phys_reader: PhysPkgReader, source_uri: PackURI, reltype: str
+) -> PackURI | None:
+    """Partname of the part related to `source_uri` by `reltype`, or |None| if not found."""
+    rels_xml = phys_reader.rels_xml_for(source_uri)  # pyright: ignore
+    srels = _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
+    for srel in srels:
+        if srel.reltype == reltype and not srel.is_external:
+            return cast(PackURI, srel.target_partname)
+    return None
+
+
+class _StyleNames:
+    """Maps style-ids to style names using the styles part of the package, if present."""
+
+    def __init__(self, phys_reader: PhysPkgReader, document_partname: PackURI):
+        styles_partname = _partname_related_by(phys_reader, document_partname, RT.STYLES)
+        self._styles = None
+        if styles_partname is not None:
+            styles_xml = phys_reader.blob_for(styles_partname)  # pyright: ignore
+            self._styles = Styles(cast(CT_Styles, parse_xml(styles_xml)))
+        self._names: Dict[tuple[str | None, WD_STYLE_TYPE], str | None] = {}
+
+    def paragraph_style(self, style_id: str | None) -> str | None:
+        """Name of paragraph style `style_id`, the default paragraph style when not found."""
+        return self._name(style_id, WD_STYLE_TYPE.PARAGRAPH)
+
+    def table_style(self, style_id: str | None) -> str | None:
+        """Name of table style `style_id`, the default table style when not found."""
+        return self._name(style_id, WD_STYLE_TYPE.TABLE)
+
+    def _name(self, style_id: str | None, style_type: WD_STYLE_TYPE) -> str | None:
+        key = (style_id, style_type)
+        if key not in self._names:
+            style = None if self._styles is None else self._styles.get_by_id(style_id, style_type)
+            self._names[key] = None if style is None else style.name
+        return self._names[key]
@@ -0,0 +1,204 @@
+"""Instrumentation of the phases of opening and saving a document.
+
+An observer is a callable taking an |Event|. While at least one observer is registered,
+each phase of reading and writing a package is timed, and each observer is called with an
+|Event| describing the phase as it ends::
+
+    >>> from docx import instrumentation
+    >>> recorder = instrumentation.Recorder()
+    >>> with instrumentation.observe(recorder):
+    ...     document = docx.Document("slow.docx")
+    ...     document.save("slow-copy.docx")
+    >>> recorder.totals()
+    {'inflate': 0.081, 'parse': 0.412, 'construct': 0.437, ...}
+
+When no observer is registered, the only cost is one check of whether there is one at
+each instrumented step.
+
+The phases are these. Each phase marked "per part" has an event for each part, giving its
+partname; the others have a single event for the whole package.
+
+* `read_package` -- reading the package and walking its relationship graph, including
+  inflating each part read
+* `inflate` (per part) -- reading a member from the zip archive and decompressing it
+* `unmarshal` -- constructing the parts and their relationships and calling
+  `after_unmarshal()` on each
+* `construct` (per part) -- constructing a part with `PartFactory`, including parsing it
+* `parse` (per part) -- parsing the XML of a part, when it is loaded or, for a lazily
+  loaded part, first accessed
+* `after_unmarshal` (per part) -- the `after_unmarshal()` step of a part
+* `write_package` -- writing the whole package, including serializing and deflating
+* `serialize` (per part) -- serializing the XML of a part with `serialize_part_xml()`
+* `deflate` (per part) -- compressing a part blob and writing it to the zip archive;
+  there is none for an XML part whose XML is unchanged since it was last saved, which
+  is written in the compressed form kept from then
+
+Phases nest, so, for example, the time of a `parse` event is also counted in the
+`construct` event of the same part. `inflate` and `deflate` events are emitted in the
+worker thread doing the work when a document is opened or saved with `workers`, so an
+observer must then be thread-safe.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import Callable, Dict, Iterator, List
+
+Observer = Callable[["Event"], None]
+
+# -- replaced rather than changed when an observer is added or removed, so emitting an event
+# -- in one thread is not disturbed by registering an observer in another --
+observers: List[Observer] = []
+
+_lock = threading.Lock()
+
+
+class Event:
+    """Read-only record of one timed phase of opening or saving a package."""
+
+    def __init__(
+        self,
+        phase: str,
+        start: float,
+        seconds: float,
+        partname: str | None = None,
+        content_type: str | None = None,
+        bytes_in: int | None = None,
+        bytes_out: int | None = None,
+        element_count: int | None = None,
+    ):
+        self._phase = phase
+        self._start = start
+        self._seconds = seconds
+        self._partname = partname
+        self._content_type = content_type
+        self._bytes_in = bytes_in
+        self._bytes_out = bytes_out
+        self._element_count = element_count
+
+    def __repr__(self) -> str:
+        partname = "" if self._partname is None else " %s" % self._partname
+        return "<Event %s%s %.6fs>" % (self._phase, partname, self._seconds)
+
+    @property
+    def bytes_in(self) -> int | None:
+        """Size of the data this phase started from, like the compressed size of a member
+        for `inflate`, or |None| when it does not apply."""
+        return self._bytes_in
+
+    @property
+    def bytes_out(self) -> int | None:
+        """Size of the data this phase produced, like the serialized XML for `serialize`,
+        or |None| when it does not apply."""
+        return self._bytes_out
+
+    @property
+    def content_type(self) -> str | None:
+        """Content type of the part this event is for, |None| when not known."""
+        return self._content_type
+
+    @property
+    def element_count(self) -> int | None:
+        """Number of nodes in the XML tree parsed or serialized, |None| for other phases."""
+        return self._element_count
+
+    @property
+    def partname(self) -> str | None:
+        """Partname of the part this event is for, like "/word/document.xml".
+
+        |None| for an event for the whole package.
+        """
+        return self._partname
+
+    @property
+    def phase(self) -> str:
+        """Name of the phase this event is for, like "parse"."""
+        return self._phase
+
+    @property
+    def seconds(self) -> float:
+        """Wall-clock seconds the phase took."""
+        return self._seconds
+
+    @property
+    def start(self) -> float:
+        """Time the phase started, as returned by `time.perf_counter()`."""
+        return self._start
+
+
+class Recorder:
+    """Observer keeping each event it is called with, for inspection afterward."""
+
+    def __init__(self):
+        self._events: List[Event] = []
+
+    def __call__(self, event: Event) -> None:
+        self._events.append(event)
+
+    @property
+    def events(self) -> List[Event]:
+        """The events recorded so far, in the order they ended."""
+        return list(self._events)
+
+    def totals(self) -> Dict[str, float]:
+        """Total seconds of the events recorded for each phase, keyed by phase name."""
+        totals: Dict[str, float] = {}
+        for event in self._events:
+            totals[event.phase] = totals.get(event.phase, 0.0) + event.seconds
+        return totals
+
+
+def add_observer(observer: Observer) -> None:
+    """Register `observer` to be called with each |Event| from now on."""
+    global observers
+    with _lock:
+        observers = observers + [observer]
+
+
+def emit(
+    phase: str,
+    start: float,
+    partname: str | None = None,
+    content_type: str | None = None,
+    bytes_in: int | None = None,
+    bytes_out: int | None = None,
+    element_count: int | None = None,
+) -> None:
+    """Call each registered observer with an |Event| for `phase`, started at `start`.
+
+    The phase ends now. Callers check that there is an observer before timing a phase, so
+    this is called only when there is.
+    """
+    event = Event(
+        phase,
+        start,
+        time.perf_counter() - start,
+        partname,
+        content_type,
+        bytes_in,
+        bytes_out,
+        element_count,
+    )
+    for observer in observers:
+        observer(event)
+
+
+@contextlib.contextmanager
+def observe(observer: Observer) -> Iterator[Observer]:
+    """Context manager registering `observer` for the duration of the `with` block."""
+    add_observer(observer)
+    try:
+        yield observer
+    finally:
+        remove_observer(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Stop calling `observer`. Raises |ValueError| when it is not registered."""
+    global observers
+    with _lock:
+        remaining = list(observers)
+        remaining.remove(observer)
+        observers = remaining
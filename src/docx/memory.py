@@ -0,0 +1,206 @@
+"""Report of the memory held by each part of a loaded document.
+
+Provides `memory_report()`, which describes, for each part of a package, the blob and the
+XML tree it holds in memory, so the parts responsible for a large memory footprint can be
+found. Nothing is read or parsed to make the report; a lazily-loaded part not yet accessed
+is reported as holding nothing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+from docx.opc.part import _cached_attr_names  # pyright: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from lxml import etree
+
+    from docx.opc.package import OpcPackage
+    from docx.opc.part import Part
+
+# -- approximate bytes libxml2 allocates on a 64-bit platform for each element or other
+# -- node, for each text node, and for each attribute (including its value node), apart
+# -- from the characters of text and attribute values --
+_NODE_SIZE = 120
+_TEXT_NODE_SIZE = 120
+_ATTRIBUTE_SIZE = 240
+
+
+class PartMemory:
+    """Read-only record of the memory held by one part of a package."""
+
+    def __init__(
+        self,
+        partname: str,
+        content_type: str,
+        loaded: bool,
+        blob_size: int,
+        element_count: int,
+        tree_size: int,
+        cached_count: int,
+        rel_count: int,
+    ):
+        self._partname = partname
+        self._content_type = content_type
+        self._loaded = loaded
+        self._blob_size = blob_size
+        self._element_count = element_count
+        self._tree_size = tree_size
+        self._cached_count = cached_count
+        self._rel_count = rel_count
+
+    def __repr__(self) -> str:
+        return "<PartMemory %s %d bytes>" % (self._partname, self.size)
+
+    @property
+    def blob_size(self) -> int:
+        """Size in bytes of the blob this part holds in memory.
+
+        For an XML part, which holds its XML tree instead, the size of the serialized and
+        compressed XML it keeps from when it was last saved, if any. Zero for a
+        lazily-loaded part whose blob has not yet been read.
+        """
+        return self._blob_size
+
+    @property
+    def cached_count(self) -> int:
+        """Number of values this part has computed once and kept, like its styles."""
+        return self._cached_count
+
+    @property
+    def content_type(self) -> str:
+        """Content type of this part."""
+        return self._content_type
+
+    @property
+    def element_count(self) -> int:
+        """Number of nodes in the parsed XML tree of this part, zero when there is none."""
+        return self._element_count
+
+    @property
+    def loaded(self) -> bool:
+        """True when the content of this part, its blob or XML tree, is in memory."""
+        return self._loaded
+
+    @property
+    def partname(self) -> str:
+        """Partname of this part, like "/word/document.xml"."""
+        return self._partname
+
+    @property
+    def rel_count(self) -> int:
+        """Number of relationships from this part to other parts and external targets."""
+        return self._rel_count
+
+    @property
+    def size(self) -> int:
+        """Estimated total bytes held by this part, its blob plus its XML tree."""
+        return self._blob_size + self._tree_size
+
+    @property
+    def tree_size(self) -> int:
+        """Estimated bytes held by `lxml` for the parsed XML tree of this part.
+
+        The estimate is of the memory allocated by libxml2 for the nodes, attributes, and
+        text of the tree; it does not include the Python objects `lxml` creates for
+        elements accessed from Python, which are usually far fewer.
+        """
+        return self._tree_size
+
+
+class MemoryReport:
+    """Sequence of |PartMemory| records, one for each part of a package."""
+
+    def __init__(self, parts: List[PartMemory]):
+        self._parts = parts
+
+    def __getitem__(self, idx: int) -> PartMemory:
+        return self._parts[idx]
+
+    def __iter__(self) -> Iterator[PartMemory]:
+        return iter(self._parts)
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def by_content_type(self) -> Dict[str, int]:
+        """Estimated total bytes held by the parts of each content type."""
+        sizes: Dict[str, int] = {}
+        for part in self._parts:
+            sizes[part.content_type] = sizes.get(part.content_type, 0) + part.size
+        return sizes
+
+    def largest(self, count: int = 10) -> List[PartMemory]:
+        """The `count` parts holding the most memory, largest first."""
+        return sorted(self._parts, key=lambda part: part.size, reverse=True)[:count]
+
+    @property
+    def total_element_count(self) -> int:
+        """Number of nodes in the parsed XML trees of all parts."""
+        return sum(part.element_count for part in self._parts)
+
+    @property
+    def total_size(self) -> int:
+        """Estimated total bytes held by all parts."""
+        return sum(part.size for part in self._parts)
+
+
+def memory_report(package: OpcPackage) -> MemoryReport:
+    """Return a |MemoryReport| of the memory held by each part of `package`.
+
+    The XML tree of each parsed part is traversed to count its nodes, which takes time
+    roughly proportional to the size of the document, but nothing is read, parsed, or
+    serialized.
+    """
+    return MemoryReport([_part_memory(part) for part in package.iter_parts()])
+
+
+def _part_memory(part: Part) -> PartMemory:
+    """Return the |PartMemory| record of `part`, without loading anything it has not."""
+    # -- read the instance dict directly, since accessing the blob or element of a
+    # -- lazily-loaded part would load it --
+    part_dict = part.__dict__
+    blob = part_dict.get("_blob")
+    element = part_dict.get("_element")
+    deflated = part_dict.get("_deflated")
+    blob_size = 0 if blob is None else len(blob)
+    if deflated is not None:
+        blob_size += len(deflated[0]) + len(deflated[3])
+    element_count, tree_size = (0, 0) if element is None else _tree_memory(element)
+    rels = part_dict.get("rels")
+    cached_count = sum(
+        1
+        for name in _cached_attr_names(type(part))
+        if name in part_dict and name not in ("rels", "_rels")
+    )
+    return PartMemory(
+        str(part.partname),
+        part.content_type,
+        loaded=blob is not None or element is not None,
+        blob_size=blob_size,
+        element_count=element_count,
+        tree_size=tree_size,
+        cached_count=cached_count,
+        rel_count=0 if rels is None else len(rels),
+    )
+
+
+def _tree_memory(element: etree._Element) -> tuple[int, int]:
+    """Return `(node_count, estimated_bytes)` for the XML tree rooted at `element`."""
+    node_count = text_node_count = attribute_count = char_count = 0
+    for node in element.iter():
+        node_count += 1
+        for value in node.values():
+            attribute_count += 1
+            char_count += len(value)
+        for text in (node.text, node.tail):
+            if text:
+                text_node_count += 1
+                char_count += len(text)
+    estimate = (
+        node_count * _NODE_SIZE
+        + text_node_count * _TEXT_NODE_SIZE
+        + attribute_count * _ATTRIBUTE_SIZE
+        + char_count
+    )
+    return node_count, estimate
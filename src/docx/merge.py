@@ -0,0 +1,264 @@
+"""Mail merge of many records into one template.
+
+Provides |MergeTemplate|, which opens a .docx template once and indexes where each
+placeholder field, like "{{name}}", occurs in it. A document is then rendered for each
+record by substituting the values of the record into the serialized XML of only the parts
+having placeholders; every other part of the template is written to each document exactly
+as it was compressed when the template was indexed::
+
+    >>> from docx.merge import MergeTemplate
+    >>> template = MergeTemplate("letter-template.docx")
+    >>> template.fields
+    ['name', 'street', 'city', 'balance']
+    >>> for i, record in enumerate(records):
+    ...     template.save(record, "letter-%05d.docx" % i)
+
+No XML is parsed or serialized to render a document, so rendering one costs little more
+than compressing the parts having placeholders.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Set, Tuple
+from zipfile import ZipInfo
+
+import docx
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.opc.phys_pkg import PhysPkgReader, PhysPkgWriter
+from docx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    from docx.document import Document
+    from docx.oxml.xmlchemy import BaseOxmlElement
+
+#: Placeholder pattern used when none is given, matching a field name between double
+#: braces like "{{name}}" or "{{ name }}". The first group of a pattern is the field name.
+DEFAULT_PATTERN = r"\{\{\s*(\w+)\s*\}\}"
+
+# -- a field name and the namespace prefix of the `w:t` element its placeholder is in --
+_Field = Tuple[str, str]
+
+# -- content types of the parts searched for placeholders, those holding story text --
+_STORY_CONTENT_TYPES = frozenset(
+    (CT.WML_COMMENTS, CT.WML_DOCUMENT_MAIN, CT.WML_FOOTER, CT.WML_HEADER)
+)
+
+# -- each placeholder is replaced by one of these markers, the index of its field between
+# -- two private-use characters, to find it in the serialized XML --
+_MARKER = "\ue000%d\ue001"
+_MARKER_RE = re.compile("\ue000(\\d+)\ue001".encode("utf-8"))
+
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+class MergeTemplate:
+    """A .docx template indexed for rendering a document from each of many records.
+
+    `template` is a path to a .docx file or a file-like object containing one. A
+    placeholder is text matching `pattern`, a regular expression whose first group is the
+    field name; see `DEFAULT_PATTERN`. Placeholders are found in the paragraphs of the
+    document body, including those in tables and text boxes, and of headers, footers,
+    and comments, even where the text of a placeholder is split across runs, as Word
+    often does. A placeholder is replaced by the value of its field, formatted like the
+    first character of the placeholder.
+
+    Raises |ValueError| in the unlikely case `template` already has text in the form of
+    the markers, made of Unicode private-use characters, that placeholders are replaced
+    with while indexing.
+    """
+
+    def __init__(self, template: str | IO[bytes], pattern: str | re.Pattern[str] = DEFAULT_PATTERN):
+        document = docx.Document(template)
+        pattern = re.compile(pattern)
+        fields: List[_Field] = []
+        marked_membernames: Set[str] = set()
+        package = document.part.package
+        assert package is not None
+        for part in package.iter_parts():
+            if not isinstance(part, XmlPart) or part.content_type not in _STORY_CONTENT_TYPES:
+                continue
+            if _mark_placeholders(part.element, pattern, fields):
+                marked_membernames.add(part.partname.membername)
+        self._fields = fields
+        self._members = _index_members(document, marked_membernames, len(fields))
+
+    @property
+    def fields(self) -> List[str]:
+        """Name of each field having a placeholder, in the order first found."""
+        return list(dict.fromkeys(name for name, _ in self._fields))
+
+    def iter_render(self, records: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+        """Generate the bytes of the .docx file rendered from each of `records`."""
+        for record in records:
+            yield self.render(record)
+
+    def render(self, record: Mapping[str, Any]) -> bytes:
+        """Return the bytes of the .docx file rendered from `record`.
+
+        `record` maps the name of each field to its value. A value is converted to text
+        with `str()`, apart from |None|, which is rendered as no text. A newline, carriage
+        return, or tab in the text is rendered as a line break or tab, a carriage return
+        followed by a newline as a single line break. Raises |KeyError| when `record` has no
+        value for a field, and |ValueError| when the text of a value has a character that
+        cannot appear in XML, like a NUL.
+        """
+        stream = io.BytesIO()
+        self.save(record, stream)
+        return stream.getvalue()
+
+    def save(self, record: Mapping[str, Any], file: str | IO[bytes]) -> None:
+        """Save the document rendered from `record` to `file`, a path or writable stream.
+
+        See :meth:`render` for how `record` is rendered.
+        """
+        xml_texts: Dict[_Field, bytes] = {}
+        for field in self._fields:
+            if field not in xml_texts:
+                xml_texts[field] = _xml_text(record[field[0]], field[1])
+        texts = [xml_texts[field] for field in self._fields]
+
+        phys_writer = PhysPkgWriter(file)
+        for pack_uri, member in self._members:
+            if isinstance(member, _PartXml):
+                phys_writer.write(pack_uri, member.render(texts))
+                continue
+            zip_info, compressed_blob = member
+            phys_writer.write_compressed(pack_uri, zip_info, compressed_blob)
+        phys_writer.close()
+
+
+class _PartXml:
+    """Serialized XML of a part having placeholders, split at each placeholder.
+
+    `literals` is the XML before, between, and after the placeholders, and `field_idxs` is
+    the index of the field of each placeholder in `MergeTemplate._fields`.
+    """
+
+    def __init__(self, literals: List[bytes], field_idxs: List[int]):
+        self._literals = literals
+        self._field_idxs = field_idxs
+
+    @property
+    def placeholder_count(self) -> int:
+        """Number of placeholders in this part."""
+        return len(self._field_idxs)
+
+    def render(self, texts: List[bytes]) -> bytes:
+        """Return this XML with the item of `texts` for its field put for each placeholder."""
+        literals = self._literals
+        chunks = [literals[0]]
+        for field_idx, literal in zip(self._field_idxs, literals[1:]):
+            chunks.append(texts[field_idx])
+            chunks.append(literal)
+        return b"".join(chunks)
+
+
+def _index_members(
+    document: Document, marked_membernames: Set[str], field_count: int
+) -> List[Tuple[PackURI, Tuple[ZipInfo, bytes] | _PartXml]]:
+    """Return a `(pack_uri, member)` pair for each member of the package of `document`.
+
+    For a member having no placeholders, `member` is its `(zip_info, compressed_blob)`
+    pair when `document` is saved, to be written as-is. For one having placeholders, it
+    is the |_PartXml| of the part.
+    """
+    stream = io.BytesIO()
+    document.save(stream)
+    phys_reader = PhysPkgReader(stream)
+    members: List[Tuple[PackURI, Tuple[ZipInfo, bytes] | _PartXml]] = []
+    marker_count = 0
+    for membername, _, _ in phys_reader.iter_members():
+        pack_uri = PackURI("/%s" % membername)
+        if membername not in marked_membernames:
+            members.append((pack_uri, phys_reader.compressed_blob_for(pack_uri)))
+            continue
+        pieces: List[bytes] = _MARKER_RE.split(phys_reader.blob_for(pack_uri))
+        part_xml = _PartXml(pieces[::2], [int(field_idx) for field_idx in pieces[1::2]])
+        members.append((pack_uri, part_xml))
+        marker_count += part_xml.placeholder_count
+    phys_reader.close()
+    if marker_count != field_count:
+        raise ValueError("template has characters reserved for marking placeholders")
+    return members
+
+
+def _mark_placeholders(
+    root: BaseOxmlElement, pattern: re.Pattern[str], fields: List[_Field]
+) -> bool:
+    """Replace each placeholder in the paragraphs under `root` with a marker.
+
+    The field of each placeholder is appended to `fields`, and its marker holds the index
+    of that field. Returns True when any placeholder is found.
+    """
+    found = False
+    for p in root.iter(qn("w:p")):
+        # -- the text of a paragraph nested in this one, like one in a text box, is not
+        # -- part of the text of this one --
+        ts = [t for t in p.iter(qn("w:t")) if next(t.iterancestors(qn("w:p"))) is p]
+        texts = [t.text or "" for t in ts]
+        text = "".join(texts)
+        matches = list(pattern.finditer(text))
+        if not matches:
+            continue
+        found = True
+        # -- each placeholder goes in the `w:t` its first character is in, as a marker; the
+        # -- rest of its text is removed from that and any following `w:t` it extends into --
+        markers: Dict[int, str] = {}
+        for match in matches:
+            markers[match.start()] = _MARKER % len(fields)
+            fields.append((match.group(1), ts[_text_idx(texts, match.start())].prefix or ""))
+        pos = 0
+        for t, t_text in zip(ts, texts):
+            end = pos + len(t_text)
+            pieces: List[str] = []
+            cursor = pos
+            for match in matches:
+                start, stop = match.span()
+                if stop <= pos or start >= end:
+                    continue
+                if start >= pos:
+                    pieces.append(text[cursor:start])
+                    pieces.append(markers[start])
+                cursor = min(stop, end)
+            pieces.append(text[cursor:end])
+            new_text = "".join(pieces)
+            if new_text != t_text:
+                t.text = new_text
+                t.set(_XML_SPACE, "preserve")
+            pos = end
+    return found
+
+
+def _text_idx(texts: List[str], offset: int) -> int:
+    """Index of the item of `texts` having the character at `offset` of their join."""
+    for idx, text in enumerate(texts):
+        if offset < len(text):
+            return idx
+        offset -= len(text)
+    raise IndexError("offset %d is past the end of the text" % offset)
+
+
+def _xml_text(value: Any, prefix: str) -> bytes:
+    """Return `value` as serialized XML to substitute for a marker in a `w:t` element.
+
+    A newline or tab ends the `w:t` element and adds a `w:br` or `w:tab` element to its
+    run before a new `w:t` element; `prefix` is the namespace prefix of those elements. A
+    carriage return, alone or followed by a newline, is taken as a newline.
+    """
+    text = "" if value is None else str(value)
+    if _INVALID_XML_CHARS.search(text):
+        raise ValueError("value %r has a character that cannot appear in XML" % text)
+    text = text.translate(_XML_ESCAPES).replace("\r\n", "\n").replace("\r", "\n")
+    if "\n" in text or "\t" in text:
+        w = "%s:" % prefix if prefix else ""
+        reopen = '<%st xml:space="preserve">' % w
+        text = text.replace("\n", "</%st><%sbr/>%s" % (w, w, reopen)).replace(
+            "\t", "</%st><%stab/>%s" % (w, w, reopen)
+        )
+    return text.encode("utf-8")
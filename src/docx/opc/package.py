@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterator, cast
+import itertools
+import time
+from typing import IO, TYPE_CHECKING, Iterator, Mapping, cast
 
+from docx import instrumentation
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import PartFactory
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
-from docx.opc.pkgwriter import PackageWriter
+from docx.opc.pkgwriter import PackageWriter, StreamingPackageWriter
 from docx.opc.rel import Relationships
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from typing_extensions import Self
 
     from docx.opc.coreprops import CoreProperties
     from docx.opc.part import Part
     from docx.opc.rel import _Relationship  # pyright: ignore[reportPrivateUsage]
+    from docx.package import Package
 
 
 class OpcPackage:
@@ -28,6 +34,11 @@ class OpcPackage:
     to a package file or file-like object containing one.
     """
 
+    def __init__(self):
+        self.__part_registry: _PartRegistry | None = None
+        # -- reader of the package file parts still read from, when loaded lazily --
+        self._pkg_reader: PackageReader | None = None
+
     def after_unmarshal(self):
         """Entry point for any post-unmarshaling processing.
 
@@ -37,6 +48,50 @@ class OpcPackage:
         # subclass
         pass
 
+    def clone(self, lazy: bool = False) -> Self:
+        """Return a copy of this package that can be changed independently of it.
+
+        Each part is copied with `Part.clone()`, so the copy has its own copy of each XML
+        tree while binary blobs are shared, and each relationship is recreated with the
+        same rId. This is much faster than saving the package and loading it again.
+
+        When `lazy` is True, the XML tree of a part is copied only when first accessed in
+        the copy, so XML that is never used, like that of most parts of a new document, is
+        never copied. This package must not be changed afterward in that case.
+        """
+        package = type(self)()
+        clones = {part: part.clone(cast("Package", package), lazy) for part in self.iter_parts()}
+        sources = itertools.chain([(self, package)], clones.items())
+        for source, clone in sources:
+            clone.rels.reuse_rId_gaps = source.rels.reuse_rId_gaps
+            for rel in source.rels.values():
+                target = rel.target_ref if rel.is_external else clones[rel.target_part]
+                clone.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+        for part in clones.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
+    def close(self):
+        """Close the package file this package was loaded from lazily, if still open.
+
+        The content of a part not read from the file by then can no longer be read, so
+        this package should not be used afterward. Has no effect on a package not loaded
+        lazily, which does not keep its file open.
+        """
+        if self._pkg_reader is not None:
+            self._pkg_reader.close()
+
+    def close_part_stream(self, writer: StreamingPackageWriter):
+        """Complete the save started by :meth:`open_part_stream` that uses `writer`.
+
+        Writes all remaining package content, including the relationships of the streamed
+        part, which can still change while its blob is being streamed.
+        """
+        for part in self.parts:
+            part.before_marshal()
+        writer.close(self.rels, self.parts)
+
     @property
     def core_properties(self) -> CoreProperties:
         """|CoreProperties| object providing read/write access to the Dublin Core
@@ -47,44 +102,30 @@ class OpcPackage:
         """Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph."""
 
-        def walk_rels(
-            source: OpcPackage | Part, visited: list[Part] | None = None
-        ) -> Iterator[_Relationship]:
-            visited = [] if visited is None else visited
-            for rel in source.rels.values():
+        visited: set[Part] = set()
+        stack = [iter(self.rels.values())]
+        while stack:
+            for rel in stack[-1]:
                 yield rel
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
-                new_source = part
-                for rel in walk_rels(new_source, visited):
-                    yield rel
-
-        for rel in walk_rels(self):
-            yield rel
+                visited.add(part)
+                stack.append(iter(part.rels.values()))
+                break
+            else:
+                stack.pop()
 
     def iter_parts(self) -> Iterator[Part]:
-        """Generate exactly one reference to each of the parts in the package by
-        performing a depth-first traversal of the rels graph."""
-
-        def walk_parts(source, visited=[]):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
+        """Generate exactly one reference to each of the parts in the package.
 
-        for part in walk_parts(self):
-            yield part
+        Parts are generated in the order a depth-first traversal of the rels graph first
+        reaches them, apart from those added since the package was last traversed, which
+        come last.
+        """
+        return iter(list(self._part_registry))
 
     def load_rel(self, reltype: str, target: Part | str, rId: str, is_external: bool = False):
         """Return newly added |_Relationship| instance of `reltype` between this part
@@ -114,20 +155,42 @@ class OpcPackage:
         containing a single replacement item, a '%d' to be used to insert the integer
         portion of the partname. Example: "/word/header%d.xml"
         """
-        partnames = {part.partname for part in self.iter_parts()}
-        for n in range(1, len(partnames) + 2):
-            candidate_partname = template % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
+        return self._part_registry.next_partname(template)
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> Self:
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        pkg_reader = PackageReader.from_file(pkg_file)
+    def open(
+        cls, pkg_file: str | IO[bytes], lazy: bool = False, executor: Executor | None = None
+    ) -> Self:
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `lazy` is |True|, the content of each part is read from `pkg_file` (and
+        parsed when it is XML) only when that part is first accessed. `pkg_file` is held
+        open until :meth:`close` is called or the package is saved over it, so a file-like
+        object passed as `pkg_file` must not be closed (or modified) while the package is in
+        use.
+
+        Otherwise, when `executor` (a `concurrent.futures.Executor`, typically a thread
+        pool) is provided, the parts are decompressed concurrently using it.
+        """
+        pkg_reader = PackageReader.from_file(pkg_file, lazy, executor)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if lazy:
+            package._pkg_reader = pkg_reader
         return package
 
+    def open_part_stream(
+        self, pkg_file: str | IO[bytes], partname: PackURI
+    ) -> StreamingPackageWriter:
+        """Start saving this package to `pkg_file`, streaming the blob of part `partname`.
+
+        Return a `StreamingPackageWriter` to which that blob is written in chunks, in place
+        of the part's own `.blob`. Pass it to :meth:`close_part_stream` to write the rest of
+        the package once the streamed blob is complete.
+        """
+        self._detach_sources_stored_in(pkg_file)
+        return StreamingPackageWriter(pkg_file, partname)
+
     def part_related_by(self, reltype: str) -> Part:
         """Return part to which this package has a relationship of `reltype`.
 
@@ -156,14 +219,48 @@ class OpcPackage:
         relationships for this package."""
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file: str | IO[bytes]):
+    def iter_save_chunks(
+        self, executor: Executor | None = None, compression: Mapping[str, int] | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this package, saved, one chunk at a time.
+
+        Same as :meth:`save`, but rather than being written to a file, each chunk of the
+        package file is generated as soon as it is written, about once for each part. Joined
+        together, the chunks are a complete package. The package must not be changed until
+        the last chunk is generated.
+        """
+        for part in self.parts:
+            part.before_marshal()
+        return PackageWriter.iter_write(self.rels, self.parts, executor, compression)
+
+    def save(
+        self,
+        pkg_file: str | IO[bytes],
+        executor: Executor | None = None,
+        compression: Mapping[str, int] | None = None,
+    ):
         """Save this package to `pkg_file`.
 
-        `pkg_file` can be either a file-path or a file-like object.
+        `pkg_file` can be either a file-path or a file-like object. A file-like object need
+        only have a `write()` method; when it cannot `tell()` or `seek()`, like a pipe or a
+        socket, a member compressed as it is written is followed by a data descriptor
+        holding its sizes and CRC rather than having them filled in afterward.
+
+        Parts of a lazily-loaded package that are unchanged since loading are copied
+        directly from the package file they were loaded from. When `pkg_file` is that same
+        file, any content not yet read from it is read into memory first.
+
+        When `executor` (a `concurrent.futures.Executor`, typically a thread pool) is
+        provided, the parts are compressed concurrently using it.
+
+        `compression` maps a content type or partname extension to how parts having it are
+        compressed, as described for `PackageWriter.write()`. Already-compressed image
+        formats are stored as-is and other parts are deflated when it is |None|.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        self._detach_sources_stored_in(pkg_file)
+        PackageWriter.write(pkg_file, self.rels, self.parts, executor, compression)
 
     @property
     def _core_properties_part(self) -> CorePropertiesPart:
@@ -178,6 +275,102 @@ class OpcPackage:
             self.relate_to(core_properties_part, RT.CORE_PROPERTIES)
             return core_properties_part
 
+    @property
+    def _part_registry(self) -> _PartRegistry:
+        """Registry of the parts in this package, rebuilt when no longer current."""
+        part_registry = self.__part_registry
+        if part_registry is None or not part_registry.is_current:
+            part_registry = self.__part_registry = _PartRegistry(self)
+        return part_registry
+
+    def _detach_sources_stored_in(self, pkg_file: str | IO[bytes]):
+        """Read into memory any pending content of parts loaded lazily from `pkg_file`.
+
+        Required before `pkg_file` is overwritten, which destroys that content. This
+        includes the content of a part renamed since it was loaded, which is still read from
+        the member named for its original partname, and the content of a part already read
+        but unchanged, which is still copied as-is from its member when saved. Once that
+        content is read, `pkg_file` is closed when this package was loaded from it.
+        """
+        for part in self.parts:
+            for source in (part.pending_source, part.pristine_source):
+                if source is not None and source.is_stored_in(pkg_file):
+                    source.detach()
+        pkg_reader = self._pkg_reader
+        if pkg_reader is not None and pkg_reader.is_stored_in(pkg_file):
+            pkg_reader.close()
+
+
+class _PartRegistry:
+    """The parts of a package, indexed by partname and kept current as parts are related.
+
+    Registers each part reachable from `package` through its rels graph, in the order a
+    depth-first traversal first reaches them. It watches the relationships of the package
+    and of each registered part, so a part related to any of them is registered at once,
+    along with any parts reachable from it. This way, neither finding the parts of a
+    package nor finding an unused partname traverses the rels graph.
+
+    Removing a relationship or renaming a part can leave parts registered that are no
+    longer in the package, or registered by a stale partname, so either makes this
+    registry no longer current; the package then builds a new one when next needed.
+    """
+
+    def __init__(self, package: OpcPackage):
+        self.is_current = True
+        self._parts: dict[Part, None] = {}
+        self._partnames: set[str] = set()
+        # -- every partname for a template below its index here is in use --
+        self._next_idxs: dict[str, int] = {}
+        package.rels.part_registry = self
+        self._register_reachable_from(package.rels)
+
+    def __iter__(self) -> Iterator[Part]:
+        return iter(self._parts)
+
+    def __len__(self):
+        return len(self._parts)
+
+    def invalidate(self):
+        """Mark this registry as no longer reflecting the parts of its package."""
+        self.is_current = False
+
+    def next_partname(self, template: str) -> PackURI:
+        """Return the partname matching `template` having the lowest unused index."""
+        n = self._next_idxs.get(template, 1)
+        while template % n in self._partnames:
+            n += 1
+        self._next_idxs[template] = n
+        return PackURI(template % n)
+
+    def register(self, part: Part):
+        """Add `part`, just related to by a registered source, and the parts it reaches."""
+        if not self.is_current or part in self._parts:
+            return
+        self._add(part)
+        self._register_reachable_from(part.rels)
+
+    def _add(self, part: Part):
+        self._parts[part] = None
+        self._partnames.add(part.partname)
+        part.rels.part_registry = self
+
+    def _register_reachable_from(self, rels: Relationships):
+        """Add each part reachable from `rels` that is not already registered."""
+        parts = self._parts
+        stack = [iter(rels.values())]
+        while stack:
+            for rel in stack[-1]:
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                if part in parts:
+                    continue
+                self._add(part)
+                stack.append(iter(part.rels.values()))
+                break
+            else:
+                stack.pop()
+
 
 class Unmarshaller:
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
@@ -189,11 +382,19 @@ class Unmarshaller:
 
         Package relationships are added to `pkg`.
         """
+        start = time.perf_counter() if instrumentation.observers else None
         parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
+            if not instrumentation.observers:
+                part.after_unmarshal()
+                continue
+            part_start = time.perf_counter()
             part.after_unmarshal()
+            instrumentation.emit("after_unmarshal", part_start, part.partname, part.content_type)
         package.after_unmarshal()
+        if start is not None:
+            instrumentation.emit("unmarshal", start)
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
@@ -201,11 +402,23 @@ class Unmarshaller:
         by partname.
 
         Side-effect is that each part in `pkg_reader` is constructed using
-        `part_factory`.
+        `part_factory`. Parts are constructed unloaded when `pkg_reader` is lazy.
         """
         parts = {}
+        if pkg_reader.is_lazy:
+            for partname, content_type, reltype, spart in pkg_reader.iter_lazy_sparts():
+                start = time.perf_counter() if instrumentation.observers else None
+                parts[partname] = part_factory.load_lazily(
+                    partname, content_type, reltype, spart, package
+                )
+                if start is not None:
+                    instrumentation.emit("construct", start, partname, content_type)
+            return parts
         for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
+            start = time.perf_counter() if instrumentation.observers else None
             parts[partname] = part_factory(partname, content_type, reltype, blob, package)
+            if start is not None:
+                instrumentation.emit("construct", start, partname, content_type, bytes_in=len(blob))
         return parts
 
     @staticmethod
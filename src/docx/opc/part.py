@@ -4,8 +4,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Type, cast
+import copy
+import functools
+import time
+from typing import TYPE_CHECKING, Callable, FrozenSet, Type, cast
 
+from docx import instrumentation
 from docx.opc.oxml import serialize_part_xml
 from docx.opc.packuri import PackURI
 from docx.opc.rel import Relationships
@@ -14,6 +18,11 @@ from docx.oxml.parser import parse_xml
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
+    from zipfile import ZipInfo
+
+    from typing_extensions import Self
+
+    from docx.opc.pkgreader import _SerializedPart  # pyright: ignore[reportPrivateUsage]
     from docx.oxml.xmlchemy import BaseOxmlElement
     from docx.package import Package
 
@@ -37,6 +46,7 @@ class Part:
         self._content_type = content_type
         self._blob = blob
         self._package = package
+        self._source: _SerializedPart | None = None
 
     def after_unmarshal(self):
         """Entry point for post-unmarshaling processing, for example to parse the part
@@ -63,10 +73,28 @@ class Part:
         """Contents of this package part as a sequence of bytes.
 
         May be text or binary. Intended to be overridden by subclasses. Default behavior
-        is to return load blob.
+        is to return load blob, which is read from the package on first access when this
+        part was loaded lazily.
         """
+        if self._blob is None and self._source is not None:
+            self._blob = self._source.blob
         return self._blob or b""
 
+    def clone(self, package: Package, lazy: bool = False) -> Self:
+        """Return a copy of this part belonging to `package`, having no relationships.
+
+        The blob of the copy is shared with this part rather than copied; bytes are
+        immutable, so sharing it is safe. Values this part has cached, its relationships
+        among them, are not carried over and are computed afresh by the copy as needed.
+        `lazy` applies only to an |XmlPart|.
+        """
+        clone = copy.copy(self)
+        clone_dict = clone.__dict__
+        for name in _cached_attr_names(type(self)):
+            clone_dict.pop(name, None)
+        clone._package = package
+        return clone
+
     @property
     def content_type(self):
         """Content type of this part."""
@@ -85,6 +113,19 @@ class Part:
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
         return cls(partname, content_type, blob, package)
 
+    @classmethod
+    def load_lazily(
+        cls, partname: PackURI, content_type: str, source: _SerializedPart, package: Package
+    ):
+        """Return a part of this class whose blob is read from `source` on first access.
+
+        `source` is the serialized part from a lazy |PackageReader|, still connected to
+        the package file it was read from.
+        """
+        part = cls.load(partname, content_type, cast(bytes, None), package)
+        part._source = source
+        return part
+
     def load_rel(self, reltype: str, target: Part | str, rId: str, is_external: bool = False):
         """Return newly added |_Relationship| instance of `reltype`.
 
@@ -113,6 +154,10 @@ class Part:
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
         self._partname = partname
+        # -- the registry of the package this part belongs to indexes it by partname --
+        part_registry = self.rels.part_registry
+        if part_registry is not None:
+            part_registry.invalidate()
 
     def part_related_by(self, reltype: str) -> Part:
         """Return part to which this part has a relationship of `reltype`.
@@ -135,6 +180,29 @@ class Part:
             rel = self.rels.get_or_add(reltype, cast(Part, target))
             return rel.rId
 
+    @property
+    def pending_source(self) -> _SerializedPart | None:
+        """The serialized part the content of this part is still to be read from, if any.
+
+        Present from when this part is loaded lazily until its content is first read, even
+        when it is renamed in the meantime.
+        """
+        if self._blob is not None:
+            return None
+        return self._source
+
+    @property
+    def pristine_source(self) -> _SerializedPart | None:
+        """The serialized part this part was lazily loaded from, when unchanged since.
+
+        |None| when this part was not loaded lazily or its content may have changed since
+        it was loaded. When present, the part can be saved by copying its source as-is.
+        """
+        source = self._source
+        if source is None or source.partname != self._partname:
+            return None
+        return source
+
     @property
     def related_parts(self):
         """Dictionary mapping related parts by rId, so child objects can resolve
@@ -187,13 +255,33 @@ class PartFactory:
         blob: bytes,
         package: Package,
     ):
+        PartClass = cls._select_part_cls(content_type, reltype)
+        return PartClass.load(partname, content_type, blob, package)
+
+    @classmethod
+    def load_lazily(
+        cls,
+        partname: PackURI,
+        content_type: str,
+        reltype: str,
+        source: _SerializedPart,
+        package: Package,
+    ) -> Part:
+        """Return a part of the class selected for `content_type` and `reltype` that
+        defers reading (and parsing) its content until first accessed."""
+        PartClass = cls._select_part_cls(content_type, reltype)
+        return PartClass.load_lazily(partname, content_type, source, package)
+
+    @classmethod
+    def _select_part_cls(cls, content_type: str, reltype: str) -> Type[Part]:
+        """Return the part class to construct for a part of `content_type` and `reltype`."""
         PartClass: Type[Part] | None = None
         if cls.part_class_selector is not None:
             part_class_selector = cls_method_fn(cls, "part_class_selector")
             PartClass = part_class_selector(content_type, reltype)
         if PartClass is None:
             PartClass = cls._part_cls_for(content_type)
-        return PartClass.load(partname, content_type, blob, package)
+        return PartClass
 
     @classmethod
     def _part_cls_for(cls, content_type: str):
@@ -212,25 +300,129 @@ class XmlPart(Part):
     """
 
     def __init__(
-        self, partname: PackURI, content_type: str, element: BaseOxmlElement, package: Package
+        self,
+        partname: PackURI,
+        content_type: str,
+        element: BaseOxmlElement | None,
+        package: Package,
     ):
         super(XmlPart, self).__init__(partname, content_type, package=package)
-        self._element = element
+        # -- `element` is None only for a lazily-loaded part, see `__getattr__()` --
+        if element is not None:
+            self._element = element
+
+    def __getattr__(self, name: str):
+        """Parse the XML of a lazily-loaded part on first access to `._element`.
+
+        Only called when normal attribute lookup fails, so costs nothing once `._element`
+        is assigned.
+        """
+        if name == "_element":
+            # -- a lazy clone copies the XML of the part it was cloned from --
+            template = self.__dict__.get("_element_template")
+            if template is not None:
+                element = self._element = copy.deepcopy(template)
+                return element
+            source = self.__dict__.get("_source")
+            if source is not None:
+                element = self._element = _parse_part_xml(
+                    source.blob, self.partname, self.content_type
+                )
+                return element
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
 
     @property
-    def blob(self):
-        return serialize_part_xml(self._element)
+    def blob(self) -> bytes:
+        """Serialized XML of this part."""
+        if "_element" not in self.__dict__:
+            # -- XML not yet copied or parsed cannot have changed, no need to do either --
+            template = self.__dict__.get("_element_template")
+            if template is not None:
+                return self._serialize(template)
+            if self._source is not None:
+                return self._source.blob
+        return self._serialize(self._element)
+
+    def clone(self, package: Package, lazy: bool = False) -> Self:
+        """Return a copy of this part belonging to `package`, having no relationships.
+
+        The copy has its own copy of the XML tree of this part, if that has been parsed.
+        When `lazy` is True, that tree is not copied until the copy first accesses it; this
+        part must not change from then on, since the copy can reflect such changes.
+        """
+        clone = super(XmlPart, self).clone(package)
+        clone_dict = clone.__dict__
+        clone_dict.pop("_deflated", None)
+        if "_element" not in self.__dict__:
+            return clone
+        if lazy:
+            del clone_dict["_element"]
+            clone_dict["_element_template"] = self._element
+            # -- the XML, not the source it may have been parsed from, is what's current --
+            clone._source = None
+        else:
+            clone_dict.pop("_element_template", None)
+            clone._element = copy.deepcopy(self._element)
+        return clone
 
     @property
     def element(self):
         """The root XML element of this XML part."""
         return self._element
 
+    def deflated_blob(self, blob: bytes, compresslevel: int | None) -> tuple[ZipInfo, bytes] | None:
+        """The `(zip_info, compressed_blob)` pair this part was last saved as, if still valid.
+
+        |None| unless this part was last saved as `blob`, its serialized XML, deflated at
+        `compresslevel`, so a part whose XML is unchanged since it was last saved is not
+        compressed again. Comparing the serialized XML catches any change to it, however
+        made.
+        """
+        deflated = self.__dict__.get("_deflated")
+        if deflated is None or deflated[1] != compresslevel or deflated[0] != blob:
+            return None
+        return deflated[2], deflated[3]
+
+    def keep_deflated_blob(
+        self, blob: bytes, compresslevel: int | None, zip_info: ZipInfo, compressed_blob: bytes
+    ) -> None:
+        """Keep `compressed_blob`, `blob` deflated at `compresslevel`, for the next save.
+
+        See :meth:`deflated_blob`.
+        """
+        self._deflated = (blob, compresslevel, zip_info, compressed_blob)
+
     @classmethod
     def load(cls, partname: PackURI, content_type: str, blob: bytes, package: Package):
-        element = parse_xml(blob)
+        element = _parse_part_xml(blob, partname, content_type)
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def load_lazily(
+        cls, partname: PackURI, content_type: str, source: _SerializedPart, package: Package
+    ):
+        """Return a part of this class whose XML is not parsed until first needed."""
+        part = cls(partname, content_type, None, package)
+        part._source = source
+        return part
+
+    @property
+    def pending_source(self) -> _SerializedPart | None:
+        """The serialized part the XML of this part is still to be parsed from, if any."""
+        if "_element" in self.__dict__ or "_element_template" in self.__dict__:
+            return None
+        return self._source
+
+    @property
+    def pristine_source(self) -> _SerializedPart | None:
+        """The serialized part this part was lazily loaded from, if its XML is unparsed.
+
+        Once parsed, the XML may have been changed, so |None| is returned from then on.
+        """
+        if "_element" in self.__dict__:
+            return None
+        return super(XmlPart, self).pristine_source
+
     @property
     def part(self):
         """Part of the parent protocol, "children" of the document will not know the
@@ -245,3 +437,56 @@ class XmlPart(Part):
         identified by `rId`."""
         rIds = cast("list[str]", self._element.xpath("//@r:id"))
         return len([_rId for _rId in rIds if _rId == rId])
+
+    def _serialize(self, element: BaseOxmlElement) -> bytes:
+        """Serialized XML of `element`, the root element of this part."""
+        if not instrumentation.observers:
+            return serialize_part_xml(element)
+        start = time.perf_counter()
+        blob = serialize_part_xml(element)
+        instrumentation.emit(
+            "serialize",
+            start,
+            self.partname,
+            self.content_type,
+            bytes_out=len(blob),
+            element_count=_node_count(element),
+        )
+        return blob
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_attr_names(cls: type) -> FrozenSet[str]:
+    """Names of the instance attributes in which an instance of `cls` caches values.
+
+    These are the values of its lazyproperties and the legacy `._rels` attribute.
+    """
+    names = {
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, lazyproperty)
+    }
+    return frozenset(names | {"_rels"})
+
+
+def _node_count(element: BaseOxmlElement) -> int:
+    """Number of nodes in the XML tree rooted at `element`, including `element`."""
+    return sum(1 for _ in element.iter())
+
+
+def _parse_part_xml(blob: bytes, partname: PackURI, content_type: str) -> BaseOxmlElement:
+    """Root element of the XML in `blob`, the blob of the part named `partname`."""
+    if not instrumentation.observers:
+        return parse_xml(blob)
+    start = time.perf_counter()
+    element = parse_xml(blob)
+    instrumentation.emit(
+        "parse",
+        start,
+        partname,
+        content_type,
+        bytes_in=len(blob),
+        element_count=_node_count(element),
+    )
+    return element
@@ -1,10 +1,31 @@
 """Provides a general interface to a `physical` OPC package, such as a zip file."""
 
+import collections
+import copy
 import os
-from zipfile import ZIP_DEFLATED, ZipFile, is_zipfile
+import sys
+import time
+import zlib
+from concurrent.futures import Future
+from zipfile import (
+    ZIP64_LIMIT,
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    BadZipFile,
+    ZipFile,
+    ZipInfo,
+    is_zipfile,
+)
 
+from docx import instrumentation
 from docx.opc.exceptions import PackageNotFoundError
-from docx.opc.packuri import CONTENT_TYPES_URI
+from docx.opc.packuri import CONTENT_TYPES_URI, PackURI
+
+# -- `ZipFile` has no public interface for writing already-compressed data. In the Python
+# -- versions here, the internals `_RawMemberWriter` relies on to write such data as-is
+# -- are known to be as it expects; in any other, the data is decompressed and written
+# -- with `ZipFile.writestr()`, and members are compressed on the calling thread.
+_RAW_WRITE_VERSIONS = ((3, 9), (3, 14))
 
 
 class PhysPkgReader:
@@ -28,7 +49,7 @@ class PhysPkgReader:
 class PhysPkgWriter:
     """Factory for physical package writer objects."""
 
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, executor=None):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -48,16 +69,47 @@ class _DirPkgReader(PhysPkgReader):
             blob = f.read()
         return blob
 
+    def blobs_for(self, pack_uris, executor):
+        """Return a list of the blobs for `pack_uris`, read concurrently using `executor`.
+
+        `executor` is a `concurrent.futures.Executor`, typically a thread pool.
+        """
+        return list(executor.map(self.blob_for, pack_uris))
+
     def close(self):
         """Provides interface consistency with |ZipFileSystem|, but does nothing, a
         directory file system doesn't need closing."""
         pass
 
+    def compressed_blob_for(self, pack_uri):
+        """Always |None|; a file in an expanded package has no compressed form."""
+        return None
+
     @property
     def content_types_xml(self):
         """Return the `[Content_Types].xml` blob from the package."""
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def is_stored_in(self, pkg_file):
+        """Always False; a package is never saved to a directory."""
+        return False
+
+    def iter_members(self):
+        """Generate a `(membername, size, compressed_size)` triple for each file in the package.
+
+        `compressed_size` is the same as `size`; files in a directory are not compressed.
+        """
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                membername = os.path.relpath(path, self._path).replace(os.sep, "/")
+                size = os.path.getsize(path)
+                yield membername, size, size
+
+    def open(self, pack_uri):
+        """Return a readable binary stream of the file corresponding to `pack_uri`."""
+        return open(os.path.join(self._path, pack_uri.membername), "rb")
+
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri`, or None if the item has no
         rels item."""
@@ -74,18 +126,93 @@ class _ZipPkgReader(PhysPkgReader):
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
         self._zipf = ZipFile(pkg_file, "r")
+        self._pkg_file = pkg_file
 
     def blob_for(self, pack_uri):
         """Return blob corresponding to `pack_uri`.
 
         Raises |ValueError| if no matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        if not instrumentation.observers:
+            return self._zipf.read(pack_uri.membername)
+        start = time.perf_counter()
+        zip_info = self._zipf.getinfo(pack_uri.membername)
+        blob = self._zipf.read(zip_info)
+        instrumentation.emit(
+            "inflate", start, pack_uri, bytes_in=zip_info.compress_size, bytes_out=len(blob)
+        )
+        return blob
+
+    def blobs_for(self, pack_uris, executor):
+        """Return a list of the blobs for `pack_uris`, decompressed concurrently using `executor`.
+
+        `executor` is a `concurrent.futures.Executor`, typically a thread pool. The
+        compressed data of each member is read from the archive in turn, then inflated
+        in the executor; zlib releases the GIL while it inflates, so threads decompress
+        in parallel. A member compressed other than by deflate is read the usual way.
+        """
+        zip_infos, payloads = [], []
+        for pack_uri in pack_uris:
+            zip_info = self._zipf.getinfo(pack_uri.membername)
+            if (
+                zip_info.compress_type in (ZIP_DEFLATED, ZIP_STORED)
+                and not zip_info.flag_bits & 0x1
+            ):
+                zip_info, payload = self.compressed_blob_for(pack_uri)
+            else:
+                zip_info, payload = None, self._zipf.read(zip_info)
+            zip_infos.append(zip_info)
+            payloads.append(payload)
+        return list(executor.map(_decompress, zip_infos, payloads))
 
     def close(self):
         """Close the zip archive, releasing any resources it is using."""
         self._zipf.close()
 
+    def compressed_blob_for(self, pack_uri):
+        """Return `(zip_info, compressed_blob)` pair for member corresponding to `pack_uri`.
+
+        `compressed_blob` is the member data exactly as stored in the archive, without
+        decompressing it. `zip_info` is the |ZipInfo| describing that data (compression
+        method, CRC, and sizes), suitable for passing to `_ZipPkgWriter.write_compressed()`.
+        """
+        zip_info = self._zipf.getinfo(pack_uri.membername)
+        # -- read the member as though it were stored uncompressed, which yields its
+        # -- compressed bytes; there is no meaningful CRC to check for those.
+        raw_info = copy.copy(zip_info)
+        raw_info.compress_type = ZIP_STORED
+        raw_info.file_size = zip_info.compress_size
+        raw_info.CRC = None
+        with self._zipf.open(raw_info) as f:
+            return zip_info, f.read()
+
+    def is_stored_in(self, pkg_file):
+        """True if `pkg_file` (a path or file-like object) is the file this package is
+        being read from."""
+        if isinstance(pkg_file, str) and isinstance(self._pkg_file, str):
+            return os.path.exists(pkg_file) and os.path.samefile(pkg_file, self._pkg_file)
+        return pkg_file is self._pkg_file
+
+    def iter_members(self):
+        """Generate a `(membername, size, compressed_size)` triple for each member of the zip.
+
+        These come from the central directory of the archive, read when it was opened, so no
+        member is read or decompressed. Directory entries, which some zip tools add, are
+        skipped.
+        """
+        for zip_info in self._zipf.infolist():
+            if zip_info.is_dir():
+                continue
+            yield zip_info.filename, zip_info.file_size, zip_info.compress_size
+
+    def open(self, pack_uri):
+        """Return a readable stream of the member corresponding to `pack_uri`.
+
+        The member is decompressed as it is read, so it need not fit in memory all at once.
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        return self._zipf.open(pack_uri.membername)
+
     @property
     def content_types_xml(self):
         """Return the `[Content_Types].xml` blob from the zip package."""
@@ -94,26 +221,245 @@ class _ZipPkgReader(PhysPkgReader):
     def rels_xml_for(self, source_uri):
         """Return rels item XML for source with `source_uri` or None if no rels item is
         present."""
-        try:
-            rels_xml = self.blob_for(source_uri.rels_uri)
-        except KeyError:
-            rels_xml = None
-        return rels_xml
+        membername = source_uri.rels_uri.membername
+        if membername not in self._zipf.NameToInfo:
+            return None
+        return self._zipf.read(membername)
 
 
 class _ZipPkgWriter(PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip file OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip file OPC package.
 
-    def __init__(self, pkg_file):
+    When `executor`, a `concurrent.futures.Executor` such as a thread pool, is provided,
+    each blob is deflated in `executor` while later blobs are being produced; zlib
+    releases the GIL while it compresses, so threads compress in parallel. Members are
+    still written to the archive in the order they are written to this writer. This
+    requires writing compressed data as-is, see :attr:`writes_raw`; `executor` is not
+    used when that is not supported.
+    """
+
+    def __init__(self, pkg_file, executor=None):
         super(_ZipPkgWriter, self).__init__()
         self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+        self._raw_writer = _RawMemberWriter.new(self._zipf)
+        self._writes_raw = self._raw_writer is not None
+        self._executor = executor if self._writes_raw else None
+        # -- `(pack_uri, future, on_deflated)` for each member not yet written, in write
+        # -- order --
+        self._pending = collections.deque()
 
     def close(self):
         """Close the zip archive, flushing any pending physical writes and releasing any
         resources it's using."""
+        self._write_pending()
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def open(self, pack_uri):
+        """Return a writable stream for the member of this zip package named for `pack_uri`.
+
+        The member is compressed as it is written and is complete once the stream is closed.
+        Nothing else can be written to the package while the stream is open.
+        """
+        self._write_pending()
+        return self._zipf.open(pack_uri.membername, "w")
+
+    @property
+    def writes_raw(self):
+        """True when already-compressed data is written to the archive as-is.
+
+        Otherwise, such data is decompressed and compressed again as it is written.
+        """
+        return self._writes_raw
+
+    def write(self, pack_uri, blob, compresslevel=None, on_deflated=None):
         """Write `blob` to this zip package with the membername corresponding to
-        `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        `pack_uri`.
+
+        `blob` is deflated at `compresslevel`, 1 (fastest) to 9 (smallest), or at zlib's
+        default level when `compresslevel` is |None|. It is stored uncompressed when
+        `compresslevel` is `ZIP_STORED` (0). When this package writes compressed data
+        as-is, see :attr:`writes_raw`, `on_deflated` is called with the `(zip_info,
+        compressed_blob)` pair written, which :meth:`write_compressed` can write again.
+        """
+        if self._executor is None and on_deflated is not None and self._writes_raw:
+            zip_info, compressed_blob = _compress(blob, compresslevel, pack_uri)
+            self._write_member(pack_uri, zip_info, compressed_blob)
+            on_deflated(zip_info, compressed_blob)
+            return
+        if self._executor is None:
+            start = time.perf_counter() if instrumentation.observers else None
+            if compresslevel == ZIP_STORED:
+                self._zipf.writestr(pack_uri.membername, blob, compress_type=ZIP_STORED)
+            else:
+                self._zipf.writestr(pack_uri.membername, blob, compresslevel=compresslevel)
+            if start is not None:
+                zip_info = self._zipf.filelist[-1]
+                instrumentation.emit(
+                    "deflate",
+                    start,
+                    pack_uri,
+                    bytes_in=zip_info.file_size,
+                    bytes_out=zip_info.compress_size,
+                )
+            return
+        future = self._executor.submit(_compress, blob, compresslevel, pack_uri)
+        self._pending.append((pack_uri, future, on_deflated))
+        self._write_pending(wait=False)
+
+    def write_compressed(self, pack_uri, zip_info, compressed_blob):
+        """Write already-compressed `compressed_blob` to this zip package as-is.
+
+        The member is named for `pack_uri`. `zip_info` describes `compressed_blob`, in
+        particular its compression method, CRC, and uncompressed size, like the one
+        returned by `_ZipPkgReader.compressed_blob_for()`.
+        """
+        if self._executor is None:
+            self._write_member(pack_uri, zip_info, compressed_blob)
+            return
+        future = Future()
+        future.set_result((zip_info, compressed_blob))
+        self._pending.append((pack_uri, future, None))
+
+    def _write_member(self, pack_uri, zip_info, compressed_blob):
+        """Write the member for `pack_uri` having compressed data `compressed_blob`."""
+        if not self._writes_raw:
+            blob = _decompress(zip_info, compressed_blob)
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zip_info.compress_type)
+            return
+        zinfo = ZipInfo(pack_uri.membername, time.localtime(time.time())[:6])
+        zinfo.compress_type = zip_info.compress_type
+        zinfo.CRC = zip_info.CRC
+        zinfo.file_size = zip_info.file_size
+        zinfo.compress_size = len(compressed_blob)
+        # -- keep only the compression-option bits; sizes go in the local header here,
+        # -- so no data-descriptor is needed, even for a non-seekable stream.
+        zinfo.flag_bits = zip_info.flag_bits & 0x06
+        zinfo.external_attr = 0o600 << 16
+        self._raw_writer.write(zinfo, compressed_blob)
+
+    def _write_pending(self, wait=True):
+        """Write pending members to the archive, in the order they were written.
+
+        When `wait` is False, stop at the first member still being compressed rather than
+        waiting for it.
+        """
+        pending = self._pending
+        while pending and (wait or pending[0][1].done()):
+            pack_uri, future, on_deflated = pending.popleft()
+            zip_info, compressed_blob = future.result()
+            self._write_member(pack_uri, zip_info, compressed_blob)
+            if on_deflated is not None:
+                on_deflated(zip_info, compressed_blob)
+
+
+class _RawMemberWriter:
+    """Writes members having already-compressed data to a `ZipFile` as-is.
+
+    `ZipFile` has no public interface for this, so this follows what `ZipFile.open(...,
+    "w")` and its write-handle do on close, using private attributes of `ZipFile`. It is
+    the only code here to do so, and one is only provided where those attributes are known
+    to be as it expects, see :meth:`new`.
+    """
+
+    _ZIPFILE_ATTRS = (
+        "NameToInfo",
+        "_didModify",
+        "_lock",
+        "_seekable",
+        "_writecheck",
+        "filelist",
+        "fp",
+        "start_dir",
+    )
+
+    def __init__(self, zipf):
+        self._zipf = zipf
+
+    @classmethod
+    def new(cls, zipf):
+        """Return a raw-member writer for `zipf`, or |None| where that is not supported.
+
+        It is supported only in the Python versions in `_RAW_WRITE_VERSIONS`, and only
+        when `zipf` has each of the attributes it uses.
+        """
+        if not _RAW_WRITE_VERSIONS[0] <= sys.version_info[:2] < _RAW_WRITE_VERSIONS[1]:
+            return None
+        if not all(hasattr(zipf, name) for name in cls._ZIPFILE_ATTRS):
+            return None
+        return cls(zipf)
+
+    def write(self, zinfo, compressed_blob):
+        """Write the member described by `zinfo` having compressed data `compressed_blob`.
+
+        `zinfo` has the compression method, CRC, and sizes of the member set.
+        """
+        zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+        zipf = self._zipf
+        with zipf._lock:
+            if zipf._seekable:
+                zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+            zipf.fp.write(zinfo.FileHeader(zip64))
+            zipf.fp.write(compressed_blob)
+            zipf.start_dir = zipf.fp.tell()
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _compress(blob, compresslevel=None, pack_uri=None):
+    """Return `(zip_info, compressed_blob)` for `blob` compressed just as `ZipFile` does.
+
+    `blob` is deflated at `compresslevel`, or stored as-is when `compresslevel` is
+    `ZIP_STORED`, as for `_ZipPkgWriter.write()`. `zip_info` holds the compression method,
+    CRC, and uncompressed size of `blob`. `pack_uri` names the member, for instrumentation.
+    """
+    if not instrumentation.observers:
+        return _compress_blob(blob, compresslevel)
+    start = time.perf_counter()
+    zip_info, compressed_blob = _compress_blob(blob, compresslevel)
+    instrumentation.emit(
+        "deflate", start, pack_uri, bytes_in=zip_info.file_size, bytes_out=len(compressed_blob)
+    )
+    return zip_info, compressed_blob
+
+
+def _compress_blob(blob, compresslevel=None):
+    """Return `(zip_info, compressed_blob)` for `blob`, as for :func:`_compress`."""
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+    zip_info = ZipInfo()
+    zip_info.CRC = zlib.crc32(blob)
+    zip_info.file_size = len(blob)
+    if compresslevel == ZIP_STORED:
+        zip_info.compress_type = ZIP_STORED
+        return zip_info, blob
+    level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    zip_info.compress_type = ZIP_DEFLATED
+    return zip_info, compressor.compress(blob) + compressor.flush()
+
+
+def _decompress(zip_info, payload):
+    """Return the uncompressed blob of zip member `zip_info` having stored data `payload`.
+
+    `payload` is returned unchanged when `zip_info` is |None|, meaning it is already
+    uncompressed. Raises |BadZipFile| when the CRC does not match, as `ZipFile.read()`
+    does.
+    """
+    if zip_info is None:
+        return payload
+    start = time.perf_counter() if instrumentation.observers else None
+    blob = payload if zip_info.compress_type == ZIP_STORED else zlib.decompress(payload, -15)
+    if zlib.crc32(blob) != zip_info.CRC:
+        raise BadZipFile("Bad CRC-32 for file %r" % zip_info.filename)
+    if start is not None:
+        instrumentation.emit(
+            "inflate",
+            start,
+            PackURI("/" + zip_info.filename),
+            bytes_in=len(payload),
+            bytes_out=len(blob),
+        )
+    return blob
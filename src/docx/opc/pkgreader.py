@@ -1,5 +1,11 @@
 """Low-level, read-only API to a serialized Open Packaging Convention (OPC) package."""
 
+from __future__ import annotations
+
+import time
+from typing import IO, Dict, Iterator
+
+from docx import instrumentation
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import parse_xml
 from docx.opc.packuri import PACKAGE_URI, PackURI
@@ -11,20 +17,76 @@ class PackageReader:
     """Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes."""
 
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(
+        self, content_types, pkg_srels, sparts, lazy=False, manifest=None, phys_reader=None
+    ):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._lazy = lazy
+        self._manifest = manifest
+        self._phys_reader = phys_reader
 
     @staticmethod
-    def from_file(pkg_file):
-        """Return a |PackageReader| instance loaded with contents of `pkg_file`."""
+    def from_file(pkg_file, lazy=False, executor=None):
+        """Return a |PackageReader| instance loaded with contents of `pkg_file`.
+
+        When `lazy` is |True|, part blobs are not read from `pkg_file` here. Each
+        serialized part instead keeps a reference to the (still open) physical package
+        and reads its blob only when asked for it.
+
+        When `executor`, a `concurrent.futures.Executor` such as a thread pool, is
+        provided, the relationship graph is walked first to discover the parts, and then
+        their blobs are decompressed concurrently in `executor`. `executor` is not used
+        when `lazy` is |True|.
+        """
+        start = time.perf_counter() if instrumentation.observers else None
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(phys_reader, pkg_srels, content_types)
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+        manifest = PackageManifest.from_phys_reader(phys_reader, content_types)
+        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI, manifest)
+        sparts = PackageReader._load_serialized_parts(
+            phys_reader, pkg_srels, content_types, lazy, executor, manifest
+        )
+        if not lazy:
+            phys_reader.close()
+        if start is not None:
+            instrumentation.emit(
+                "read_package",
+                start,
+                bytes_in=manifest.total_compressed_size,
+                bytes_out=manifest.total_size,
+            )
+        return PackageReader(
+            content_types, pkg_srels, sparts, lazy, manifest, phys_reader if lazy else None
+        )
+
+    def close(self):
+        """Close the package file of a lazy reader; no blob can be read from it afterward.
+
+        Has no effect when this reader is not lazy, its package file being closed already.
+        """
+        if self._phys_reader is not None:
+            self._phys_reader.close()
+
+    @property
+    def is_lazy(self):
+        """True when the blob of each serialized part is read only on first access."""
+        return self._lazy
+
+    @property
+    def manifest(self):
+        """|PackageManifest| indexing each member of the package this reader was loaded from.
+
+        |None| when this reader was not loaded from a package file.
+        """
+        return self._manifest
+
+    def is_stored_in(self, pkg_file):
+        """True if this reader is lazy and `pkg_file` is the package file it reads from."""
+        if self._phys_reader is None:
+            return False
+        return self._phys_reader.is_stored_in(pkg_file)
 
     def iter_sparts(self):
         """Generate a 4-tuple `(partname, content_type, reltype, blob)` for each of the
@@ -32,6 +94,16 @@ class PackageReader:
         for s in self._sparts:
             yield (s.partname, s.content_type, s.reltype, s.blob)
 
+    def iter_lazy_sparts(self):
+        """Generate a 4-tuple `(partname, content_type, reltype, spart)` for each of the
+        serialized parts in the package.
+
+        Unlike :meth:`iter_sparts`, the blob of each part is not read. `spart` is the
+        |_SerializedPart| itself, which produces the blob from the package on demand.
+        """
+        for s in self._sparts:
+            yield (s.partname, s.content_type, s.reltype, s)
+
     def iter_srels(self):
         """Generate a 2-tuple `(source_uri, srel)` for each of the relationships in the
         package."""
@@ -42,45 +114,181 @@ class PackageReader:
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(
+        phys_reader, pkg_srels, content_types, lazy=False, executor=None, manifest=None
+    ):
         """Return a list of |_SerializedPart| instances corresponding to the parts in
         `phys_reader` accessible by walking the relationship graph starting with
-        `pkg_srels`."""
+        `pkg_srels`.
+
+        When `lazy` is True, no blob is read and each serialized part is given
+        `phys_reader` to read its blob from later. Otherwise, when `executor` is not
+        |None|, all the blobs are read together, once the graph has been walked, using
+        `executor`.
+        """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        source = phys_reader if lazy else None
+        read_blobs_together = executor is not None and not lazy
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy or read_blobs_together, manifest=manifest
+        )
+        if read_blobs_together:
+            walked = list(part_walker)
+            blobs = phys_reader.blobs_for([partname for partname, _, _, _ in walked], executor)
+            part_walker = [
+                (partname, blob, reltype, srels)
+                for (partname, _, reltype, srels), blob in zip(walked, blobs)
+            ]
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
-            spart = _SerializedPart(partname, content_type, reltype, blob, srels)
+            spart = _SerializedPart(partname, content_type, reltype, blob, srels, source)
             sparts.append(spart)
         return tuple(sparts)
 
     @staticmethod
-    def _srels_for(phys_reader, source_uri):
+    def _srels_for(phys_reader, source_uri, manifest=None):
         """Return |_SerializedRelationships| instance populated with relationships for
-        source identified by `source_uri`."""
+        source identified by `source_uri`.
+
+        When `manifest` is provided, it is consulted first so the package is not searched
+        for a rels item the source does not have.
+        """
+        if manifest is not None and not manifest.has_rels(source_uri):
+            return _SerializedRelationships()
         rels_xml = phys_reader.rels_xml_for(source_uri)
         return _SerializedRelationships.load_from_xml(source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, lazy=False, manifest=None):
         """Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the parts
-        in `phys_reader` by walking the relationship graph rooted at srels."""
-        if visited_partnames is None:
-            visited_partnames = []
-        for srel in srels:
+        in `phys_reader` by walking the relationship graph rooted at srels.
+
+        Parts are generated in depth-first order, each before the parts it is related to.
+        The walk uses an explicit stack rather than recursion, so a long chain of
+        relationships cannot exhaust the call stack. `blob` is |None| for each part when
+        `lazy` is True.
+        """
+        visited_partnames = set()
+        # -- iterator over the remaining relationships of each part on the current path --
+        stack = [iter(srels)]
+        while stack:
+            srel = next(stack[-1], None)
+            if srel is None:
+                stack.pop()
+                continue
             if srel.is_external:
                 continue
             partname = srel.target_partname
             if partname in visited_partnames:
                 continue
-            visited_partnames.append(partname)
-            reltype = srel.reltype
-            part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, reltype, part_srels)
-            next_walker = PackageReader._walk_phys_parts(phys_reader, part_srels, visited_partnames)
-            for partname, blob, reltype, srels in next_walker:
-                yield (partname, blob, reltype, srels)
+            visited_partnames.add(partname)
+            part_srels = PackageReader._srels_for(phys_reader, partname, manifest)
+            blob = None if lazy else phys_reader.blob_for(partname)
+            yield (partname, blob, srel.reltype, part_srels)
+            stack.append(iter(part_srels))
+
+
+class ManifestEntry:
+    """Read-only record of one member of a package, as listed in its zip directory."""
+
+    def __init__(
+        self, partname: PackURI, content_type: str | None, size: int, compressed_size: int
+    ):
+        self._partname = partname
+        self._content_type = content_type
+        self._size = size
+        self._compressed_size = compressed_size
+
+    @property
+    def compressed_size(self) -> int:
+        """Size in bytes of this member as stored in the package."""
+        return self._compressed_size
+
+    @property
+    def content_type(self) -> str | None:
+        """Content type of this member from `[Content_Types].xml`.
+
+        |None| when `[Content_Types].xml` maps no content type to it, as for
+        `[Content_Types].xml` itself.
+        """
+        return self._content_type
+
+    @property
+    def partname(self) -> PackURI:
+        """Partname of this member, like `/word/document.xml`."""
+        return self._partname
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of this member once decompressed."""
+        return self._size
+
+
+class PackageManifest:
+    """Index of the members of a package, keyed by partname.
+
+    Built from the zip central directory and `[Content_Types].xml` alone, so no part is
+    read or decompressed to build it. It lists every member of the package, including
+    relationship items and any part no relationship refers to.
+    """
+
+    def __init__(self, entries: Dict[str, ManifestEntry]):
+        self._entries = entries
+
+    def __contains__(self, partname: str) -> bool:
+        return partname in self._entries
+
+    def __getitem__(self, partname: str) -> ManifestEntry:
+        """|ManifestEntry| for the member named `partname`.
+
+        Raises |KeyError| when the package has no such member.
+        """
+        return self._entries[partname]
+
+    def __iter__(self) -> Iterator[ManifestEntry]:
+        """Generate the |ManifestEntry| of each member, in zip directory order."""
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def from_file(cls, pkg_file: str | IO[bytes]) -> PackageManifest:
+        """Return the manifest of the package at `pkg_file`, a path or file-like object."""
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types_xml = phys_reader.content_types_xml  # pyright: ignore
+            return cls.from_phys_reader(phys_reader, _ContentTypeMap.from_xml(content_types_xml))
+        finally:
+            phys_reader.close()  # pyright: ignore
+
+    @classmethod
+    def from_phys_reader(cls, phys_reader, content_types: _ContentTypeMap) -> PackageManifest:
+        """Return the manifest of the package read by `phys_reader`."""
+        entries: Dict[str, ManifestEntry] = {}
+        for membername, size, compressed_size in phys_reader.iter_members():
+            partname = PackURI("/" + membername)
+            entries[partname] = ManifestEntry(
+                partname, content_types.get(partname), size, compressed_size
+            )
+        return cls(entries)
+
+    def has_rels(self, source_uri: PackURI) -> bool:
+        """True if the package has a relationships item for the source at `source_uri`.
+
+        `source_uri` is the partname of a part, or `PACKAGE_URI` for the package itself.
+        """
+        return source_uri.rels_uri in self._entries
+
+    @property
+    def total_compressed_size(self) -> int:
+        """Sum of the stored sizes of all members, in bytes."""
+        return sum(entry.compressed_size for entry in self._entries.values())
+
+    @property
+    def total_size(self) -> int:
+        """Sum of the decompressed sizes of all members, in bytes."""
+        return sum(entry.size for entry in self._entries.values())
 
 
 class _ContentTypeMap:
@@ -104,6 +312,15 @@ class _ContentTypeMap:
         tmpl = "no content type for partname '%s' in [Content_Types].xml"
         raise KeyError(tmpl % partname)
 
+    def get(self, partname, default=None):
+        """Return content type for part identified by `partname`, or `default` when
+        there is no mapping for it."""
+        if partname in self._overrides:
+            return self._overrides[partname]
+        if partname.ext in self._defaults:
+            return self._defaults[partname.ext]
+        return default
+
     @staticmethod
     def from_xml(content_types_xml):
         """Return a new |_ContentTypeMap| instance populated with the contents of
@@ -131,16 +348,18 @@ class _SerializedPart:
     """Value object for an OPC package part.
 
     Provides access to the partname, content type, blob, and serialized relationships
-    for the part.
+    for the part. When constructed with a `phys_reader` instead of a blob, the blob is
+    read from that physical package each time it is accessed.
     """
 
-    def __init__(self, partname, content_type, reltype, blob, srels):
+    def __init__(self, partname, content_type, reltype, blob, srels, phys_reader=None):
         super(_SerializedPart, self).__init__()
         self._partname = partname
         self._content_type = content_type
         self._reltype = reltype
         self._blob = blob
         self._srels = srels
+        self._phys_reader = phys_reader
 
     @property
     def partname(self):
@@ -151,9 +370,38 @@ class _SerializedPart:
         return self._content_type
 
     @property
-    def blob(self):
+    def blob(self) -> bytes:
+        if self._blob is None and self._phys_reader is not None:
+            return self._phys_reader.blob_for(self._partname)
         return self._blob
 
+    @property
+    def compressed_blob(self):
+        """`(zip_info, compressed_blob)` pair for this part as stored in its package.
+
+        |None| when the part was not loaded lazily or its package cannot provide the
+        compressed form, such as a package expanded into a directory.
+        """
+        if self._phys_reader is None:
+            return None
+        return self._phys_reader.compressed_blob_for(self._partname)
+
+    def detach(self):
+        """Read the blob of this part into memory and release the physical package.
+
+        Used when the package file is about to be overwritten.
+        """
+        if self._phys_reader is None:
+            return
+        self._blob = self._phys_reader.blob_for(self._partname)
+        self._phys_reader = None
+
+    def is_stored_in(self, pkg_file):
+        """True if this part is still to be read from `pkg_file`."""
+        if self._phys_reader is None:
+            return False
+        return self._phys_reader.is_stored_in(pkg_file)
+
     @property
     def reltype(self):
         """The referring relationship type of this part."""
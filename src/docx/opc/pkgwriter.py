@@ -6,36 +6,121 @@ OpcPackage.save().
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+import functools
+import time
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, List, Mapping
+from zipfile import ZIP_STORED
 
+from docx import instrumentation
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.oxml import CT_Types, serialize_part_xml
 from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.part import XmlPart
 from docx.opc.phys_pkg import PhysPkgWriter
 from docx.opc.shared import CaseInsensitiveDict
 from docx.opc.spec import default_content_types
 
 if TYPE_CHECKING:
+    from docx.opc.packuri import PackURI
     from docx.opc.part import Part
+    from docx.opc.rel import Relationships
+
+#: Compression policy used when none is given, storing image formats that are already
+#: compressed, since deflating them again costs time for next to no reduction in size.
+DEFAULT_COMPRESSION: Mapping[str, int] = {
+    CT.GIF: ZIP_STORED,
+    CT.JPEG: ZIP_STORED,
+    CT.PNG: ZIP_STORED,
+}
 
 
 class PackageWriter:
     """Writes a zip-format OPC package to `pkg_file`, where `pkg_file` can be either a
     path to a zip file (a string) or a file-like object.
 
-    Its single API method, :meth:`write`, is static, so this class is not intended to be
-    instantiated.
+    Its API methods, :meth:`write` and :meth:`iter_write`, are static, so this class is not
+    intended to be instantiated.
     """
 
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def iter_write(
+        pkg_rels, parts, executor=None, compression: Mapping[str, int] | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of a physical package containing `pkg_rels` and `parts`.
+
+        Same as :meth:`write`, but rather than writing to a file, each chunk of the package
+        is generated as soon as it is complete, generally once for each part. Joined
+        together, the chunks make up the package. The package is written as to a stream
+        that cannot seek, a member compressed as it is written being followed by a data
+        descriptor, so nothing already generated needs to be changed and only the parts
+        not yet generated are held in compressed form.
+        """
+        if compression is None:
+            compression = DEFAULT_COMPRESSION
+        sink = _ChunkSink()
+        phys_writer = PhysPkgWriter(sink, executor)
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+        for _ in PackageWriter._iter_write_parts(phys_writer, parts, compression=compression):
+            yield from sink.pop()
+        phys_writer.close()
+        yield from sink.pop()
+
+    @staticmethod
+    def write(
+        pkg_file, pkg_rels, parts, executor=None, compression: Mapping[str, int] | None = None
+    ):
         """Write a physical package (.pptx file) to `pkg_file` containing `pkg_rels` and
-        `parts` and a content types stream based on the content types of the parts."""
-        phys_writer = PhysPkgWriter(pkg_file)
+        `parts` and a content types stream based on the content types of the parts.
+
+        When `executor`, a `concurrent.futures.Executor` such as a thread pool, is
+        provided, part blobs are compressed concurrently using it.
+
+        `compression` is the compression policy for part blobs, a mapping from a content
+        type, or from a lower-case partname extension like "bin", to `ZIP_STORED` (0) to
+        store such parts uncompressed or to a deflate level from 1 (fastest) to 9
+        (smallest). A content type takes precedence over an extension. Parts matching
+        neither are deflated at zlib's default level. `DEFAULT_COMPRESSION` is used when
+        `compression` is |None|.
+        """
+        if compression is None:
+            compression = DEFAULT_COMPRESSION
+        start = time.perf_counter() if instrumentation.observers else None
+        phys_writer = PhysPkgWriter(pkg_file, executor)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_parts(phys_writer, parts, compression=compression)
         phys_writer.close()
+        if start is not None:
+            instrumentation.emit("write_package", start)
+
+    @staticmethod
+    def _compresslevel_for(part: Part, compression: Mapping[str, int]) -> int | None:
+        """Return the compression level `compression` specifies for `part`, if any."""
+        compresslevel = compression.get(part.content_type)
+        if compresslevel is None:
+            compresslevel = compression.get(part.partname.ext.lower())
+        return compresslevel
+
+    @staticmethod
+    def _write_blob(phys_writer: PhysPkgWriter, part: Part, compresslevel: int | None):
+        """Write the blob of `part` to the package, deflated at `compresslevel`.
+
+        The serialized XML of an XML part is compared with the XML it was last saved as and,
+        when unchanged, the compressed form kept from that save is written again rather than
+        deflating that XML again.
+        """
+        blob = part.blob
+        if not isinstance(part, XmlPart):
+            phys_writer.write(part.partname, blob, compresslevel)
+            return
+        deflated = part.deflated_blob(blob, compresslevel)
+        if deflated is not None:
+            zip_info, compressed_blob = deflated
+            phys_writer.write_compressed(part.partname, zip_info, compressed_blob)
+            return
+        on_deflated = functools.partial(part.keep_deflated_blob, blob, compresslevel)
+        phys_writer.write(part.partname, blob, compresslevel, on_deflated)
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -45,13 +130,50 @@ class PackageWriter:
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer: PhysPkgWriter, parts: Iterable[Part]):
-        """Write the blob of each part in `parts` to the package, along with a rels item
-        for its relationships if and only if it has any."""
+    def _iter_write_parts(
+        phys_writer: PhysPkgWriter,
+        parts: Iterable[Part],
+        streamed_partname: PackURI | None = None,
+        compression: Mapping[str, int] = DEFAULT_COMPRESSION,
+    ) -> Iterator[Part]:
+        """Write each part in `parts` as for :meth:`_write_parts`, generating it once written."""
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if part.partname == streamed_partname:
+                if len(part.rels):
+                    phys_writer.write(part.partname.rels_uri, part.rels.xml)
+                yield part
+                continue
+            source = part.pristine_source
+            compressed = None if source is None else source.compressed_blob
+            if compressed is not None:
+                zip_info, compressed_blob = compressed
+                phys_writer.write_compressed(part.partname, zip_info, compressed_blob)
+            else:
+                compresslevel = PackageWriter._compresslevel_for(part, compression)
+                PackageWriter._write_blob(phys_writer, part, compresslevel)
             if len(part.rels):
                 phys_writer.write(part.partname.rels_uri, part.rels.xml)
+            yield part
+
+    @staticmethod
+    def _write_parts(
+        phys_writer: PhysPkgWriter,
+        parts: Iterable[Part],
+        streamed_partname: PackURI | None = None,
+        compression: Mapping[str, int] = DEFAULT_COMPRESSION,
+    ):
+        """Write the blob of each part in `parts` to the package, along with a rels item
+        for its relationships if and only if it has any.
+
+        A part unchanged since it was lazily loaded is copied from its source package in
+        compressed form, avoiding both decompressing and recompressing it. The blob of the
+        part named `streamed_partname`, if any, has already been streamed to the package, so
+        only its rels are written. Each other blob is compressed as `compression` specifies.
+        """
+        for _ in PackageWriter._iter_write_parts(
+            phys_writer, parts, streamed_partname, compression
+        ):
+            pass
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -59,6 +181,71 @@ class PackageWriter:
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+class StreamingPackageWriter:
+    """Writes a zip-format OPC package in which the blob of one part is streamed.
+
+    The zip member for the part at `partname` is opened on construction and receives each
+    chunk of its blob passed to :meth:`write` as that chunk is generated, so the blob never
+    needs to be held in memory as a whole. :meth:`close` then writes the rest of the
+    package, like :meth:`PackageWriter.write` does.
+    """
+
+    def __init__(self, pkg_file: str | IO[bytes], partname: PackURI):
+        self._phys_writer = PhysPkgWriter(pkg_file)
+        self._partname = partname
+        self._stream = self._phys_writer.open(partname)
+
+    def abort(self):
+        """Close the package file without writing the rest of the package.
+
+        The result is not a valid package; this is for cleaning up after an error.
+        """
+        self._stream.close()
+        self._phys_writer.close()
+
+    def close(self, pkg_rels: Relationships, parts: Iterable[Part]):
+        """Complete the streamed part and write `pkg_rels` and `parts` to the package.
+
+        `parts` includes the streamed part, for which only its rels item is written.
+        """
+        self._stream.close()
+        phys_writer = self._phys_writer
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+        PackageWriter._write_parts(phys_writer, parts, self._partname)
+        phys_writer.close()
+
+    def write(self, data: bytes):
+        """Append `data` to the blob of the streamed part."""
+        self._stream.write(data)
+
+
+class _ChunkSink:
+    """Write-only stream collecting the bytes written to it until they are popped.
+
+    It has no `tell()` or `seek()`, so a zip file written to it is written as to any
+    stream that cannot seek, each member followed by a data descriptor.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def flush(self):
+        pass
+
+    def pop(self) -> Iterator[bytes]:
+        """Generate zero-or-one chunk of all the bytes written since the last pop."""
+        if not self._chunks:
+            return
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        yield chunk
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
 class _ContentTypesItem:
     """Service class that composes a content types item ([Content_Types].xml) based on a
     list of parts.
@@ -2,21 +2,55 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any, Dict, cast
 
 from docx.opc.oxml import CT_Relationships
 
 if TYPE_CHECKING:
+    from docx.opc.package import _PartRegistry  # pyright: ignore[reportPrivateUsage]
     from docx.opc.part import Part
 
 
 class Relationships(Dict[str, "_Relationship"]):
-    """Collection object for |_Relationship| instances, having list semantics."""
+    """Collection object for |_Relationship| instances, having list semantics.
 
-    def __init__(self, baseURI: str):
+    Relationships are indexed by reltype and by target as they are added (by
+    `add_relationship()` or item assignment) and removed (by `del`), so finding a
+    relationship or the next available rId does not scan the collection.
+    """
+
+    def __init__(self, baseURI: str, reuse_rId_gaps: bool = True):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
+        self._reuse_rId_gaps = reuse_rId_gaps
         self._target_parts_by_rId: dict[str, Any] = {}
+        self._rels_by_target: dict[tuple[str, Part | str, bool], list[_Relationship]] = {}
+        self._rels_by_reltype: dict[str, list[_Relationship]] = {}
+        self._rId_numbers: set[int] = set()
+        #: Registry of the parts of the package the source of these relationships belongs
+        #: to, notified as relationships are added and removed. Set by the registry.
+        self.part_registry: _PartRegistry | None = None
+        # -- every rId number below this one is in use --
+        self._lowest_free_rId_number = 1
+        self._highest_rId_number = 0
+
+    def __delitem__(self, rId: str):
+        self._unindex(rId, self[rId])
+        super(Relationships, self).__delitem__(rId)
+        if self.part_registry is not None:
+            self.part_registry.invalidate()
+
+    def __setitem__(self, rId: str, rel: _Relationship):
+        part_registry = self.part_registry
+        if rId in self:
+            self._unindex(rId, self[rId])
+            if part_registry is not None:
+                part_registry.invalidate()
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rId, rel)
+        if part_registry is not None and not rel.is_external:
+            part_registry.register(rel.target_part)
 
     def add_relationship(
         self, reltype: str, target: Part | str, rId: str, is_external: bool = False
@@ -58,6 +92,21 @@ class Relationships(Dict[str, "_Relationship"]):
         collection."""
         return self._target_parts_by_rId
 
+    @property
+    def reuse_rId_gaps(self) -> bool:
+        """True when a new relationship takes the lowest rId not in use.
+
+        This is the default, e.g. 'rId2' is used for a new relationship when the
+        collection holds 'rId1' and 'rId3'. When False, a new relationship is always
+        numbered above the highest rId ever in the collection, so the rId of a dropped
+        relationship is never reassigned. Either way the next rId is found without a scan.
+        """
+        return self._reuse_rId_gaps
+
+    @reuse_rId_gaps.setter
+    def reuse_rId_gaps(self, value: bool):
+        self._reuse_rId_gaps = value
+
     @property
     def xml(self) -> str:
         """Serialize this relationship collection into XML suitable for storage as a
@@ -72,19 +121,8 @@ class Relationships(Dict[str, "_Relationship"]):
     ) -> _Relationship | None:
         """Return relationship of matching `reltype`, `target`, and `is_external` from
         collection, or None if not found."""
-
-        def matches(rel: _Relationship, reltype: str, target: Part | str, is_external: bool):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            return rel_target == target
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_target.get((reltype, target, is_external))
+        return matching[0] if matching else None
 
     def _get_rel_of_type(self, reltype: str):
         """Return single relationship of type `reltype` from the collection.
@@ -92,7 +130,7 @@ class Relationships(Dict[str, "_Relationship"]):
         Raises |KeyError| if no matching relationship is found. Raises |ValueError| if
         more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
+        matching = self._rels_by_reltype.get(reltype, [])
         if len(matching) == 0:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
@@ -101,14 +139,58 @@ class Relationships(Dict[str, "_Relationship"]):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    def _index(self, rId: str, rel: _Relationship):
+        """Add `rel`, stored under `rId`, to the lookup indexes."""
+        self._rels_by_target.setdefault(self._target_key(rel), []).append(rel)
+        self._rels_by_reltype.setdefault(rel.reltype, []).append(rel)
+        n = _rId_number(rId)
+        if n is not None:
+            self._rId_numbers.add(n)
+            self._highest_rId_number = max(self._highest_rId_number, n)
+
     @property
-    def _next_rId(self) -> str:  # pyright: ignore[reportReturnType]
-        """Next available rId in collection, starting from 'rId1' and making use of any
-        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3']."""
-        for n in range(1, len(self) + 2):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+    def _next_rId(self) -> str:
+        """Next available rId in collection, starting from 'rId1'.
+
+        Any gaps in numbering are used when `reuse_rId_gaps` is True, e.g. 'rId2' for
+        rIds ['rId1', 'rId3'].
+        """
+        if not self._reuse_rId_gaps:
+            return "rId%d" % (self._highest_rId_number + 1)
+        n = self._lowest_free_rId_number
+        while n in self._rId_numbers:
+            n += 1
+        self._lowest_free_rId_number = n
+        return "rId%d" % n
+
+    @staticmethod
+    def _target_key(rel: _Relationship) -> tuple[str, Part | str, bool]:
+        """Key of `rel` in the by-target index; the same for all equivalent relationships."""
+        target = rel.target_ref if rel.is_external else rel.target_part
+        return (rel.reltype, target, rel.is_external)
+
+    def _unindex(self, rId: str, rel: _Relationship):
+        """Remove `rel`, stored under `rId`, from the lookup indexes."""
+        key = self._target_key(rel)
+        self._rels_by_target[key].remove(rel)
+        if not self._rels_by_target[key]:
+            del self._rels_by_target[key]
+        self._rels_by_reltype[rel.reltype].remove(rel)
+        if not self._rels_by_reltype[rel.reltype]:
+            del self._rels_by_reltype[rel.reltype]
+        n = _rId_number(rId)
+        if n is not None:
+            self._rId_numbers.discard(n)
+            self._lowest_free_rId_number = min(self._lowest_free_rId_number, n)
+
+
+_rId_re = re.compile(r"rId([1-9][0-9]*)")
+
+
+def _rId_number(rId: object) -> int | None:
+    """The number in `rId` when it has the form produced by `_next_rId`, like 'rId19'."""
+    match = _rId_re.fullmatch(rId) if isinstance(rId, str) else None
+    return int(match.group(1)) if match else None
 
 
 class _Relationship:
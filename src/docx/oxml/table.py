@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, cast
+import re
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence, cast
+from xml.sax.saxutils import escape
 
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE, WD_TABLE_DIRECTION
 from docx.exceptions import InvalidSpanError
@@ -153,6 +155,10 @@ class CT_Tbl(BaseOxmlElement):
     tblGrid: CT_TblGrid = OneAndOnlyOne("w:tblGrid")  # pyright: ignore[reportAssignmentType]
     tr = ZeroOrMore("w:tr")
 
+    # -- layout grid of this table cached by `docx.table.Table`, shared by each |Table|
+    # -- proxying this element; see `Table._layout_grid` --
+    layout_grid: tuple[tuple[int, Any], int, list[Any]] | None = None
+
     @property
     def bidiVisual_val(self) -> bool | None:
         """Value of `./w:tblPr/w:bidiVisual/@w:val` or |None| if not present.
@@ -172,6 +178,23 @@ class CT_Tbl(BaseOxmlElement):
         else:
             tblPr.get_or_add_bidiVisual().val = bool(value)
 
+    def add_trs(self, rows: Iterable[Sequence[str]]) -> list[CT_Row]:
+        """Return `w:tr` elements newly appended for each sequence of cell text in `rows`.
+
+        The XML for all rows is generated and parsed in a single pass, which is much
+        faster than adding and populating each cell individually. Each row has one cell
+        per grid column; a row having fewer items than the grid has columns is padded with
+        empty cells, like those of a new table. The XML of a cell having an item is the same
+        as that produced by assigning the item to `_Cell.text`, even for an empty string,
+        which produces a paragraph having an empty run. Raises |ValueError| (and adds no
+        rows) if a row has more items than the table has columns.
+        """
+        col_widths = [gridCol.w for gridCol in self.tblGrid.gridCol_lst]
+        trs_xml = "".join(self._text_tr_xml(row, col_widths) for row in rows)
+        trs = cast(CT_Tbl, parse_xml(f"<w:tbl {nsdecls('w')}>{trs_xml}</w:tbl>")).tr_lst
+        self.extend(trs)
+        return trs
+
     @property
     def col_count(self):
         """The number of grid columns in this table."""
@@ -244,6 +267,56 @@ class CT_Tbl(BaseOxmlElement):
     def _trs_xml(cls, row_count: int, col_count: int, col_width: Length) -> str:
         return f"  <w:tr>\n{cls._tcs_xml(col_count, col_width)}  </w:tr>\n" * row_count
 
+    @classmethod
+    def _text_tr_xml(cls, texts: Sequence[str], col_widths: Sequence[Length | None]) -> str:
+        """Return XML for a `w:tr` having a cell with each of `texts`, one per grid column."""
+        if len(texts) > len(col_widths):
+            raise ValueError(
+                "row has %d cells but table has only %d columns" % (len(texts), len(col_widths))
+            )
+        tcs_xml: list[str] = []
+        for idx, width in enumerate(col_widths):
+            tcPr_xml = (
+                ""
+                if width is None
+                else f'<w:tcPr><w:tcW w:type="dxa" w:w="{width.twips}"/></w:tcPr>'
+            )
+            p_xml = (
+                f"<w:p><w:r>{cls._r_content_xml(texts[idx])}</w:r></w:p>"
+                if idx < len(texts)
+                else "<w:p/>"
+            )
+            tcs_xml.append(f"<w:tc>{tcPr_xml}{p_xml}</w:tc>")
+        return f"<w:tr>{''.join(tcs_xml)}</w:tr>"
+
+    @staticmethod
+    def _r_content_xml(text: str) -> str:
+        """Return XML for the run content of `text`, like that produced by `CT_R.text`.
+
+        Each tab becomes a `w:tab`, each carriage-return or line-feed a `w:br`, and each
+        remaining stretch of characters a `w:t`. Raises |ValueError| when `text` has a
+        character that cannot appear in XML, like a NUL or other control character, as
+        assigning it to `CT_R.text` does.
+        """
+        if _invalid_xml_chars.search(text):
+            raise ValueError(
+                "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control"
+                " characters"
+            )
+        xml: list[str] = []
+        for token in _run_text_splitter.split(text):
+            if not token:
+                continue
+            if token == "\t":
+                xml.append("<w:tab/>")
+            elif token in "\r\n":
+                xml.append("<w:br/>")
+            elif len(token.strip()) < len(token):
+                xml.append(f'<w:t xml:space="preserve">{escape(token)}</w:t>')
+            else:
+                xml.append(f"<w:t>{escape(token)}</w:t>")
+        return "".join(xml)
+
     @classmethod
     def _tcs_xml(cls, col_count: int, col_width: Length) -> str:
         return (
@@ -256,6 +329,11 @@ class CT_Tbl(BaseOxmlElement):
         ) * col_count
 
 
+# -- characters lxml refuses in text, a lone surrogate because it cannot be encoded --
+_invalid_xml_chars = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+_run_text_splitter = re.compile(r"([\t\r\n])")
+
+
 class CT_TblGrid(BaseOxmlElement):
     """`w:tblGrid` element.
 
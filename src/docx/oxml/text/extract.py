@@ -0,0 +1,102 @@
+# pyright: reportPrivateUsage=false
+
+"""Fast extraction of the text in runs, paragraphs, and block-item containers.
+
+`BaseOxmlElement.xpath()` compiles its expression and registers every known namespace
+prefix on each call, and run inner-content elements each produce their text through a
+Python `__str__()` call. That overhead dominates text extraction from a large document.
+The functions here get the same text using XPath expressions compiled once at import
+time and a tag-to-text dispatch table.
+
+The text produced is the same as that of the `__str__()` method of each run
+inner-content element class, e.g. `CT_Br` and `CT_Text`; the two must be kept in sync.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, cast
+
+from lxml import etree
+
+from docx.oxml.ns import nsmap, qn
+
+_namespaces = {"w": nsmap["w"]}
+
+_RUN_CONTENT = (
+    "*[self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab or self::w:t"
+    " or self::w:tab]"
+)
+
+_hyperlink_content = etree.XPath("./w:r/" + _RUN_CONTENT, namespaces=_namespaces)
+_paragraph_content = etree.XPath(
+    "(./w:r | ./w:hyperlink/w:r)/" + _RUN_CONTENT, namespaces=_namespaces
+)
+_run_content = etree.XPath("./" + _RUN_CONTENT, namespaces=_namespaces)
+
+_br = qn("w:br")
+_br_type = qn("w:type")
+_p = qn("w:p")
+_t = qn("w:t")
+_tbl = qn("w:tbl")
+_tc = qn("w:tc")
+_tr = qn("w:tr")
+
+# -- text of run inner-content elements whose text does not depend on the element --
+_text_for_tag = {
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+    qn("w:ptab"): "\t",
+    qn("w:tab"): "\t",
+}
+
+
+def hyperlink_text(hyperlink: etree._Element) -> str:
+    """Text of the runs in `w:hyperlink` element `hyperlink`."""
+    return _text_of(_hyperlink_content(hyperlink))
+
+
+def iter_block_text(element: etree._Element) -> Iterator[str]:
+    """Generate the text of each paragraph in block-item container `element`.
+
+    `element` is a `w:body`, `w:tc`, or other element having `w:p` and `w:tbl` children.
+    Paragraphs in a table are included, cell by cell from left to right and top to
+    bottom, such that each text is generated in document order. Like `w:p` and `w:tbl`
+    elements in general, those nested in a `w:ins` or other "wrapper" element are
+    skipped.
+    """
+    # -- child iteration rather than XPath here; a "./w:p | ./w:tbl" union is quadratic in
+    # -- the number of blocks because libxml2 merges the node-sets pairwise
+    for block in element.iterchildren(_p, _tbl):
+        if block.tag == _p:
+            yield paragraph_text(block)
+            continue
+        for tr in block.iterchildren(_tr):
+            for tc in tr.iterchildren(_tc):
+                yield from iter_block_text(tc)
+
+
+def paragraph_text(p: etree._Element) -> str:
+    """Text of the runs in `w:p` element `p`, including those in a hyperlink."""
+    return _text_of(_paragraph_content(p))
+
+
+def run_text(r: etree._Element) -> str:
+    """Text of the inner-content of `w:r` element `r`."""
+    return _text_of(_run_content(r))
+
+
+def _text_of(elements: List[etree._Element]) -> str:
+    """Text equivalent of `elements`, a sequence of run inner-content elements."""
+    text_for_tag = _text_for_tag
+    texts: List[str] = []
+    for e in elements:
+        tag = e.tag
+        if tag == _t:
+            texts.append(e.text or "")
+        elif tag == _br:
+            # -- only a line break has a text equivalent; a page or column break does not --
+            if e.get(_br_type, "textWrapping") == "textWrapping":
+                texts.append("\n")
+        else:
+            texts.append(text_for_tag[cast(str, tag)])
+    return "".join(texts)
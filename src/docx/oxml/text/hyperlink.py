@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List
 
 from docx.oxml.simpletypes import ST_OnOff, ST_String, XsdString
+from docx.oxml.text.extract import hyperlink_text
 from docx.oxml.text.run import CT_R
 from docx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -42,4 +43,4 @@ class CT_Hyperlink(BaseOxmlElement):
 
         `CT_Hyperlink` stores the hyperlink-text as one or more `w:r` children.
         """
-        return "".join(r.text for r in self.xpath("w:r"))
+        return hyperlink_text(self)
@@ -8,6 +8,7 @@ from docx.oxml.drawing import CT_Drawing
 from docx.oxml.ns import qn
 from docx.oxml.parser import OxmlElement
 from docx.oxml.simpletypes import ST_BrClear, ST_BrType
+from docx.oxml.text.extract import run_text
 from docx.oxml.text.font import CT_RPr
 from docx.oxml.xmlchemy import BaseOxmlElement, OptionalAttribute, ZeroOrMore, ZeroOrOne
 from docx.shared import TextAccumulator
@@ -133,9 +134,7 @@ class CT_R(BaseOxmlElement):
         Inner-content child elements like `w:tab` are translated to their text
         equivalent.
         """
-        return "".join(
-            str(e) for e in self.xpath("w:br | w:cr | w:noBreakHyphen | w:ptab | w:t | w:tab")
-        )
+        return run_text(self)
 
     @text.setter
     def text(self, text: str):  # pyright: ignore[reportIncompatibleMethodOverride]
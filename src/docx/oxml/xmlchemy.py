@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING, Any, Callable, Sequence, Type, TypeVar
 
@@ -19,6 +20,17 @@ if TYPE_CHECKING:
     from docx.oxml.simpletypes import BaseSimpleType
 
 
+@functools.lru_cache(maxsize=1024)
+def compiled_xpath(xpath_str: str) -> etree.XPath:
+    """Return an `etree.XPath` object for `xpath_str` using the standard Open XML `nsmap`.
+
+    Compiling an XPath expression costs several times as much as evaluating a typical
+    one, so compiled expressions are kept in a bounded LRU cache shared by all elements
+    in the process. Use `compiled_xpath.cache_info()` to get the hit and miss counts.
+    """
+    return etree.XPath(xpath_str, namespaces=nsmap)
+
+
 def serialize_for_reading(element: ElementBase):
     """Serialize `element` to human-readable XML suitable for tests.
 
@@ -688,8 +700,9 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """Override of `lxml` _Element.xpath() method.
 
         Provides standard Open XML namespace mapping (`nsmap`) in centralized location.
+        The expression is compiled only on its first use, see `compiled_xpath()`.
         """
-        return super().xpath(xpath_str, namespaces=nsmap)
+        return compiled_xpath(xpath_str)(self)
 
     @property
     def _nsptag(self) -> str:
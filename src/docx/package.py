@@ -48,13 +48,23 @@ class Package(OpcPackage):
 
 
 class ImageParts:
-    """Collection of |ImagePart| objects corresponding to images in the package."""
+    """Collection of |ImagePart| objects corresponding to images in the package.
+
+    Image parts are indexed by partname number as they are added, so the next available
+    image partname is found without a scan. The SHA1 index used to find an existing
+    image part is built on first use; this avoids reading and hashing the blob of every
+    image in a document that never has an image added.
+    """
 
     def __init__(self):
         self._image_parts: list[ImagePart] = []
+        self._image_part_set: set[ImagePart] = set()
+        self._used_idxs: set[int | None] = set()
+        self._lowest_free_idx_hint = 1
+        self._image_parts_by_sha1: dict[str, ImagePart] | None = None
 
     def __contains__(self, item: object):
-        return self._image_parts.__contains__(item)
+        return self._image_part_set.__contains__(item)
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,6 +74,10 @@ class ImageParts:
 
     def append(self, item: ImagePart):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._used_idxs.add(item.partname.idx)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| object containing image identified by `image_descriptor`.
@@ -87,10 +101,12 @@ class ImageParts:
     def _get_by_sha1(self, sha1: str) -> ImagePart | None:
         """Return the image part in this collection having a SHA1 hash matching `sha1`,
         or |None| if not found."""
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._image_parts_by_sha1 is None:
+            image_parts_by_sha1: dict[str, ImagePart] = {}
+            for image_part in self._image_parts:
+                image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+            self._image_parts_by_sha1 = image_parts_by_sha1
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext: str) -> PackURI:
         """The next available image partname, starting from ``/word/media/image1.{ext}``
@@ -99,12 +115,9 @@ class ImageParts:
         The partname is unique by number, without regard to the extension. `ext` does
         not include the leading period.
         """
-
-        def image_partname(n: int) -> PackURI:
-            return PackURI("/word/media/image%d.%s" % (n, ext))
-
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self) + 1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self) + 1)
+        # -- image parts are never removed, so no number below the hint can become free --
+        n = self._lowest_free_idx_hint
+        while n in self._used_idxs:
+            n += 1
+        self._lowest_free_idx_hint = n
+        return PackURI("/word/media/image%d.%s" % (n, ext))
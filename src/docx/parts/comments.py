@@ -23,16 +23,10 @@ if TYPE_CHECKING:
 class CommentsPart(StoryPart):
     """Container part for comments added to the document."""
 
-    def __init__(
-        self, partname: PackURI, content_type: str, element: CT_Comments, package: Package
-    ):
-        super().__init__(partname, content_type, element, package)
-        self._comments = element
-
     @property
     def comments(self) -> Comments:
         """A |Comments| proxy object for the `w:comments` root element of this part."""
-        return Comments(self._comments, self)
+        return Comments(cast("CT_Comments", self.element), self)
 
     @classmethod
     def default(cls, package: Package) -> Self:
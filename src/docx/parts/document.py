@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterator, Mapping, cast
 
 from docx.document import Document
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -16,6 +16,8 @@ from docx.shape import InlineShapes
 from docx.shared import lazyproperty
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from docx.comments import Comments
     from docx.enum.style import WD_STYLE_TYPE
     from docx.opc.coreprops import CoreProperties
@@ -108,10 +110,29 @@ class DocumentPart(StoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def iter_save_chunks(
+        self, executor: Executor | None = None, compression: Mapping[str, int] | None = None
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this document, saved, one chunk at a time.
+
+        Parts are compressed concurrently using `executor` when one is provided, each as
+        specified by the `compression` policy.
+        """
+        return self.package.iter_save_chunks(executor, compression)
+
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        executor: Executor | None = None,
+        compression: Mapping[str, int] | None = None,
+    ):
         """Save this document to `path_or_stream`, which can be either a path to a
-        filesystem location (a string) or a file-like object."""
-        self.package.save(path_or_stream)
+        filesystem location (a string) or a file-like object.
+
+        Parts are compressed concurrently using `executor` when one is provided, each as
+        specified by the `compression` policy.
+        """
+        self.package.save(path_or_stream, executor, compression)
 
     @property
     def settings(self) -> Settings:
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
+import tempfile
+from concurrent.futures import Executor
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
@@ -380,3 +385,63 @@ class TextAccumulator:
         text = self._separator.join(self._texts)
         self._texts.clear()
         yield text
+
+
+# -- asyncio stream support -----------------------------------------------------------
+
+# -- size of each read from or write to an async stream --
+ASYNC_CHUNK_SIZE = 64 * 1024
+
+# -- a spooled file is held in memory up to this size, then moved to a temporary file --
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+def is_async_readable(stream: Any) -> bool:
+    """True if `stream` is an async stream, one having a coroutine `read()` method."""
+    return inspect.iscoroutinefunction(getattr(stream, "read", None))
+
+
+def is_async_writable(stream: Any) -> bool:
+    """True if `stream` is an async stream, one having a coroutine `write()` or `drain()`."""
+    return inspect.iscoroutinefunction(
+        getattr(stream, "write", None)
+    ) or inspect.iscoroutinefunction(getattr(stream, "drain", None))
+
+
+async def spool_from_async(stream: t.AsyncReadable, executor: Executor | None) -> IO[bytes]:
+    """Return a spool file, rewound, holding the rest of the bytes read from `stream`.
+
+    The spool is a seekable binary file held in memory until it grows larger than
+    `SPOOL_MAX_SIZE`, after which it is moved to a temporary file on disk, so a very large
+    stream is not held in memory. Reads are awaited, so the event loop is free while
+    waiting for data. Once the spool is on disk, each write to it is made in `executor`, or
+    the loop's default executor when `executor` is |None|.
+    """
+    loop = asyncio.get_running_loop()
+    spool = cast(IO[bytes], tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE))  # noqa: SIM115
+    size = 0
+    while True:
+        chunk = await stream.read(ASYNC_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > SPOOL_MAX_SIZE:
+            await loop.run_in_executor(executor, spool.write, chunk)
+        else:
+            spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+async def write_async(stream: t.AsyncWritable, data: bytes) -> None:
+    """Write `data` to async `stream`, awaiting the write and then `stream.drain()`.
+
+    `drain()` is awaited when `stream` has one, so a slow reader of `stream` holds up the
+    writer rather than data piling up in memory.
+    """
+    written = stream.write(data)
+    if inspect.isawaitable(written):
+        await written
+    drain = getattr(stream, "drain", None)
+    if drain is not None:
+        await drain()
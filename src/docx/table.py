@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, cast, overload
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence, cast, overload
 
 from typing_extensions import TypeAlias
 
@@ -42,18 +42,43 @@ class Table(StoryChild):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
+        self._reset_grid()
         return _Column(gridCol, self)
 
     def add_row(self):
         """Return a |_Row| instance, newly added bottom-most to the table."""
         tbl = self._tbl
+        layout_grid = self._current_layout_grid()
         tr = tbl.add_tr()
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             if gridCol.w is not None:
                 tc.width = gridCol.w
+        # -- a new row has one unmerged cell per grid column, so just extend the grid --
+        if layout_grid is not None:
+            _, col_count, cells = layout_grid
+            cells.extend(_Cell(tc, self) for tc in tr.tc_lst)
+            tbl.layout_grid = (_children_key(tbl), col_count, cells)
         return _Row(tr, self)
 
+    def add_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        """Add a row to the bottom of this table for each sequence of cell text in `rows`.
+
+        This is the fast way to fill a large table. The rows are generated in a single
+        batch rather than cell by cell, with the same result as adding each row with
+        `add_row()` and assigning each string to the `text` property of the corresponding
+        cell. Each sequence provides the text for cells left to right; it may be shorter
+        than the column count, in which case the remaining cells are left empty, but
+        |ValueError| is raised if it is longer.
+        """
+        layout_grid = self._current_layout_grid()
+        trs = self._tbl.add_trs(rows)
+        # -- new rows have one unmerged cell per grid column, so just extend the grid --
+        if layout_grid is not None and trs:
+            _, col_count, cells = layout_grid
+            cells.extend(_Cell(tc, self) for tr in trs for tc in tr.tc_lst)
+            self._tbl.layout_grid = (_children_key(self._tbl), col_count, cells)
+
     @property
     def alignment(self) -> WD_TABLE_ALIGNMENT | None:
         """Read/write.
@@ -92,9 +117,7 @@ class Table(StoryChild):
 
     def column_cells(self, column_idx: int) -> list[_Cell]:
         """Sequence of cells in the column at `column_idx` in this table."""
-        cells = self._cells
-        idxs = range(column_idx, len(cells), self._column_count)
-        return [cells[idx] for idx in idxs]
+        return self._cells[column_idx :: self._column_count]
 
     @lazyproperty
     def columns(self):
@@ -160,14 +183,8 @@ class Table(StoryChild):
     def table_direction(self, value: WD_TABLE_DIRECTION | None):
         self._element.bidiVisual_val = value
 
-    @property
-    def _cells(self) -> list[_Cell]:
-        """A sequence of |_Cell| objects, one for each cell of the layout grid.
-
-        If the table contains a span, one or more |_Cell| object references are
-        repeated.
-        """
-        col_count = self._column_count
+    def _build_cells(self, col_count: int) -> list[_Cell]:
+        """A new sequence of |_Cell| objects, one for each cell of the layout grid."""
         cells: list[_Cell] = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -180,9 +197,53 @@ class Table(StoryChild):
         return cells
 
     @property
-    def _column_count(self):
+    def _cells(self) -> list[_Cell]:
+        """A sequence of |_Cell| objects, one for each cell of the layout grid.
+
+        If the table contains a span, one or more |_Cell| object references are
+        repeated.
+        """
+        return self._layout_grid[1]
+
+    @property
+    def _column_count(self) -> int:
         """The number of grid columns in this table."""
-        return self._tbl.col_count
+        return self._layout_grid[0]
+
+    def _current_layout_grid(self) -> tuple[Any, int, list[_Cell]] | None:
+        """The layout grid cached on the `w:tbl` element, |None| if absent or stale."""
+        layout_grid = self._tbl.layout_grid
+        if layout_grid is None or layout_grid[0] != _children_key(self._tbl):
+            return None
+        return layout_grid
+
+    @property
+    def _layout_grid(self) -> tuple[int, list[_Cell]]:
+        """The `(column_count, cells)` pair of the layout grid of this table.
+
+        The grid is built once and cached on the `w:tbl` element, where it is shared by
+        each |Table| object for that element, so cell access by grid position is O(1).
+        The cache is kept current by `.add_row()`, `.add_rows()`, `.add_column()`, and
+        `_Cell.merge()`, and is rebuilt when the `w:tbl` element no longer has the number
+        of children and the last child it was built for, as after a `w:tr` element is
+        added to or removed from the XML directly. Changes made directly to the XML within
+        a row, like removing a `w:tc` element, are not detected.
+        """
+        layout_grid = self._current_layout_grid()
+        if layout_grid is None:
+            tbl = self._tbl
+            col_count = tbl.col_count
+            layout_grid = (_children_key(tbl), col_count, self._build_cells(col_count))
+            tbl.layout_grid = layout_grid
+        return layout_grid[1], layout_grid[2]
+
+    def _reset_grid(self):
+        """Discard the cached layout-grid, causing it to be rebuilt on next access.
+
+        Called after a change to the table structure that cannot be applied to the cached
+        grid directly.
+        """
+        self._tbl.layout_grid = None
 
     @property
     def _tblPr(self) -> CT_TblPr:
@@ -242,6 +303,7 @@ class _Cell(BlockItemContainer):
         """
         tc, tc_2 = self._tc, other_cell._tc
         merged_tc = tc.merge(tc_2)
+        self._parent.table._reset_grid()  # pyright: ignore[reportPrivateUsage]
         return _Cell(merged_tc, self._parent)
 
     @property
@@ -268,7 +330,7 @@ class _Cell(BlockItemContainer):
         Assigning a string to this property replaces all existing content with a single
         paragraph containing the assigned text in a single run.
         """
-        return "\n".join(p.text for p in self.paragraphs)
+        return "\n".join(p.text for p in self._tc.p_lst)
 
     @text.setter
     def text(self, text: str):
@@ -535,3 +597,12 @@ class _Rows(Parented):
     def table(self) -> Table:
         """Reference to the |Table| object this row collection belongs to."""
         return self._parent.table
+
+
+def _children_key(tbl: CT_Tbl) -> tuple[int, Any]:
+    """The number of child elements of `tbl` and its last one, found in constant time.
+
+    The last child is |None| when `tbl` has none.
+    """
+    child_count = len(tbl)
+    return child_count, tbl[-1] if child_count else None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable
 
 from typing_extensions import Protocol
 
@@ -11,6 +11,27 @@ if TYPE_CHECKING:
     from docx.parts.story import StoryPart
 
 
+class AsyncReadable(Protocol):
+    """A binary stream read from asyncio code, like `asyncio.StreamReader`.
+
+    Its `read()` method is a coroutine returning at most `n` bytes, or `b""` at the end of
+    the stream.
+    """
+
+    async def read(self, n: int = -1) -> bytes: ...
+
+
+class AsyncWritable(Protocol):
+    """A binary stream written from asyncio code.
+
+    Either its `write()` method is a coroutine, as for a file opened with `aiofiles`, or
+    it has a `drain()` coroutine to wait on after each write, as `asyncio.StreamWriter`
+    does.
+    """
+
+    def write(self, data: bytes) -> Awaitable[Any] | Any: ...
+
+
 class ProvidesStoryPart(Protocol):
     """An object that provides access to the StoryPart.
 
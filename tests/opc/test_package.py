@@ -4,17 +4,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, cast
+
 import pytest
 
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
-from docx.opc.package import OpcPackage, Unmarshaller
+from docx.opc.package import OpcPackage, Unmarshaller, _PartRegistry
 from docx.opc.packuri import PACKAGE_URI, PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
+from docx.opc.pkgwriter import StreamingPackageWriter
 from docx.opc.rel import Relationships, _Relationship
 
+from ..unitutil.file import docx_path
 from ..unitutil.mock import (
     FixtureRequest,
     Mock,
@@ -27,6 +31,9 @@ from ..unitutil.mock import (
     property_mock,
 )
 
+if TYPE_CHECKING:
+    from docx.package import Package
+
 
 class DescribeOpcPackage:
     """Unit-test suite for `docx.opc.package.OpcPackage` objects."""
@@ -38,7 +45,7 @@ class DescribeOpcPackage:
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False, None)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_)
         assert isinstance(pkg, OpcPackage)
 
@@ -77,7 +84,7 @@ class DescribeOpcPackage:
         with patch.object(OpcPackage, "iter_parts", return_value=parts):
             assert pkg.parts == [parts[0], parts[1]]
 
-    def it_can_iterate_over_parts_by_walking_rels_graph(self, rels_prop_: Mock):
+    def it_can_iterate_over_parts_by_walking_rels_graph(self):
         # +----------+       +--------+
         # | pkg_rels |-----> | part_1 |
         # +----------+       +--------+
@@ -86,32 +93,96 @@ class DescribeOpcPackage:
         #   external         +--------+
         #                    | part_2 |
         #                    +--------+
-        part1, part2 = (Mock(name="part1"), Mock(name="part2"))
-        part1.rels = {1: Mock(name="rel1", is_external=False, target_part=part2)}
-        part2.rels = {1: Mock(name="rel2", is_external=False, target_part=part1)}
         pkg = OpcPackage()
-        rels_prop_.return_value = {
-            1: Mock(name="rel3", is_external=False, target_part=part1),
-            2: Mock(name="rel4", is_external=True),
-        }
+        part1 = _part("/part1.xml", pkg)
+        part2 = _part("/part2.xml", pkg)
+        part1.relate_to(part2, RT.FOOTER)
+        part2.relate_to(part1, RT.HEADER)
+        pkg.relate_to(part1, RT.OFFICE_DOCUMENT)
+        pkg.rels.get_or_add_ext_rel(RT.HYPERLINK, "https://example.com")
         # verify -----------------------
-        assert part1 in pkg.iter_parts()
-        assert part2 in pkg.iter_parts()
-        assert len(list(pkg.iter_parts())) == 2
+        assert list(pkg.iter_parts()) == [part1, part2]
+
+    def it_registers_each_part_reachable_from_a_part_related_to(self):
+        pkg = OpcPackage()
+        document_part = _part("/document.xml", pkg)
+        pkg.relate_to(document_part, RT.OFFICE_DOCUMENT)
+        assert pkg.parts == [document_part]
+        header_part = _part("/header1.xml", pkg)
+        image_part = _part("/media/image1.png", pkg)
+        header_part.relate_to(image_part, RT.IMAGE)
+
+        document_part.relate_to(header_part, RT.HEADER)
+
+        assert pkg.parts == [document_part, header_part, image_part]
+        assert pkg.next_partname("/header%d.xml") == "/header2.xml"
+
+    def and_it_drops_a_part_no_longer_related_to(self):
+        pkg = OpcPackage()
+        document_part = _part("/document.xml", pkg)
+        header_part = _part("/header1.xml", pkg)
+        image_part = _part("/media/image1.png", pkg)
+        pkg.relate_to(document_part, RT.OFFICE_DOCUMENT)
+        rId = document_part.relate_to(header_part, RT.HEADER)
+        document_part.relate_to(image_part, RT.IMAGE)
+        header_part.relate_to(image_part, RT.IMAGE)
+        assert pkg.parts == [document_part, header_part, image_part]
+
+        document_part.drop_rel(rId)
 
+        assert pkg.parts == [document_part, image_part]
+        assert pkg.next_partname("/header%d.xml") == "/header1.xml"
+
+    def and_it_reindexes_a_renamed_part(self):
+        pkg = OpcPackage()
+        header_part = _part("/header1.xml", pkg)
+        pkg.relate_to(header_part, RT.HEADER)
+        assert pkg.next_partname("/header%d.xml") == "/header2.xml"
+
+        header_part.partname = PackURI("/header2.xml")
+
+        assert pkg.next_partname("/header%d.xml") == "/header1.xml"
+
+    def it_finds_parts_and_partnames_in_a_package_having_thousands_of_parts(
+        self, request: FixtureRequest
+    ):
+        pkg = OpcPackage()
+        document_part = _part("/document.xml", pkg)
+        pkg.relate_to(document_part, RT.OFFICE_DOCUMENT)
+        pkg.parts
+        part_registry = pkg._part_registry
+        _add_ = method_mock(request, _PartRegistry, "_add", side_effect=_PartRegistry._add)
+
+        for _ in range(5000):
+            partname = pkg.next_partname("/word/header%d.xml")
+            header_part = _part(partname, pkg)
+            document_part.relate_to(header_part, RT.HEADER)
+            pkg.parts
+
+        assert len(pkg.parts) == 5001
+        assert pkg.parts[-1].partname == "/word/header5000.xml"
+        # -- each part is registered once, as it is related to, rather than the rels graph
+        # -- being walked again to find each partname, which is quadratic in the parts --
+        assert pkg._part_registry is part_registry
+        assert _add_.call_count == 5000
+
+    @pytest.mark.parametrize(
+        ("existing_partname_ns", "next_partname_n"),
+        [((), 1), ((1,), 2), ((1, 2), 3), ((2, 3), 1), ((1, 3), 2)],
+    )
     def it_can_find_the_next_available_vector_partname(
-        self, next_partname_fixture, iter_parts_, PackURI_, packuri_
+        self, existing_partname_ns: tuple[int, ...], next_partname_n: int
     ):
         """A vector partname is one with a numeric suffix, like header42.xml."""
-        parts_, expected_value = next_partname_fixture
-        iter_parts_.return_value = iter(parts_)
-        PackURI_.return_value = packuri_
         package = OpcPackage()
+        for n in existing_partname_ns:
+            part = _part("/foo/bar/baz%d.xml" % n, package)
+            package.relate_to(part, RT.HEADER)
 
         partname = package.next_partname(template="/foo/bar/baz%d.xml")
 
-        PackURI_.assert_called_once_with(expected_value)
-        assert partname is packuri_
+        assert isinstance(partname, PackURI)
+        assert partname == "/foo/bar/baz%d.xml" % next_partname_n
 
     def it_can_find_a_part_related_by_reltype(self, related_part_fixture_):
         pkg, reltype, related_part_ = related_part_fixture_
@@ -127,7 +198,86 @@ class DescribeOpcPackage:
         pkg.save(pkg_file_)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
-        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_)
+        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg.rels, parts_, None, None)
+
+    def it_can_generate_the_saved_package_a_chunk_at_a_time(
+        self, PackageWriter_: Mock, parts_prop_: Mock, parts_: list[Mock]
+    ):
+        parts_prop_.return_value = parts_
+        pkg = OpcPackage()
+
+        chunks = pkg.iter_save_chunks()
+
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        PackageWriter_.iter_write.assert_called_once_with(pkg.rels, parts_, None, None)
+        assert chunks is PackageWriter_.iter_write.return_value
+
+    def it_can_start_saving_with_a_part_blob_streamed(
+        self, pkg_file_: Mock, StreamingPackageWriter_: Mock, parts_prop_: Mock, parts_: list[Mock]
+    ):
+        parts_prop_.return_value = parts_
+        pkg = OpcPackage()
+
+        writer = pkg.open_part_stream(pkg_file_, PackURI("/word/document.xml"))
+
+        StreamingPackageWriter_.assert_called_once_with(pkg_file_, "/word/document.xml")
+        assert writer is StreamingPackageWriter_.return_value
+        for part in parts_:
+            part.before_marshal.assert_not_called()
+
+    def and_it_can_complete_saving_with_a_part_blob_streamed(
+        self, parts_prop_: Mock, parts_: list[Mock], streaming_writer_: Mock
+    ):
+        parts_prop_.return_value = parts_
+        pkg = OpcPackage()
+
+        pkg.close_part_stream(streaming_writer_)
+
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        streaming_writer_.close.assert_called_once_with(pkg.rels, parts_)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def it_can_clone_itself(self, lazy: bool):
+        package = OpcPackage.open(docx_path("having-images"))
+        package.rels.reuse_rId_gaps = False
+
+        clone = package.clone(lazy)
+
+        assert type(clone) is OpcPackage
+        assert clone.rels.reuse_rId_gaps is False
+        parts, clones = package.parts, clone.parts
+        assert [p.partname for p in clones] == [p.partname for p in parts]
+        for part, part_clone in zip(parts, clones):
+            assert part_clone is not part
+            assert part_clone.package is clone
+            assert part_clone.blob == part.blob
+            assert [
+                (rel.rId, rel.reltype, rel.is_external, rel.target_ref)
+                for rel in part_clone.rels.values()
+            ] == [
+                (rel.rId, rel.reltype, rel.is_external, rel.target_ref)
+                for rel in part.rels.values()
+            ]
+            assert all(
+                rel.is_external or rel.target_part.package is clone
+                for rel in part_clone.rels.values()
+            )
+
+    def and_its_clone_can_be_changed_independently(self):
+        package = OpcPackage.open(docx_path("having-images"))
+        document_part = cast(XmlPart, package.main_document_part)
+        blob = document_part.blob
+
+        clone = package.clone()
+        clone_document_part = cast(XmlPart, clone.main_document_part)
+        clone_document_part.element.remove(clone_document_part.element[0])
+        clone_document_part.relate_to("https://example.com", RT.HYPERLINK, is_external=True)
+
+        assert document_part.blob == blob
+        assert clone_document_part.blob != blob
+        assert len(clone_document_part.rels) == len(document_part.rels) + 1
 
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
@@ -169,16 +319,6 @@ class DescribeOpcPackage:
         part_related_by_.return_value = core_properties_part_
         return opc_package, core_properties_part_
 
-    @pytest.fixture(params=[((), 1), ((1,), 2), ((1, 2), 3), ((2, 3), 1), ((1, 3), 2)])
-    def next_partname_fixture(self, request, iter_parts_):
-        existing_partname_ns, next_partname_n = request.param
-        parts_ = [
-            instance_mock(request, Part, name="part[%d]" % idx, partname="/foo/bar/baz%d.xml" % n)
-            for idx, n in enumerate(existing_partname_ns)
-        ]
-        expected_value = "/foo/bar/baz%d.xml" % next_partname_n
-        return parts_, expected_value
-
     @pytest.fixture
     def related_part_fixture_(self, request: FixtureRequest, rels_prop_: Mock, rels_: Mock):
         related_part_ = instance_mock(request, Part, name="related_part_")
@@ -205,22 +345,10 @@ class DescribeOpcPackage:
     def _core_properties_part_prop_(self, request: FixtureRequest):
         return property_mock(request, OpcPackage, "_core_properties_part")
 
-    @pytest.fixture
-    def iter_parts_(self, request: FixtureRequest):
-        return method_mock(request, OpcPackage, "iter_parts")
-
     @pytest.fixture
     def PackageReader_(self, request: FixtureRequest):
         return class_mock(request, "docx.opc.package.PackageReader")
 
-    @pytest.fixture
-    def PackURI_(self, request: FixtureRequest):
-        return class_mock(request, "docx.opc.package.PackURI")
-
-    @pytest.fixture
-    def packuri_(self, request: FixtureRequest):
-        return instance_mock(request, PackURI)
-
     @pytest.fixture
     def PackageWriter_(self, request: FixtureRequest):
         return class_mock(request, "docx.opc.package.PackageWriter")
@@ -255,6 +383,14 @@ class DescribeOpcPackage:
     def Relationships_(self, request: FixtureRequest):
         return class_mock(request, "docx.opc.package.Relationships")
 
+    @pytest.fixture
+    def StreamingPackageWriter_(self, request: FixtureRequest):
+        return class_mock(request, "docx.opc.package.StreamingPackageWriter")
+
+    @pytest.fixture
+    def streaming_writer_(self, request: FixtureRequest):
+        return instance_mock(request, StreamingPackageWriter)
+
     @pytest.fixture
     def rel_(self, request: FixtureRequest):
         return instance_mock(request, _Relationship)
@@ -320,6 +456,28 @@ class DescribeUnmarshaller:
         ]
         assert parts == parts_dict_
 
+    def it_can_unmarshal_parts_lazily(
+        self, pkg_reader_, pkg_, part_factory_, parts_dict_, partnames_, content_types_, reltypes_
+    ):
+        partname_, partname_2_ = partnames_
+        content_type_, content_type_2_ = content_types_
+        reltype_, reltype_2_ = reltypes_
+        pkg_reader_.is_lazy = True
+        pkg_reader_.iter_lazy_sparts.return_value = (
+            (partname_, content_type_, reltype_, "spart_"),
+            (partname_2_, content_type_2_, reltype_2_, "spart_2_"),
+        )
+        part_factory_.load_lazily.side_effect = list(parts_dict_.values())
+
+        parts = Unmarshaller._unmarshal_parts(pkg_reader_, pkg_, part_factory_)
+
+        assert part_factory_.load_lazily.call_args_list == [
+            call(partname_, content_type_, reltype_, "spart_", pkg_),
+            call(partname_2_, content_type_2_, reltype_2_, "spart_2_", pkg_),
+        ]
+        assert part_factory_.call_args_list == []
+        assert parts == parts_dict_
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = "http://reltype"
@@ -437,7 +595,7 @@ class DescribeUnmarshaller:
             (partname_, content_type_, reltype_, blob_),
             (partname_2_, content_type_2_, reltype_2_, blob_2_),
         )
-        pkg_reader_ = instance_mock(request, PackageReader)
+        pkg_reader_ = instance_mock(request, PackageReader, is_lazy=False)
         pkg_reader_.iter_sparts.return_value = iter_spart_items
         return pkg_reader_
 
@@ -454,3 +612,11 @@ class DescribeUnmarshaller:
     @pytest.fixture
     def _unmarshal_relationships_(self, request: FixtureRequest):
         return method_mock(request, Unmarshaller, "_unmarshal_relationships", autospec=False)
+
+
+# -- module-level helpers --------------------------------------------------------------
+
+
+def _part(partname: str, package: OpcPackage) -> Part:
+    """Return a new part named `partname` belonging to `package`."""
+    return Part(PackURI(partname), "content/type", package=cast("Package", package))
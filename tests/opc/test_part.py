@@ -4,12 +4,17 @@
 
 from __future__ import annotations
 
+from zipfile import ZipInfo
+
 import pytest
+from lxml import etree
 
-from docx.opc.package import OpcPackage
+from docx.opc.package import OpcPackage, _PartRegistry
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
+from docx.opc.pkgreader import _SerializedPart
 from docx.opc.rel import Relationships, _Relationship
+from docx.oxml.ns import qn
 from docx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.cxml import element
@@ -45,6 +50,15 @@ class DescribePart:
         part.partname = PackURI("/new/part/name")
         assert part.partname == "/new/part/name"
 
+    def it_invalidates_the_part_registry_of_its_package_when_renamed(self, request: FixtureRequest):
+        part = Part(PackURI("/old/part/name"), "content/type")
+        part_registry_ = instance_mock(request, _PartRegistry)
+        part.rels.part_registry = part_registry_
+
+        part.partname = PackURI("/new/part/name")
+
+        part_registry_.invalidate.assert_called_once_with()
+
     def it_knows_its_content_type(self):
         part = Part(PackURI("/part/name"), "content/type")
         assert part.content_type == "content/type"
@@ -66,6 +80,63 @@ class DescribePart:
         part = Part(PackURI("/part/name"), "content/type", blob)
         assert part.blob is blob
 
+    def it_can_be_loaded_lazily(self, package_: Mock, source_: Mock):
+        part = Part.load_lazily(PackURI("/part/name"), "content/type", source_, package_)
+
+        assert isinstance(part, Part)
+        assert part.package is package_
+        assert source_.blob.call_count == 0
+
+    def it_reads_its_blob_from_its_source_on_first_access_when_lazy(self, source_: Mock):
+        source_.blob = b"abcde"
+        part = Part.load_lazily(PackURI("/part/name"), "content/type", source_, None)
+
+        assert part.blob == b"abcde"
+        source_.blob = b"changed"
+        assert part.blob == b"abcde"
+
+    def it_provides_its_source_when_unchanged_since_lazy_loading(self, source_: Mock):
+        source_.partname = PackURI("/part/name")
+        part = Part.load_lazily(PackURI("/part/name"), "content/type", source_, None)
+        assert part.pristine_source is source_
+
+    def but_not_after_it_is_renamed(self, source_: Mock):
+        source_.partname = PackURI("/part/name")
+        part = Part.load_lazily(PackURI("/part/name"), "content/type", source_, None)
+        part.partname = PackURI("/part/new-name")
+        assert part.pristine_source is None
+
+    def and_not_when_it_was_not_loaded_lazily(self):
+        part = Part(PackURI("/part/name"), "content/type", b"abcde")
+        assert part.pristine_source is None
+
+    def it_provides_its_source_while_its_blob_is_unread_even_once_renamed(self, source_: Mock):
+        source_.partname = PackURI("/part/name")
+        source_.blob = b"abcde"
+        part = Part.load_lazily(PackURI("/part/name"), "content/type", source_, None)
+        part.partname = PackURI("/part/new-name")
+
+        assert part.pending_source is source_
+        part.blob
+        assert part.pending_source is None
+
+    def it_can_clone_itself_into_another_package(self, package_: Mock, package_2_: Mock):
+        blob = b"abcde"
+        part = Part(PackURI("/part/name"), "content/type", blob, package_)
+        part.rels["rId1"] = Mock(name="rel")
+
+        clone = part.clone(package_2_)
+
+        assert type(clone) is Part
+        assert clone is not part
+        assert clone.partname == "/part/name"
+        assert clone.content_type == "content/type"
+        assert clone.blob is blob
+        assert clone.package is package_2_
+        assert len(clone.rels) == 0
+        assert part.package is package_
+        assert len(part.rels) == 1
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -76,6 +147,14 @@ class DescribePart:
     def package_(self, request: FixtureRequest):
         return instance_mock(request, OpcPackage)
 
+    @pytest.fixture
+    def package_2_(self, request: FixtureRequest):
+        return instance_mock(request, OpcPackage)
+
+    @pytest.fixture
+    def source_(self, request: FixtureRequest):
+        return instance_mock(request, _SerializedPart)
+
 
 class DescribePartRelationshipManagementInterface:
     """Unit-test suite for `docx.opc.package.Part` relationship behaviors."""
@@ -219,6 +298,19 @@ class DescribePartFactory:
         CustomPartClass_.load.assert_called_once_with(partname, content_type, blob, package)
         assert part is part_of_custom_type_
 
+    def it_can_construct_a_part_that_loads_lazily(
+        self, part_args_2_, DefaultPartClass_, part_of_default_type_
+    ):
+        partname, content_type, reltype, source, package = part_args_2_
+        DefaultPartClass_.load_lazily.return_value = part_of_default_type_
+
+        part = PartFactory.load_lazily(partname, content_type, reltype, source, package)
+
+        DefaultPartClass_.load_lazily.assert_called_once_with(
+            partname, content_type, source, package
+        )
+        assert part is part_of_default_type_
+
     def it_constructs_part_using_default_class_when_no_custom_registered(
         self, part_args_2_, DefaultPartClass_, part_of_default_type_
     ):
@@ -345,12 +437,100 @@ class DescribeXmlPart:
         __init_.assert_called_once_with(ANY, partname_, content_type_, element_, package_)
         assert isinstance(part, XmlPart)
 
+    def it_can_be_loaded_lazily(self, package_):
+        source_ = Mock(name="source_", blob=b'<w:p xmlns:w="http://foo"/>')
+
+        part = XmlPart.load_lazily(PackURI("/part/name.xml"), "content/type", source_, package_)
+
+        assert "_element" not in part.__dict__
+        assert part.element.tag == "{http://foo}p"
+        assert "_element" in part.__dict__
+
+    def it_provides_the_source_blob_when_not_yet_parsed(self, package_):
+        source_ = Mock(name="source_", blob=b"<foo/>")
+        part = XmlPart.load_lazily(PackURI("/part/name.xml"), "content/type", source_, package_)
+
+        assert part.blob == b"<foo/>"
+        assert "_element" not in part.__dict__
+
+    def it_provides_its_source_only_until_its_XML_is_parsed(self, package_):
+        partname = PackURI("/part/name.xml")
+        source_ = Mock(name="source_", partname=partname, blob=b"<foo/>")
+        part = XmlPart.load_lazily(partname, "content/type", source_, package_)
+
+        assert part.pristine_source is source_
+        assert part.pending_source is source_
+        part.element
+        assert part.pristine_source is None
+        assert part.pending_source is None
+
+    def it_raises_on_other_missing_attributes(self):
+        part = XmlPart(PackURI("/part/name.xml"), "content/type", element("w:p"), None)
+        with pytest.raises(AttributeError, match="'XmlPart' object has no attribute 'foo'"):
+            part.foo
+
+    def it_can_clone_itself_with_a_copy_of_its_XML(self, package_: Mock):
+        part = XmlPart(PackURI("/part/name.xml"), "content/type", element("w:p/w:r"), package_)
+
+        clone = part.clone(package_)
+
+        assert clone.package is package_
+        assert clone.element is not part.element
+        assert clone.blob == part.blob
+        clone.element.remove(clone.element[0])
+        assert len(part.element) == 1
+
+    def it_can_clone_itself_copying_its_XML_only_when_first_accessed(self, package_: Mock):
+        part = XmlPart(PackURI("/part/name.xml"), "content/type", element("w:p/w:r"), package_)
+
+        clone = part.clone(package_, lazy=True)
+
+        assert "_element" not in clone.__dict__
+        assert clone.blob == part.blob
+        assert "_element" not in clone.__dict__
+        assert clone.element is not part.element
+        clone.element.remove(clone.element[0])
+        assert len(part.element) == 1
+        assert clone.clone(package_, lazy=True).blob == clone.blob
+
+    def and_it_does_not_provide_the_source_of_a_lazily_cloned_part(self, package_: Mock):
+        partname = PackURI("/part/name.xml")
+        source_ = Mock(name="source_", partname=partname, blob=b"<foo/>")
+        part = XmlPart.load_lazily(partname, "content/type", source_, package_)
+        part.element.append(element("w:p"))
+
+        clone = part.clone(package_, lazy=True)
+
+        assert clone.pristine_source is None
+        assert clone.blob == part.blob
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_keeps_the_compressed_form_it_was_last_saved_as(self):
+        part = XmlPart(PackURI("/part/name.xml"), "content/type", element("w:p/w:r"), None)
+        blob = part.blob
+        zip_info = ZipInfo()
+        assert part.deflated_blob(blob, None) is None
+
+        part.keep_deflated_blob(blob, None, zip_info, b"compressed")
+
+        assert part.deflated_blob(part.blob, None) == (zip_info, b"compressed")
+        assert part.deflated_blob(part.blob, 9) is None
+        etree.SubElement(part.element, qn("w:r"))
+        assert part.deflated_blob(part.blob, None) is None
+
+    def but_not_for_a_clone(self, package_: Mock):
+        part = XmlPart(PackURI("/part/name.xml"), "content/type", element("w:p/w:r"), package_)
+        part.keep_deflated_blob(part.blob, None, ZipInfo(), b"compressed")
+
+        clone = part.clone(package_)
+
+        assert clone.deflated_blob(clone.blob, None) is None
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
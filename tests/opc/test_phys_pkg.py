@@ -2,7 +2,10 @@
 
 import hashlib
 import io
-from zipfile import ZIP_DEFLATED, ZipFile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo
 
 import pytest
 
@@ -16,8 +19,8 @@ from docx.opc.phys_pkg import (
     _ZipPkgWriter,
 )
 
-from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import Mock, class_mock, loose_mock
+from ..unitutil.file import absjoin, test_file, test_file_dir
+from ..unitutil.mock import FixtureRequest, Mock, class_mock, loose_mock, var_mock
 
 test_docx_path = absjoin(test_file_dir, "test.docx")
 dir_pkg_path = absjoin(test_file_dir, "expanded_docx")
@@ -38,6 +41,19 @@ class DescribeDirPkgReader:
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == "0e62d87ea74ea2b8088fd11ee97b42da9b4c77b0"
 
+    def it_can_open_a_stream_to_read_the_file_for_a_pack_uri(self, dir_reader):
+        with dir_reader.open(PackURI("/word/document.xml")) as stream:
+            blob = stream.read()
+        assert hashlib.sha1(blob).hexdigest() == "0e62d87ea74ea2b8088fd11ee97b42da9b4c77b0"
+
+    def it_can_read_the_blobs_for_several_pack_uris_using_an_executor(self, dir_reader):
+        pack_uris = [PackURI("/word/document.xml"), PackURI("/[Content_Types].xml")]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blobs = dir_reader.blobs_for(pack_uris, executor)
+
+        assert blobs == [dir_reader.blob_for(pack_uri) for pack_uri in pack_uris]
+
     def it_can_get_the_content_types_xml(self, dir_reader):
         sha1 = hashlib.sha1(dir_reader.content_types_xml).hexdigest()
         assert sha1 == "89aadbb12882dd3d7340cd47382dc2c73d75dd81"
@@ -52,6 +68,13 @@ class DescribeDirPkgReader:
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_list_its_members(self, dir_reader):
+        members = {membername: sizes for membername, *sizes in dir_reader.iter_members()}
+
+        assert "word/_rels/document.xml.rels" in members
+        document_xml = dir_reader.blob_for(PackURI("/word/document.xml"))
+        assert members["word/document.xml"] == [len(document_xml), len(document_xml)]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -98,6 +121,38 @@ class DescribeZipPkgReader:
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == "b9b4a98bcac7c5a162825b60c3db7df11e02ac5f"
 
+    def it_can_open_a_stream_to_read_the_member_for_a_pack_uri(self, phys_reader):
+        with phys_reader.open(PackURI("/word/document.xml")) as stream:
+            blob = stream.read()
+        assert hashlib.sha1(blob).hexdigest() == "b9b4a98bcac7c5a162825b60c3db7df11e02ac5f"
+
+    def it_can_decompress_the_blobs_for_several_pack_uris_using_an_executor(self):
+        stream = io.BytesIO()
+        with ZipFile(stream, "w") as zipf:
+            zipf.writestr("deflated.xml", b"<Foo/>" * 1000, ZIP_DEFLATED)
+            zipf.writestr("stored.png", b"PNG" * 10, ZIP_STORED)
+            zipf.writestr("empty.xml", b"", ZIP_DEFLATED)
+            zipf.writestr("bzipped.xml", b"<Bar/>" * 100, ZIP_BZIP2)
+        phys_reader = _ZipPkgReader(stream)
+        pack_uris = [
+            PackURI(p) for p in ("/stored.png", "/deflated.xml", "/bzipped.xml", "/empty.xml")
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blobs = phys_reader.blobs_for(pack_uris, executor)
+
+        assert blobs == [b"PNG" * 10, b"<Foo/>" * 1000, b"<Bar/>" * 100, b""]
+
+    def but_it_raises_when_a_decompressed_blob_fails_its_CRC_check(self):
+        stream = io.BytesIO()
+        with ZipFile(stream, "w") as zipf:
+            zipf.writestr("stored.xml", b"<Foo/>", ZIP_STORED)
+        stream = io.BytesIO(stream.getvalue().replace(b"<Foo/>", b"<Bar/>", 1))
+        phys_reader = _ZipPkgReader(stream)
+
+        with ThreadPoolExecutor(max_workers=2) as executor, pytest.raises(BadZipFile):
+            phys_reader.blobs_for([PackURI("/stored.xml")], executor)
+
     def it_has_the_content_types_xml(self, phys_reader):
         sha1 = hashlib.sha1(phys_reader.content_types_xml).hexdigest()
         assert sha1 == "cd687f67fd6b5f526eedac77cf1deb21968d7245"
@@ -112,6 +167,40 @@ class DescribeZipPkgReader:
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_list_its_members_from_the_zip_directory(self):
+        stream = io.BytesIO()
+        with ZipFile(stream, "w", ZIP_DEFLATED) as zipf:
+            zipf.writestr("word/", b"")
+            zipf.writestr("word/document.xml", b"<w:document/>" * 100)
+        phys_reader = _ZipPkgReader(stream)
+
+        (membername, size, compressed_size), *rest = phys_reader.iter_members()
+
+        assert rest == []
+        assert membername == "word/document.xml"
+        assert size == 1300
+        assert 0 < compressed_size < size
+
+    def it_can_retrieve_the_compressed_blob_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI("/word/document.xml")
+
+        zip_info, compressed_blob = phys_reader.compressed_blob_for(pack_uri)
+
+        assert zip_info.filename == "word/document.xml"
+        assert zip_info.compress_type == ZIP_DEFLATED
+        assert len(compressed_blob) == zip_info.compress_size
+        blob = zlib.decompress(compressed_blob, -15)
+        assert hashlib.sha1(blob).hexdigest() == "b9b4a98bcac7c5a162825b60c3db7df11e02ac5f"
+
+    @pytest.mark.parametrize(
+        ("pkg_file", "expected_value"),
+        [(zip_pkg_path, True), (test_file("having-images.docx"), False), ("foo.docx", False)],
+    )
+    def it_knows_whether_it_is_stored_in_a_pkg_file(
+        self, phys_reader, pkg_file: str, expected_value: bool
+    ):
+        assert phys_reader.is_stored_in(pkg_file) is expected_value
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope="class")
@@ -160,6 +249,182 @@ class DescribeZipPkgWriter:
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    @pytest.mark.parametrize("seekable", [True, False])
+    def it_can_open_a_stream_to_write_a_member(self, pkg_file, seekable: bool):
+        stream = pkg_file if seekable else _NonSeekableStream(pkg_file)
+
+        pkg_writer = PhysPkgWriter(stream)
+        member = pkg_writer.open(PackURI("/part/name.xml"))
+        member.write(b"<Foo>")
+        member.write(b"</Foo>")
+        member.close()
+        pkg_writer.write(PackURI("/part/last.xml"), b"<Bar/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.getinfo("part/name.xml").compress_type == ZIP_DEFLATED
+            assert zipf.read("part/name.xml") == b"<Foo></Foo>"
+            assert zipf.read("part/last.xml") == b"<Bar/>"
+
+    @pytest.mark.parametrize("writes_raw", [True, False])
+    @pytest.mark.parametrize("seekable", [True, False])
+    def it_can_write_a_compressed_blob(
+        self, request: FixtureRequest, pkg_file, seekable: bool, writes_raw: bool
+    ):
+        if not writes_raw:
+            _write_as_on_an_unsupported_python_version(request)
+        blob = b"<BlobbityFooBlob/>" * 100
+        # -- at other than the default level, to tell a copy as-is from one compressed again --
+        compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+        compressed_blob = compressor.compress(blob) + compressor.flush()
+        zip_info = ZipInfo("foo/bar.xml")
+        zip_info.compress_type = ZIP_DEFLATED
+        zip_info.CRC = zlib.crc32(blob)
+        zip_info.file_size = len(blob)
+        stream = pkg_file if seekable else _NonSeekableStream(pkg_file)
+
+        pkg_writer = PhysPkgWriter(stream)
+        if pkg_writer.writes_raw is not writes_raw:
+            pytest.skip("compressed data is not written as-is in this Python version")
+        pkg_writer.write(PackURI("/part/first.xml"), b"<Foo/>")
+        pkg_writer.write_compressed(PackURI("/part/name.xml"), zip_info, compressed_blob)
+        pkg_writer.write(PackURI("/part/last.xml"), b"<Bar/>")
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("part/name.xml") == blob
+            assert zipf.read("part/last.xml") == b"<Bar/>"
+            name_info = zipf.getinfo("part/name.xml")
+            assert name_info.compress_type == ZIP_DEFLATED
+            assert (name_info.compress_size == len(compressed_blob)) is writes_raw
+
+    @pytest.mark.parametrize("use_executor", [False, True])
+    @pytest.mark.parametrize(
+        ("compresslevel", "compress_type", "zlib_level"),
+        [
+            (None, ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION),
+            (1, ZIP_DEFLATED, 1),
+            (9, ZIP_DEFLATED, 9),
+            (ZIP_STORED, ZIP_STORED, None),
+        ],
+    )
+    @pytest.mark.parametrize("seekable", [True, False])
+    def it_compresses_a_blob_at_the_level_it_is_given(
+        self,
+        pkg_file,
+        seekable: bool,
+        use_executor: bool,
+        compresslevel: int | None,
+        compress_type: int,
+        zlib_level: int | None,
+    ):
+        blob = b"<Foo>%d</Foo>" * 500 % tuple(range(500))
+        expected_size = (
+            len(blob) if zlib_level is None else len(zlib.compress(blob, zlib_level)) - 6
+        )
+        stream = pkg_file if seekable else _NonSeekableStream(pkg_file)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pkg_writer = PhysPkgWriter(stream, executor if use_executor else None)
+            pkg_writer.write(PackURI("/part/name.xml"), blob, compresslevel)
+            pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            zip_info = zipf.getinfo("part/name.xml")
+            assert zip_info.compress_type == compress_type
+            assert zip_info.compress_size == expected_size
+            assert zipf.read("part/name.xml") == blob
+
+    @pytest.mark.parametrize("writes_raw", [True, False])
+    def it_copies_the_members_of_a_package_in_compressed_form(
+        self, request: FixtureRequest, pkg_file, writes_raw: bool
+    ):
+        if not writes_raw:
+            _write_as_on_an_unsupported_python_version(request)
+        phys_reader = PhysPkgReader(test_file("having-images.docx"))
+        pack_uris = [PackURI("/%s" % name) for name, _, _ in phys_reader.iter_members()]
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        assert pkg_writer.writes_raw is writes_raw
+        for pack_uri in pack_uris:
+            zip_info, compressed_blob = phys_reader.compressed_blob_for(pack_uri)
+            pkg_writer.write_compressed(pack_uri, zip_info, compressed_blob)
+        pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [pack_uri.membername for pack_uri in pack_uris]
+            for pack_uri in pack_uris:
+                assert zipf.read(pack_uri.membername) == phys_reader.blob_for(pack_uri)
+        phys_reader.close()
+
+    @pytest.mark.parametrize("use_executor", [False, True])
+    @pytest.mark.parametrize("writes_raw", [True, False])
+    def it_reports_the_compressed_form_of_a_blob_it_deflates(
+        self, request: FixtureRequest, pkg_file, writes_raw: bool, use_executor: bool
+    ):
+        if not writes_raw:
+            _write_as_on_an_unsupported_python_version(request)
+        blob = b"<Foo/>" * 1000
+        deflated: List[Tuple[ZipInfo, bytes]] = []
+
+        def on_deflated(zip_info: ZipInfo, compressed_blob: bytes):
+            deflated.append((zip_info, compressed_blob))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pkg_writer = PhysPkgWriter(pkg_file, executor if use_executor else None)
+            pkg_writer.write(PackURI("/a.xml"), blob, 1, on_deflated)
+            pkg_writer.close()
+
+        if not writes_raw:
+            assert deflated == []
+            return
+        ((zip_info, compressed_blob),) = deflated
+        assert zlib.decompress(compressed_blob, -15) == blob
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.read("a.xml") == blob
+            assert zipf.getinfo("a.xml").compress_size == len(compressed_blob)
+            assert zipf.getinfo("a.xml").CRC == zip_info.CRC
+
+    @pytest.mark.parametrize("writes_raw", [True, False])
+    @pytest.mark.parametrize("seekable", [True, False])
+    def it_can_compress_members_using_an_executor(
+        self, request: FixtureRequest, pkg_file, seekable: bool, writes_raw: bool
+    ):
+        # -- without writing compressed data as-is, the executor goes unused --
+        if not writes_raw:
+            _write_as_on_an_unsupported_python_version(request)
+        stream = pkg_file if seekable else _NonSeekableStream(pkg_file)
+        blobs = [b"<Foo/>" * 1000, b"", b"<Bar>%d</Bar>" % 42]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        compressed_blob = compressor.compress(b"<Baz/>") + compressor.flush()
+        zip_info = ZipInfo("baz.xml")
+        zip_info.compress_type = ZIP_DEFLATED
+        zip_info.CRC = zlib.crc32(b"<Baz/>")
+        zip_info.file_size = len(b"<Baz/>")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pkg_writer = PhysPkgWriter(stream, executor)
+            pkg_writer.write(PackURI("/a.xml"), blobs[0])
+            pkg_writer.write_compressed(PackURI("/b.xml"), zip_info, compressed_blob)
+            pkg_writer.write(PackURI("/c.xml"), blobs[1])
+            member = pkg_writer.open(PackURI("/d.xml"))
+            member.write(b"<Streamed/>")
+            member.close()
+            pkg_writer.write(PackURI("/e.xml"), blobs[2])
+            pkg_writer.close()
+
+        with ZipFile(pkg_file, "r") as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ["a.xml", "b.xml", "c.xml", "d.xml", "e.xml"]
+            assert [zipf.read(n) for n in ("a.xml", "c.xml", "e.xml")] == blobs
+            assert zipf.read("b.xml") == b"<Baz/>"
+            assert zipf.read("d.xml") == b"<Streamed/>"
+            assert zipf.getinfo("a.xml").compress_size == len(zlib.compress(blobs[0])) - 6
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -169,6 +434,24 @@ class DescribeZipPkgWriter:
         pkg_file.close()
 
 
+class _NonSeekableStream:
+    """Write-only stream that cannot tell or seek, like a socket or HTTP response."""
+
+    def __init__(self, stream: io.BytesIO):
+        self._stream = stream
+
+    def flush(self):
+        self._stream.flush()
+
+    def write(self, b: bytes) -> int:
+        return self._stream.write(b)
+
+
+def _write_as_on_an_unsupported_python_version(request: FixtureRequest):
+    """Make zip packages written during this test use no private `ZipFile` internals."""
+    var_mock(request, "docx.opc.phys_pkg._RAW_WRITE_VERSIONS", new=((0, 0), (0, 0)))
+
+
 # fixtures -------------------------------------------------
 
 
@@ -4,9 +4,11 @@ import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
-from docx.opc.packuri import PackURI
+from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import _ZipPkgReader
 from docx.opc.pkgreader import (
+    ManifestEntry,
+    PackageManifest,
     PackageReader,
     _ContentTypeMap,
     _SerializedPart,
@@ -14,6 +16,7 @@ from docx.opc.pkgreader import (
     _SerializedRelationships,
 )
 
+from ..unitutil.file import docx_path
 from ..unitutil.mock import (
     ANY,
     Mock,
@@ -31,10 +34,17 @@ from .unitdata.types import a_Default, a_Types, an_Override
 
 class DescribePackageReader:
     def it_can_construct_from_pkg_file(
-        self, _init_, PhysPkgReader_, from_xml, _srels_for, _load_serialized_parts
+        self,
+        _init_,
+        PhysPkgReader_,
+        from_xml,
+        from_phys_reader_,
+        _srels_for,
+        _load_serialized_parts,
     ):
         phys_reader = PhysPkgReader_.return_value
         content_types = from_xml.return_value
+        manifest = from_phys_reader_.return_value
         pkg_srels = _srels_for.return_value
         sparts = _load_serialized_parts.return_value
         pkg_file = Mock(name="pkg_file")
@@ -43,12 +53,57 @@ class DescribePackageReader:
 
         PhysPkgReader_.assert_called_once_with(pkg_file)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
-        _srels_for.assert_called_once_with(phys_reader, "/")
-        _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels, content_types)
+        from_phys_reader_.assert_called_once_with(phys_reader, content_types)
+        _srels_for.assert_called_once_with(phys_reader, "/", manifest)
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, False, None, manifest
+        )
         phys_reader.close.assert_called_once_with()
-        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
+        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts, False, manifest, None)
         assert isinstance(pkg_reader, PackageReader)
 
+    def but_it_leaves_the_pkg_file_open_when_loading_lazily(
+        self,
+        _init_,
+        PhysPkgReader_,
+        from_xml,
+        from_phys_reader_,
+        _srels_for,
+        _load_serialized_parts,
+    ):
+        phys_reader = PhysPkgReader_.return_value
+        content_types = from_xml.return_value
+        manifest = from_phys_reader_.return_value
+        pkg_srels = _srels_for.return_value
+        sparts = _load_serialized_parts.return_value
+
+        PackageReader.from_file(Mock(name="pkg_file"), lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, True, None, manifest
+        )
+        assert phys_reader.close.call_count == 0
+        _init_.assert_called_once_with(
+            ANY, content_types, pkg_srels, sparts, True, manifest, phys_reader
+        )
+
+    def it_can_close_the_pkg_file_it_reads_from_lazily(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.is_stored_in.return_value = True
+        pkg_reader = PackageReader(None, [], [], True, None, phys_reader)
+
+        assert pkg_reader.is_stored_in("foo.docx") is True
+        pkg_reader.close()
+
+        phys_reader.is_stored_in.assert_called_once_with("foo.docx")
+        phys_reader.close.assert_called_once_with()
+
+    def but_not_when_it_is_not_lazy(self):
+        pkg_reader = PackageReader(None, [], [])
+
+        assert pkg_reader.is_stored_in("foo.docx") is False
+        pkg_reader.close()
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -95,12 +150,34 @@ class DescribePackageReader:
         retval = PackageReader._load_serialized_parts(phys_reader, pkg_srels, content_types)
         # verify -----------------------
         expected_calls = [
-            call("/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "reltype1", "srels_1"),
-            call("/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "reltype2", "srels_2"),
+            call("/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "reltype1", "srels_1", None),
+            call("/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "reltype2", "srels_2", None),
         ]
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
 
+    def it_can_load_serialized_parts_decompressing_them_with_an_executor(
+        self, _SerializedPart_, _walk_phys_parts
+    ):
+        _walk_phys_parts.return_value = iter(
+            [("/part/name1.xml", None, "reltype1", "srels_1"), ("/image1.png", None, "rt2", [])]
+        )
+        content_types = {"/part/name1.xml": "app/vnd.type_1", "/image1.png": "image/png"}
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.blobs_for.return_value = ["<Part_1/>", "PNG"]
+        pkg_srels, executor = Mock(name="pkg_srels"), Mock(name="executor")
+
+        PackageReader._load_serialized_parts(
+            phys_reader, pkg_srels, content_types, executor=executor
+        )
+
+        _walk_phys_parts.assert_called_once_with(phys_reader, pkg_srels, lazy=True, manifest=None)
+        phys_reader.blobs_for.assert_called_once_with(["/part/name1.xml", "/image1.png"], executor)
+        assert _SerializedPart_.call_args_list == [
+            call("/part/name1.xml", "app/vnd.type_1", "reltype1", "<Part_1/>", "srels_1", None),
+            call("/image1.png", "image/png", "rt2", "PNG", [], None),
+        ]
+
     def it_can_walk_phys_pkg_parts(self, _srels_for):
         # test data --------------------
         # +----------+       +--------+
@@ -163,6 +240,43 @@ class DescribePackageReader:
         ]
         assert generated_tuples == expected_tuples
 
+    def it_does_not_read_part_blobs_when_walking_lazily(self, _srels_for):
+        srel = Mock(
+            name="rId1", is_external=False, reltype="reltype", target_partname="/part/name.xml"
+        )
+        phys_reader = Mock(name="phys_reader")
+        _srels_for.return_value = []
+
+        generated_tuples = list(PackageReader._walk_phys_parts(phys_reader, [srel], lazy=True))
+
+        assert generated_tuples == [("/part/name.xml", None, "reltype", [])]
+        assert phys_reader.blob_for.call_count == 0
+
+    def it_walks_a_long_chain_of_parts_without_recursing(self, _srels_for):
+        partnames = ["/part/name%d.xml" % n for n in range(5000)]
+        srels = [
+            Mock(name="rId1", is_external=False, reltype="reltype", target_partname=partname)
+            for partname in partnames
+        ]
+        # -- each part is related to the next, and the last back to the first --
+        _srels_for.side_effect = [[srel] for srel in srels[1:]] + [[srels[0]]]
+
+        generated_tuples = list(PackageReader._walk_phys_parts(Mock(), srels[:1], lazy=True))
+
+        assert [partname for partname, _, _, _ in generated_tuples] == partnames
+
+    def it_does_not_look_for_rels_a_part_does_not_have(self, _SerializedRelationships_):
+        phys_reader = Mock(name="phys_reader")
+        manifest = Mock(name="manifest")
+        manifest.has_rels.return_value = False
+        source_uri = PackURI("/word/media/image1.png")
+
+        srels = PackageReader._srels_for(phys_reader, source_uri, manifest)
+
+        manifest.has_rels.assert_called_once_with(source_uri)
+        assert phys_reader.rels_xml_for.call_count == 0
+        assert srels is _SerializedRelationships_.return_value
+
     def it_can_retrieve_srels_for_a_source_uri(self, _SerializedRelationships_):
         # mockery ----------------------
         phys_reader = Mock(name="phys_reader")
@@ -195,6 +309,10 @@ class DescribePackageReader:
     def from_xml(self, request):
         return method_mock(request, _ContentTypeMap, "from_xml", autospec=False)
 
+    @pytest.fixture
+    def from_phys_reader_(self, request):
+        return method_mock(request, PackageManifest, "from_phys_reader", autospec=False)
+
     @pytest.fixture
     def _init_(self, request):
         return initializer_mock(request, PackageReader)
@@ -264,6 +382,70 @@ class DescribePackageReader:
         return method_mock(request, PackageReader, "_walk_phys_parts", autospec=False)
 
 
+class DescribePackageManifest:
+    def it_indexes_the_members_of_a_package_without_reading_them(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.iter_members.return_value = iter(
+            [
+                ("word/document.xml", 1000, 300),
+                ("word/_rels/document.xml.rels", 200, 100),
+                ("word/media/image1.png", 5000, 5000),
+            ]
+        )
+        content_types = _ContentTypeMap()
+        content_types._add_override(PackURI("/word/document.xml"), CT.WML_DOCUMENT_MAIN)
+        content_types._add_default("png", CT.PNG)
+
+        manifest = PackageManifest.from_phys_reader(phys_reader, content_types)
+
+        assert len(manifest) == 3
+        assert [entry.partname for entry in manifest] == [
+            "/word/document.xml",
+            "/word/_rels/document.xml.rels",
+            "/word/media/image1.png",
+        ]
+        entry = manifest["/word/document.xml"]
+        assert (entry.content_type, entry.size, entry.compressed_size) == (
+            CT.WML_DOCUMENT_MAIN,
+            1000,
+            300,
+        )
+        assert manifest["/word/_rels/document.xml.rels"].content_type is None
+        assert (manifest.total_size, manifest.total_compressed_size) == (6200, 5400)
+        assert phys_reader.blob_for.call_count == 0
+
+    def it_knows_which_sources_have_a_rels_item(self):
+        manifest = PackageManifest(
+            {
+                "/_rels/.rels": ManifestEntry(PackURI("/_rels/.rels"), None, 1, 1),
+                "/word/_rels/document.xml.rels": ManifestEntry(
+                    PackURI("/word/_rels/document.xml.rels"), None, 1, 1
+                ),
+            }
+        )
+
+        assert manifest.has_rels(PACKAGE_URI) is True
+        assert manifest.has_rels(PackURI("/word/document.xml")) is True
+        assert manifest.has_rels(PackURI("/word/styles.xml")) is False
+        assert "/word/styles.xml" not in manifest
+
+    def it_can_read_the_manifest_of_a_package_file(self):
+        manifest = PackageManifest.from_file(docx_path("having-images"))
+
+        assert manifest["/word/document.xml"].content_type == CT.WML_DOCUMENT_MAIN
+        assert manifest.has_rels(PackURI("/word/document.xml"))
+        assert not manifest.has_rels(PackURI("/word/styles.xml"))
+
+    def and_the_package_reader_provides_it(self):
+        pkg_reader = PackageReader.from_file(docx_path("having-images"))
+
+        manifest = pkg_reader.manifest
+
+        assert manifest is not None
+        partnames = {entry.partname for entry in manifest}
+        assert {spart.partname for spart in pkg_reader._sparts} <= partnames
+
+
 class Describe_ContentTypeMap:
     def it_can_construct_from_ct_item_xml(self, from_xml_fixture):
         content_types_xml, expected_defaults, expected_overrides = from_xml_fixture
@@ -284,6 +466,16 @@ class Describe_ContentTypeMap:
         with pytest.raises(KeyError):
             ct_map[PackURI("/!blat/rhumba.1x&")]
 
+    def it_can_get_a_content_type_or_a_default(self):
+        ct_map = _ContentTypeMap()
+        ct_map._add_override(PackURI("/word/document.xml"), CT.WML_DOCUMENT_MAIN)
+        ct_map._add_default("png", CT.PNG)
+
+        assert ct_map.get(PackURI("/word/document.xml")) == CT.WML_DOCUMENT_MAIN
+        assert ct_map.get(PackURI("/word/media/image1.PNG")) == CT.PNG
+        assert ct_map.get(PackURI("/[Content_Types].xml")) is None
+        assert ct_map.get(PackURI("/[Content_Types].xml"), "default") == "default"
+
     def it_should_raise_on_key_not_instance_of_PackURI(self):
         ct_map = _ContentTypeMap()
         ct_map._overrides = {PackURI("/part/name1.xml"): "app/vnd.type1"}
@@ -381,6 +573,41 @@ class Describe_SerializedPart:
         assert spart.blob == blob
         assert spart.srels == srels
 
+    def it_reads_its_blob_from_the_phys_pkg_when_loaded_lazily(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.blob_for.return_value = b"<Part/>"
+        spart = _SerializedPart("/part/name.xml", "app/vnd.type", "reltype", None, [], phys_reader)
+
+        blob = spart.blob
+
+        phys_reader.blob_for.assert_called_once_with("/part/name.xml")
+        assert blob == b"<Part/>"
+
+    def it_provides_its_compressed_blob_when_loaded_lazily(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.compressed_blob_for.return_value = ("zip_info", b"xyz")
+        spart = _SerializedPart("/part/name.xml", "app/vnd.type", "reltype", None, [], phys_reader)
+
+        assert spart.compressed_blob == ("zip_info", b"xyz")
+        phys_reader.compressed_blob_for.assert_called_once_with("/part/name.xml")
+
+    def but_not_when_loaded_eagerly(self):
+        spart = _SerializedPart("/part/name.xml", "app/vnd.type", "reltype", b"<Part/>", [])
+        assert spart.compressed_blob is None
+        assert spart.is_stored_in("foo.docx") is False
+
+    def it_can_detach_from_its_phys_pkg(self):
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.blob_for.return_value = b"<Part/>"
+        spart = _SerializedPart("/part/name.xml", "app/vnd.type", "reltype", None, [], phys_reader)
+
+        spart.detach()
+
+        phys_reader.blob_for.assert_called_once_with("/part/name.xml")
+        assert spart.blob == b"<Part/>"
+        assert spart.compressed_blob is None
+        assert spart.is_stored_in(phys_reader) is False
+
 
 class Describe_SerializedRelationship:
     def it_remembers_construction_values(self):
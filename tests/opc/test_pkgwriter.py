@@ -4,13 +4,24 @@
 
 from __future__ import annotations
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZIP_STORED, ZipFile
+
 import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.phys_pkg import _ZipPkgWriter
-from docx.opc.pkgwriter import PackageWriter, _ContentTypesItem
+from docx.opc.pkgreader import _SerializedPart
+from docx.opc.pkgwriter import (
+    DEFAULT_COMPRESSION,
+    PackageWriter,
+    StreamingPackageWriter,
+    _ContentTypesItem,
+)
 from docx.opc.rel import Relationships
 
 from ..unitutil.mock import (
@@ -38,12 +49,44 @@ class DescribePackageWriter:
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, compression=DEFAULT_COMPRESSION),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, None)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_can_generate_a_package_a_chunk_at_a_time(self):
+        pkg_rels, parts = self._pkg_rels_and_parts(3)
+
+        chunks = list(PackageWriter.iter_write(pkg_rels, parts))
+
+        # -- content types and package rels go out with the first part, then one chunk for
+        # -- each other part, then the zip directory --
+        assert len(chunks) == 4
+        with ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [
+                "[Content_Types].xml",
+                "_rels/.rels",
+                "word/document0.xml",
+                "word/document1.xml",
+                "word/document2.xml",
+            ]
+            assert zipf.read("word/document2.xml") == b"<w:p/>" * 1000
+            # -- written as to a stream that cannot seek, each with a data descriptor --
+            assert {zip_info.flag_bits & 0x08 for zip_info in zipf.infolist()} == {0x08}
+
+    def it_can_generate_a_package_compressed_in_an_executor(self):
+        pkg_rels, parts = self._pkg_rels_and_parts(3)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            chunks = list(PackageWriter.iter_write(pkg_rels, parts, executor))
+
+        with ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert len(zipf.namelist()) == 5
+            assert zipf.read("word/document0.xml") == b"<w:p/>" * 1000
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = write_cti_fixture
         PackageWriter._write_content_types_stream(phys_pkg_writer_, parts_)
@@ -69,12 +112,110 @@ class DescribePackageWriter:
         PackageWriter._write_parts(phys_pkg_writer_, [part_, part_2_])
 
         expected_calls = [
-            call(part_.partname, part_.blob),
+            call(part_.partname, part_.blob, None),
             call(part_.partname.rels_uri, part_.rels.xml),
-            call(part_2_.partname, part_2_.blob),
+            call(part_2_.partname, part_2_.blob, None),
         ]
         assert phys_pkg_writer_.write.mock_calls == expected_calls
 
+    @pytest.mark.parametrize(
+        ("content_type", "partname", "compression", "expected_value"),
+        [
+            (CT.PNG, "/word/media/image1.png", DEFAULT_COMPRESSION, ZIP_STORED),
+            (CT.JPEG, "/word/media/image2.jpeg", DEFAULT_COMPRESSION, ZIP_STORED),
+            (CT.WML_DOCUMENT_MAIN, "/word/document.xml", DEFAULT_COMPRESSION, None),
+            (CT.PNG, "/word/media/image1.png", {}, None),
+            (CT.X_EMF, "/word/media/image3.EMF", {"emf": 9}, 9),
+            (CT.X_EMF, "/word/media/image3.emf", {CT.X_EMF: 1, "emf": 9}, 1),
+        ],
+    )
+    def it_writes_each_part_compressed_as_the_compression_policy_specifies(
+        self,
+        phys_pkg_writer_: Mock,
+        part_: Mock,
+        content_type: str,
+        partname: str,
+        compression: dict[str, int],
+        expected_value: int | None,
+    ):
+        part_.rels = []
+        part_.content_type = content_type
+        part_.partname = PackURI(partname)
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_], compression=compression)
+
+        phys_pkg_writer_.write.assert_called_once_with(part_.partname, part_.blob, expected_value)
+
+    def it_copies_a_part_unchanged_since_loading_in_compressed_form(
+        self, phys_pkg_writer_: Mock, part_: Mock, source_: Mock
+    ):
+        part_.rels = []
+        part_.pristine_source = source_
+        source_.compressed_blob = ("zip_info", b"compressed")
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_])
+
+        phys_pkg_writer_.write_compressed.assert_called_once_with(
+            part_.partname, "zip_info", b"compressed"
+        )
+        assert phys_pkg_writer_.write.call_count == 0
+
+    def but_it_writes_the_blob_when_no_compressed_form_is_available(
+        self, phys_pkg_writer_: Mock, part_: Mock, source_: Mock
+    ):
+        part_.rels = []
+        part_.pristine_source = source_
+        source_.compressed_blob = None
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_])
+
+        phys_pkg_writer_.write.assert_called_once_with(part_.partname, part_.blob, None)
+        assert phys_pkg_writer_.write_compressed.call_count == 0
+
+    def it_writes_an_XML_part_unchanged_since_last_saved_in_compressed_form(
+        self, request: FixtureRequest, phys_pkg_writer_: Mock
+    ):
+        xml_part_ = instance_mock(request, XmlPart, pristine_source=None, rels=[])
+        xml_part_.deflated_blob.return_value = ("zip_info", b"compressed")
+
+        PackageWriter._write_parts(phys_pkg_writer_, [xml_part_])
+
+        xml_part_.deflated_blob.assert_called_once_with(xml_part_.blob, None)
+        phys_pkg_writer_.write_compressed.assert_called_once_with(
+            xml_part_.partname, "zip_info", b"compressed"
+        )
+        assert phys_pkg_writer_.write.call_count == 0
+
+    def but_it_writes_the_XML_of_one_changed_since_and_keeps_how_it_is_deflated(
+        self, request: FixtureRequest, phys_pkg_writer_: Mock
+    ):
+        xml_part_ = instance_mock(request, XmlPart, pristine_source=None, rels=[])
+        xml_part_.deflated_blob.return_value = None
+
+        PackageWriter._write_parts(phys_pkg_writer_, [xml_part_])
+
+        ((partname, blob, compresslevel, on_deflated), _) = phys_pkg_writer_.write.call_args
+        assert (partname, blob, compresslevel) == (xml_part_.partname, xml_part_.blob, None)
+        on_deflated("zip_info", b"compressed")
+        xml_part_.keep_deflated_blob.assert_called_once_with(
+            xml_part_.blob, None, "zip_info", b"compressed"
+        )
+
+    def and_it_writes_only_the_rels_of_a_streamed_part(
+        self, phys_pkg_writer_: Mock, part_: Mock, part_2_: Mock, rels_: Mock
+    ):
+        rels_.__len__.return_value = 1
+        part_.partname = PackURI("/word/document.xml")
+        part_.rels = rels_
+        part_2_.rels = []
+
+        PackageWriter._write_parts(phys_pkg_writer_, [part_, part_2_], part_.partname)
+
+        assert phys_pkg_writer_.write.mock_calls == [
+            call(part_.partname.rels_uri, part_.rels.xml),
+            call(part_2_.partname, part_2_.blob, None),
+        ]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -93,11 +234,11 @@ class DescribePackageWriter:
 
     @pytest.fixture
     def part_(self, request: FixtureRequest):
-        return instance_mock(request, Part)
+        return instance_mock(request, Part, pristine_source=None)
 
     @pytest.fixture
     def part_2_(self, request: FixtureRequest):
-        return instance_mock(request, Part)
+        return instance_mock(request, Part, pristine_source=None)
 
     @pytest.fixture
     def parts_(self, request: FixtureRequest):
@@ -117,6 +258,20 @@ class DescribePackageWriter:
     def rels_(self, request: FixtureRequest):
         return instance_mock(request, Relationships)
 
+    @pytest.fixture
+    def source_(self, request: FixtureRequest):
+        return instance_mock(request, _SerializedPart)
+
+    def _pkg_rels_and_parts(self, part_count: int):
+        parts = [
+            Part(PackURI("/word/document%d.xml" % n), CT.WML_DOCUMENT_MAIN, b"<w:p/>" * 1000)
+            for n in range(part_count)
+        ]
+        pkg_rels = Relationships("/")
+        for n, part in enumerate(parts):
+            pkg_rels.add_relationship(RT.OFFICE_DOCUMENT, part, "rId%d" % (n + 1))
+        return pkg_rels, parts
+
     @pytest.fixture
     def write_cti_fixture(self, _ContentTypesItem_, parts_, phys_pkg_writer_, blob_):
         return _ContentTypesItem_, parts_, phys_pkg_writer_, blob_
@@ -143,6 +298,51 @@ class DescribePackageWriter:
         return method_mock(request, _ContentTypesItem, "xml_for")
 
 
+class DescribeStreamingPackageWriter:
+    def it_streams_the_blob_of_a_part_then_writes_the_rest(
+        self, request: FixtureRequest, PhysPkgWriter_: Mock
+    ):
+        phys_writer = PhysPkgWriter_.return_value
+        stream = phys_writer.open.return_value
+        pkg_file, pkg_rels, parts = Mock(name="pkg_file"), Mock(name="pkg_rels"), [Mock()]
+        partname = PackURI("/word/document.xml")
+        write_cts_ = method_mock(request, PackageWriter, "_write_content_types_stream")
+        write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
+        write_parts_ = method_mock(request, PackageWriter, "_write_parts")
+
+        writer = StreamingPackageWriter(pkg_file, partname)
+        writer.write(b"<foo>")
+        writer.write(b"</foo>")
+        writer.close(pkg_rels, parts)
+
+        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        phys_writer.open.assert_called_once_with(partname)
+        assert stream.write.mock_calls == [call(b"<foo>"), call(b"</foo>")]
+        stream.close.assert_called_once_with()
+        write_cts_.assert_called_once_with(phys_writer, parts)
+        write_pkg_rels_.assert_called_once_with(phys_writer, pkg_rels)
+        write_parts_.assert_called_once_with(phys_writer, parts, partname)
+        phys_writer.close.assert_called_once_with()
+
+    def it_can_abort_without_writing_the_rest(self, PhysPkgWriter_: Mock):
+        phys_writer = PhysPkgWriter_.return_value
+        writer = StreamingPackageWriter(Mock(name="pkg_file"), PackURI("/word/document.xml"))
+
+        writer.abort()
+
+        phys_writer.open.return_value.close.assert_called_once_with()
+        phys_writer.close.assert_called_once_with()
+        assert phys_writer.write.call_count == 0
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def PhysPkgWriter_(self):
+        p = patch("docx.opc.pkgwriter.PhysPkgWriter")
+        yield p.start()
+        p.stop()
+
+
 class Describe_ContentTypesItem:
     def it_can_compose_content_types_element(self, xml_for_fixture):
         cti, expected_xml = xml_for_fixture
@@ -2,14 +2,25 @@
 
 """Unit test suite for the docx.opc.rel module."""
 
+from __future__ import annotations
+
 import pytest
 
 from docx.opc.oxml import CT_Relationships
+from docx.opc.package import _PartRegistry
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part
 from docx.opc.rel import Relationships, _Relationship
 
-from ..unitutil.mock import Mock, PropertyMock, call, class_mock, instance_mock, patch
+from ..unitutil.mock import (
+    FixtureRequest,
+    Mock,
+    PropertyMock,
+    call,
+    class_mock,
+    instance_mock,
+    patch,
+)
 
 
 class Describe_Relationship:
@@ -122,6 +133,56 @@ class DescribeRelationships:
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    @pytest.mark.parametrize(
+        ("reuse_rId_gaps", "expected_rIds"), [(True, ["rId2", "rId4"]), (False, ["rId4", "rId5"])]
+    )
+    def it_knows_the_next_available_rId_as_relationships_come_and_go(
+        self, reuse_rId_gaps: bool, expected_rIds: list[str]
+    ):
+        rels = Relationships("/baseURI", reuse_rId_gaps=reuse_rId_gaps)
+        for n in (1, 2, 3):
+            rels.add_relationship("http://rt-hyperlink", "http://link/%d" % n, "rId%d" % n, True)
+        del rels["rId2"]
+
+        rIds = [rels.get_or_add_ext_rel("http://rt-hyperlink", "http://new/%d" % n) for n in (1, 2)]
+
+        assert rIds == expected_rIds
+
+    def it_finds_relationships_added_and_dropped_after_construction(self, request: FixtureRequest):
+        rels = Relationships("/baseURI")
+        part_ = instance_mock(request, Part)
+        rel_1 = rels.add_relationship("http://rt-image", part_, "rId1")
+        rel_2 = rels.add_relationship("http://rt-image", part_, "rId2")
+        rels.add_relationship("http://rt-image", "http://image", "rId3", is_external=True)
+        rels.add_relationship("http://rt-styles", part_, "rId4")
+
+        assert rels.get_or_add("http://rt-image", part_) is rel_1
+        assert rels.get_or_add_ext_rel("http://rt-image", "http://image") == "rId3"
+        assert rels.part_with_reltype("http://rt-styles") is part_
+        del rels["rId1"]
+        assert rels.get_or_add("http://rt-image", part_) is rel_2
+        del rels["rId4"]
+        with pytest.raises(KeyError):
+            rels.part_with_reltype("http://rt-styles")
+
+    def it_keeps_the_part_registry_of_its_package_current(self, request: FixtureRequest):
+        rels = Relationships("/baseURI")
+        part_registry_ = instance_mock(request, _PartRegistry)
+        rels.part_registry = part_registry_
+        part_, part_2_ = instance_mock(request, Part), instance_mock(request, Part)
+
+        rels.add_relationship("http://rt-image", part_, "rId1")
+        rels.add_relationship("http://rt-link", "http://url", "rId2", is_external=True)
+        assert part_registry_.register.call_args_list == [call(part_)]
+        assert part_registry_.invalidate.call_count == 0
+
+        rels.add_relationship("http://rt-image", part_2_, "rId1")
+        assert part_registry_.register.call_args_list == [call(part_), call(part_2_)]
+        assert part_registry_.invalidate.call_count == 1
+
+        del rels["rId2"]
+        assert part_registry_.invalidate.call_count == 2
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
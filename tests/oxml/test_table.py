@@ -12,6 +12,7 @@ from docx.exceptions import InvalidSpanError
 from docx.oxml.parser import parse_xml
 from docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
 from docx.oxml.text.paragraph import CT_P
+from docx.oxml.text.run import CT_R
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -40,6 +41,50 @@ class DescribeCT_Row:
             tr.tc_at_grid_offset(col_idx)
 
 
+class DescribeCT_Tbl:
+    """Unit-test suite for `docx.oxml.table.CT_Tbl` objects."""
+
+    def it_can_add_rows_of_cell_text(self):
+        grid_cxml = "w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=2880},w:gridCol)"
+        tbl = cast(CT_Tbl, element(f"w:tbl/{grid_cxml}"))
+        rows = [["foo", " b&r ", "<baz>"], ["a\tb\r\nc", "\t", ""], [""], []]
+
+        trs = tbl.add_trs(iter(rows))
+
+        assert trs == tbl.tr_lst
+        # -- cell contents match that produced by adding rows and assigning cell text --
+        expected = cast(CT_Tbl, element(f"w:tbl/{grid_cxml}"))
+        for texts in rows:
+            tr = expected.add_tr()
+            for idx, gridCol in enumerate(expected.tblGrid.gridCol_lst):
+                tc = tr.add_tc()
+                if gridCol.w is not None:
+                    tc.width = gridCol.w
+                if idx < len(texts):
+                    tc.p_lst[0].add_r().text = texts[idx]
+        assert tbl.xml == expected.xml
+
+    def but_it_raises_and_adds_nothing_when_a_row_has_too_many_cells(self):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr)"))
+
+        with pytest.raises(ValueError, match="row has 3 cells but table has only 2 columns"):
+            tbl.add_trs([["a", "b"], ["a", "b", "c"]])
+
+        assert len(tbl.tr_lst) == 1
+
+    @pytest.mark.parametrize("text", ["a\x0bb", "nul\x00", "\ufffe", "lone surrogate \ud800"])
+    def and_when_a_cell_text_has_a_character_that_cannot_appear_in_XML(self, text: str):
+        tbl = cast(CT_Tbl, element("w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr)"))
+        # -- as when `text` is assigned to a run --
+        with pytest.raises(ValueError, match="XML compatible|surrogates not allowed"):
+            cast(CT_R, element("w:r")).text = text
+
+        with pytest.raises(ValueError, match="All strings must be XML compatible"):
+            tbl.add_trs([["a", "b"], ["c", text]])
+
+        assert len(tbl.tr_lst) == 1
+
+
 class DescribeCT_Tc:
     """Unit-test suite for `docx.oxml.table.CT_Tc` objects."""
 
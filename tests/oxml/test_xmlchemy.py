@@ -17,6 +17,7 @@ from docx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    compiled_xpath,
     serialize_for_reading,
 )
 
@@ -39,6 +40,24 @@ class DescribeBaseOxmlElement:
         element.remove_all(*tagnames)
         assert element.xml == expected_xml
 
+    def it_can_evaluate_an_xpath_expression_using_the_standard_prefixes(self):
+        element = self.rPr_bldr("biu").element
+
+        assert element.xpath("./w:b | ./w:u") == [element[0], element[2]]
+        assert element.xpath("count(./w:i)") == 1.0
+
+    def it_compiles_each_xpath_expression_only_once(self):
+        element = self.rPr_bldr("biu").element
+        xpath_str = "./w:i[not(@w:val='compiled once')]"
+        compiled_xpath.cache_clear()
+
+        element.xpath(xpath_str)
+        element.xpath(xpath_str)
+        self.rPr_bldr("iu").element.xpath(xpath_str)
+
+        cache_info = compiled_xpath.cache_info()
+        assert (cache_info.misses, cache_info.hits, cache_info.currsize) == (1, 2, 1)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(
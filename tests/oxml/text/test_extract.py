@@ -0,0 +1,96 @@
+"""Test suite for the docx.oxml.text.extract module."""
+
+from __future__ import annotations
+
+import pytest
+
+from docx.oxml.text.extract import hyperlink_text, iter_block_text, paragraph_text, run_text
+from docx.oxml.xmlchemy import BaseOxmlElement
+
+from ...unitutil.cxml import element
+
+
+def _reference_run_text(r: BaseOxmlElement) -> str:
+    """Run text as produced by the `__str__()` method of each run inner-content element."""
+    return "".join(str(e) for e in r.xpath("w:br | w:cr | w:noBreakHyphen | w:ptab | w:t | w:tab"))
+
+
+class DescribeRunText:
+    """Unit-test suite for `docx.oxml.text.extract.run_text()`."""
+
+    @pytest.mark.parametrize(
+        "r_cxml",
+        [
+            "w:r",
+            'w:r/w:t"foobar"',
+            "w:r/w:t",
+            'w:r/(w:br,w:cr,w:noBreakHyphen,w:ptab,w:t"foobar",w:tab)',
+            'w:r/(w:t"a",w:br{w:type=textWrapping},w:t"b")',
+            'w:r/(w:t"a",w:br{w:type=page},w:t"b",w:br{w:type=column})',
+            'w:r/(w:rPr/w:b,w:t"a",w:drawing,w:lastRenderedPageBreak,w:t"b")',
+            'w:r/(w:t"a",w:fldChar,w:instrText"PAGE",w:t"b")',
+        ],
+    )
+    def it_produces_the_same_text_as_the_run_content_elements(self, r_cxml: str):
+        r = element(r_cxml)
+        assert run_text(r) == _reference_run_text(r)
+
+
+class DescribeParagraphText:
+    """Unit-test suite for `docx.oxml.text.extract.paragraph_text()`."""
+
+    @pytest.mark.parametrize(
+        ("p_cxml", "expected_value"),
+        [
+            ("w:p", ""),
+            ('w:p/w:r/w:t"foo"', "foo"),
+            ('w:p/(w:r/w:t"foo",w:r/(w:tab,w:t"bar"))', "foo\tbar"),
+            ('w:p/(w:r/w:t"a",w:hyperlink/(w:r/w:t"b",w:r/w:br),w:r/w:t"c")', "ab\nc"),
+            ('w:p/(w:pPr/w:pStyle{w:val=Foo},w:r/w:t"a")', "a"),
+            ('w:p/(w:r/w:t"a",w:ins/w:r/w:t"b",w:sdt/w:sdtContent/w:r/w:t"c")', "a"),
+            ('w:p/(w:r/w:t"a",w:fldSimple/w:r/w:t"b",w:r/w:br{w:type=page})', "a"),
+        ],
+    )
+    def it_produces_the_text_of_the_runs_and_hyperlinks_it_contains(
+        self, p_cxml: str, expected_value: str
+    ):
+        p = element(p_cxml)
+
+        text = paragraph_text(p)
+
+        assert text == expected_value
+        assert text == "".join(_reference_run_text(r) for r in p.xpath("w:r | w:hyperlink/w:r"))
+
+
+class DescribeHyperlinkText:
+    """Unit-test suite for `docx.oxml.text.extract.hyperlink_text()`."""
+
+    def it_produces_the_text_of_the_runs_it_contains(self):
+        hyperlink = element('w:hyperlink/(w:r/w:t"foo",w:r/(w:noBreakHyphen,w:ptab),w:r)')
+        assert hyperlink_text(hyperlink) == "foo-\t"
+
+
+class DescribeIterBlockText:
+    """Unit-test suite for `docx.oxml.text.extract.iter_block_text()`."""
+
+    @pytest.mark.parametrize(
+        ("cxml", "expected_value"),
+        [
+            ("w:body", []),
+            ("w:body/w:sectPr", []),
+            ('w:body/(w:p/w:r/w:t"a",w:p,w:p/w:r/w:t"b",w:sectPr)', ["a", "", "b"]),
+            (
+                'w:body/(w:p/w:r/w:t"a",w:tbl/(w:tblPr,w:tblGrid,'
+                'w:tr/(w:tc/w:p/w:r/w:t"b",w:tc/(w:p/w:r/w:t"c",w:p)),'
+                'w:tr/w:tc/(w:p/w:r/w:t"d",w:tbl/w:tr/w:tc/w:p/w:r/w:t"e",w:p/w:r/w:t"f")),'
+                'w:p/w:r/w:t"g")',
+                ["a", "b", "c", "", "d", "e", "f", "g"],
+            ),
+            ('w:tc/(w:tcPr,w:p/w:r/w:t"a",w:p/w:r/w:t"b")', ["a", "b"]),
+            ('w:body/(w:p/w:r/w:t"a",w:ins/w:p/w:r/w:t"b",w:sdt/w:sdtContent/w:p)', ["a"]),
+        ],
+    )
+    def it_generates_the_text_of_each_paragraph_in_a_block_item_container(
+        self, cxml: str, expected_value: list[str]
+    ):
+        assert list(iter_block_text(element(cxml))) == expected_value
@@ -102,6 +102,16 @@ class DescribeDocumentPart:
         related_parts_.__getitem__.assert_called_once_with("rId11")
         assert header_part is header_part_
 
+    def it_can_generate_the_saved_package_a_chunk_at_a_time(self, package_: Mock):
+        document_part = DocumentPart(
+            PackURI("/word/document.xml"), CT.WML_DOCUMENT, element("w:document"), package_
+        )
+
+        chunks = document_part.iter_save_chunks()
+
+        package_.iter_save_chunks.assert_called_once_with(None, None)
+        assert chunks is package_.iter_save_chunks.return_value
+
     def it_can_save_the_package_to_a_file(self, package_: Mock):
         document_part = DocumentPart(
             PackURI("/word/document.xml"), CT.WML_DOCUMENT, element("w:document"), package_
@@ -109,7 +119,7 @@ class DescribeDocumentPart:
 
         document_part.save("foobar.docx")
 
-        package_.save.assert_called_once_with("foobar.docx")
+        package_.save.assert_called_once_with("foobar.docx", None, None)
 
     def it_provides_access_to_the_comments_added_to_the_document(
         self, _comments_part_prop_: Mock, comments_part_: Mock, comments_: Mock, package_: Mock
@@ -1,12 +1,37 @@
+# pyright: reportPrivateUsage=false
+
 """Test suite for the docx.api module."""
 
+from __future__ import annotations
+
+import asyncio
+import io
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+
 import pytest
 
 from docx.api import Document as DocumentFactoryFn
+from docx.api import TemplateCache, open_async
 from docx.document import Document as DocumentCls
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.package import Package
+from docx.parts.document import DocumentPart
 
-from .unitutil.mock import FixtureRequest, Mock, class_mock, function_mock, instance_mock
+from .unitutil.file import docx_path
+from .unitutil.mock import (
+    ANY,
+    FixtureRequest,
+    Mock,
+    class_mock,
+    function_mock,
+    instance_mock,
+    method_mock,
+    var_mock,
+)
 
 
 class DescribeDocument:
@@ -19,20 +44,72 @@ class DescribeDocument:
 
         document = DocumentFactoryFn("foobar.docx")
 
-        Package_.open.assert_called_once_with("foobar.docx")
+        Package_.open.assert_called_once_with("foobar.docx", False)
         assert document is document_
 
-    def it_opens_the_default_docx_if_none_specified(
-        self, _default_docx_path_: Mock, Package_: Mock, document_: Mock
+    def it_copies_the_default_docx_from_the_template_cache_if_none_specified(
+        self, _default_docx_path_: Mock, template_cache_: Mock, Package_: Mock, document_: Mock
     ):
         _default_docx_path_.return_value = "default-document.docx"
-        document_part = Package_.open.return_value.main_document_part
+        document_part = template_cache_.package.return_value.main_document_part
         document_part.document = document_
         document_part.content_type = CT.WML_DOCUMENT_MAIN
 
         document = DocumentFactoryFn()
 
-        Package_.open.assert_called_once_with("default-document.docx")
+        template_cache_.package.assert_called_once_with("default-document.docx")
+        assert Package_.open.call_count == 0
+        assert document is document_
+
+    def it_can_copy_a_docx_file_from_the_template_cache(
+        self, template_cache_: Mock, document_: Mock
+    ):
+        document_part = template_cache_.package.return_value.main_document_part
+        document_part.document = document_
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        document = DocumentFactoryFn("template.docx", cached=True)
+
+        template_cache_.package.assert_called_once_with("template.docx")
+        assert document is document_
+
+    def but_it_opens_a_docx_stream_directly_even_when_cached(
+        self, template_cache_: Mock, Package_: Mock, document_: Mock
+    ):
+        document_part = Package_.open.return_value.main_document_part
+        document_part.document = document_
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+        stream = io.BytesIO()
+
+        document = DocumentFactoryFn(stream, cached=True)
+
+        Package_.open.assert_called_once_with(stream, False)
+        assert template_cache_.package.call_count == 0
+        assert document is document_
+
+    def it_can_open_a_docx_file_lazily(self, Package_: Mock, document_: Mock):
+        document_part = Package_.open.return_value.main_document_part
+        document_part.document = document_
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        document = DocumentFactoryFn("foobar.docx", lazy=True)
+
+        Package_.open.assert_called_once_with("foobar.docx", True)
+        assert document is document_
+
+    def it_can_decompress_the_parts_of_a_docx_file_using_a_pool_of_threads(
+        self, Package_: Mock, document_: Mock
+    ):
+        document_part = Package_.open.return_value.main_document_part
+        document_part.document = document_
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        document = DocumentFactoryFn("foobar.docx", workers=4)
+
+        Package_.open.assert_called_once_with("foobar.docx", False, ANY)
+        executor = Package_.open.call_args.args[2]
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == 4
         assert document is document_
 
     def it_raises_on_not_a_Word_file(self, Package_: Mock):
@@ -54,3 +131,156 @@ class DescribeDocument:
     @pytest.fixture
     def Package_(self, request: FixtureRequest):
         return class_mock(request, "docx.api.Package")
+
+    @pytest.fixture
+    def template_cache_(self, request: FixtureRequest):
+        return var_mock(
+            request, "docx.api.template_cache", new=instance_mock(request, TemplateCache)
+        )
+
+
+class DescribeOpenAsync:
+    """Unit-test suite for `docx.api.open_async()`."""
+
+    def it_opens_a_docx_file_in_an_executor(self, DocumentFactoryFn_: Mock, document_: Mock):
+        threads: list[threading.Thread] = []
+
+        def Document_(*args: object):
+            threads.append(threading.current_thread())
+            return document_
+
+        DocumentFactoryFn_.side_effect = Document_
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            document = asyncio.run(open_async("foobar.docx", True, 2, executor=executor))
+
+        DocumentFactoryFn_.assert_called_once_with("foobar.docx", True, 2)
+        assert threads[0] is not threading.main_thread()
+        assert document is document_
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def it_reads_a_docx_file_from_an_async_stream(self, lazy: bool):
+        async def open_stream():
+            stream = asyncio.StreamReader()
+            with open(docx_path("having-images"), "rb") as f:
+                stream.feed_data(f.read())
+            stream.feed_eof()
+            return await open_async(stream, lazy)
+
+        document = asyncio.run(open_stream())
+
+        assert len(document.inline_shapes) == len(
+            DocumentFactoryFn(docx_path("having-images")).inline_shapes
+        )
+
+    # -- fixtures --------------------------------------------------------------------------------
+
+    @pytest.fixture
+    def document_(self, request: FixtureRequest):
+        return instance_mock(request, DocumentCls)
+
+    @pytest.fixture
+    def DocumentFactoryFn_(self, request: FixtureRequest):
+        return function_mock(request, "docx.api.Document")
+
+
+class DescribeTemplateCache:
+    """Unit-test suite for `docx.api.TemplateCache`."""
+
+    def it_loads_a_template_once_and_provides_a_copy_of_it_each_time(self, template_path: str):
+        template_cache = TemplateCache()
+
+        package = template_cache.package(template_path)
+        package_2 = template_cache.package(template_path)
+
+        assert len(template_cache) == 1
+        assert package is not package_2
+        document = cast(DocumentPart, package.main_document_part).document
+        document_2 = cast(DocumentPart, package_2.main_document_part).document
+        document.add_paragraph("Changed")
+        assert [p.text for p in document.paragraphs][-1] == "Changed"
+        assert "Changed" not in [p.text for p in document_2.paragraphs]
+
+    def it_reloads_a_template_when_its_file_changes(self, template_path: str):
+        template_cache = TemplateCache()
+        template_cache.package(template_path)
+        document = DocumentFactoryFn(template_path)
+        document.add_paragraph("Added after caching")
+        document.save(template_path)
+
+        package = template_cache.package(template_path)
+
+        paragraphs = cast(DocumentPart, package.main_document_part).document.paragraphs
+        assert paragraphs[-1].text == "Added after caching"
+        assert len(template_cache) == 1
+
+    def it_drops_the_least_recently_used_template_when_full(self, tmp_path: Path):
+        paths = [str(tmp_path / ("template-%d.docx" % n)) for n in range(3)]
+        for path in paths:
+            shutil.copyfile(docx_path("test"), path)
+        template_cache = TemplateCache(maxsize=2)
+
+        for path in (paths[0], paths[1], paths[0], paths[2]):
+            template_cache.package(path)
+
+        assert list(template_cache._packages) == [paths[0], paths[2]]
+
+    def it_can_change_its_maxsize(self, tmp_path: Path):
+        paths = [str(tmp_path / ("template-%d.docx" % n)) for n in range(3)]
+        template_cache = TemplateCache()
+        for path in paths:
+            shutil.copyfile(docx_path("test"), path)
+            template_cache.package(path)
+
+        template_cache.maxsize = 1
+
+        assert template_cache.maxsize == 1
+        assert list(template_cache._packages) == [paths[2]]
+
+    def it_copies_a_template_in_one_thread_at_a_time(self, template_path: str):
+        template_cache = TemplateCache()
+        thread_count = 8
+        barrier = threading.Barrier(thread_count)
+
+        def copy_template(_: int) -> list[str]:
+            barrier.wait()
+            package = template_cache.package(template_path)
+            return sorted(str(part.partname) for part in package.iter_parts())
+
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            partnames = list(executor.map(copy_template, range(thread_count)))
+
+        expected = sorted(str(p.partname) for p in template_cache.package(template_path).parts)
+        assert partnames == [expected] * thread_count
+        assert len(template_cache) == 1
+
+    def and_it_holds_its_lock_while_copying(self, request: FixtureRequest, template_path: str):
+        template_cache = TemplateCache()
+        locked: list[bool] = []
+
+        def clone(package: Package, lazy: bool):
+            locked.append(template_cache._lock.locked())
+
+        clone_ = method_mock(request, Package, "clone", side_effect=clone)
+
+        template_cache.package(template_path)
+        template_cache.package(template_path)
+
+        assert clone_.call_count == 2
+        assert locked == [True, True]
+
+    def it_can_be_cleared(self, template_path: str):
+        template_cache = TemplateCache()
+        template_cache.package(template_path)
+
+        template_cache.clear()
+
+        assert len(template_cache) == 0
+
+    # -- fixtures --------------------------------------------------------------------------------
+
+    @pytest.fixture
+    def template_path(self, tmp_path: Path) -> str:
+        path = str(tmp_path / "template.docx")
+        shutil.copyfile(docx_path("test"), path)
+        return path
@@ -0,0 +1,151 @@
+"""Unit test suite for the docx.batch module."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Tuple
+
+import pytest
+
+import docx
+from docx.batch import BatchResult, map_documents
+from docx.document import Document
+from docx.opc.exceptions import PackageNotFoundError
+
+from .unitutil.file import docx_path
+from .unitutil.mock import FixtureRequest, Mock, class_mock
+
+
+class DescribeMapDocuments:
+    """Unit-test suite for `docx.batch.map_documents()`."""
+
+    def it_generates_the_result_of_calling_fn_on_each_document(self):
+        paths = [docx_path(name) for name in ("test", "having-images", "blk-inner-content")]
+
+        results = list(map_documents(count_paragraphs, paths, workers=2, chunksize=2))
+
+        assert sorted(result.path for result in results) == sorted(paths)
+        assert all(result.ok for result in results)
+        values = {result.path: result.value for result in results}
+        assert values == {path: count_paragraphs(docx.Document(path)) for path in paths}
+
+    def it_captures_the_error_raised_for_a_file_and_carries_on(self, tmp_path: str):
+        not_a_docx = os.path.join(tmp_path, "not-a.docx")
+        with open(not_a_docx, "wb") as f:
+            f.write(b"not a zip file")
+        paths = [not_a_docx, docx_path("test")]
+
+        results = {r.path: r for r in map_documents(count_paragraphs, paths, workers=1)}
+
+        failed = results[not_a_docx]
+        assert not failed.ok
+        assert isinstance(failed.error, PackageNotFoundError)
+        assert failed.value is None
+        assert "PackageNotFoundError" in (failed.traceback or "")
+        assert results[docx_path("test")].ok
+
+    def it_interrupts_a_file_that_takes_longer_than_the_timeout(self):
+        paths = [docx_path("test"), docx_path("having-images")]
+
+        results = {r.path: r for r in map_documents(sleep_on_images, paths, workers=1, timeout=0.5)}
+
+        outcomes = {path: (r.ok, type(r.error)) for path, r in results.items()}
+        assert outcomes == {
+            docx_path("test"): (True, type(None)),
+            docx_path("having-images"): (False, TimeoutError),
+        }
+        assert str(results[docx_path("having-images")].error) == (
+            "processing took longer than the batch timeout"
+        )
+
+    def it_starts_a_new_pool_when_a_worker_process_dies(self):
+        paths = [docx_path("having-images"), docx_path("test")]
+
+        results = list(
+            map_documents(exit_on_images, paths, workers=1, max_in_flight=1, chunksize=1)
+        )
+
+        assert [(r.path, r.ok, type(r.error)) for r in results] == [
+            (docx_path("having-images"), False, BrokenProcessPool),
+            (docx_path("test"), True, type(None)),
+        ]
+
+    def it_reports_progress_as_each_file_is_completed(self):
+        paths = [docx_path("test")] * 3
+        calls: List[Tuple[int, int | None]] = []
+
+        def progress(completed: int, total: int | None):
+            calls.append((completed, total))
+
+        list(map_documents(count_paragraphs, paths, workers=1, progress=progress))
+        list(map_documents(count_paragraphs, iter(paths), progress=progress))
+
+        assert calls == [(1, 3), (2, 3), (3, 3), (1, None), (2, None), (3, None)]
+
+    def it_bounds_the_number_of_files_in_flight(self, ProcessPoolExecutor_: Mock):
+        pending: List[int] = [0]
+        high_water_marks: List[int] = []
+
+        class ExecutorSpy(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):  # pyright: ignore
+                pending[0] += len(args[1])
+                high_water_marks.append(pending[0])
+                return super().submit(fn, *args, **kwargs)
+
+        ProcessPoolExecutor_.side_effect = ExecutorSpy
+        paths = (docx_path("test") for _ in range(20))
+
+        for _ in map_documents(count_paragraphs, paths, workers=2, chunksize=2, max_in_flight=6):
+            pending[0] -= 1
+
+        assert len(high_water_marks) == 10
+        assert max(high_water_marks) <= 6
+        ProcessPoolExecutor_.assert_called_once_with(2)
+
+    def it_raises_on_a_chunksize_less_than_one(self):
+        with pytest.raises(ValueError, match="chunksize must be at least 1"):
+            next(map_documents(count_paragraphs, [docx_path("test")], chunksize=0))
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def ProcessPoolExecutor_(self, request: FixtureRequest):
+        return class_mock(request, "docx.batch.ProcessPoolExecutor")
+
+
+class DescribeBatchResult:
+    """Unit-test suite for `docx.batch.BatchResult` objects."""
+
+    def it_knows_the_outcome_of_processing_a_file(self):
+        succeeded = BatchResult("a.docx", value=42)
+        error = ValueError("bad")
+        failed = BatchResult("b.docx", error=error, traceback="Traceback ...")
+
+        assert (succeeded.path, succeeded.value, succeeded.ok) == ("a.docx", 42, True)
+        assert (succeeded.error, succeeded.traceback) == (None, None)
+        assert (failed.path, failed.value, failed.ok) == ("b.docx", None, False)
+        assert (failed.error, failed.traceback) == (error, "Traceback ...")
+        assert repr(failed) == "BatchResult('b.docx', error=ValueError('bad'))"
+
+
+# -- helpers ---------------------------------------------------------------------------
+# -- functions mapped over documents must be importable by name in a worker process --
+
+
+def count_paragraphs(document: Document) -> int:
+    return len(document.paragraphs)
+
+
+def exit_on_images(document: Document) -> int:
+    if document.inline_shapes:
+        os._exit(1)
+    return 0
+
+
+def sleep_on_images(document: Document) -> int:
+    if document.inline_shapes:
+        time.sleep(30)
+    return 0
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Iterator, cast
 
 import pytest
 
@@ -13,7 +13,7 @@ from docx.blkcntnr import BlockItemContainer
 from docx.document import Document
 from docx.oxml.document import CT_Body
 from docx.shared import Inches
-from docx.table import Table
+from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
@@ -54,6 +54,20 @@ class DescribeBlockItemContainer:
         assert table._element.xml == snippet_seq("new-tbl")[0]
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_rows_of_cell_text(self, blkcntnr: BlockItemContainer):
+        rows = (row for row in [["a", "b"], ["c", "d", "e"]])
+
+        table = blkcntnr.add_table_from_rows(rows, Inches(3))
+
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert table._tbl is blkcntnr._element.tbl_lst[-1]
+        assert [col.width for col in table.columns] == [Inches(1)] * 3
+        assert [[c.text for c in row.cells] for row in table.rows] == [
+            ["a", "b", ""],
+            ["c", "d", "e"],
+        ]
+
     def it_can_iterate_its_inner_content(self):
         document = docx.Document(test_file("blk-inner-content.docx"))
 
@@ -74,6 +88,31 @@ class DescribeBlockItemContainer:
         with pytest.raises(StopIteration):
             next(inner_content)
 
+    def it_can_iterate_the_text_of_its_paragraphs(self):
+        document = docx.Document(test_file("blk-inner-content.docx"))
+        body = document._body
+
+        texts = list(body.iter_text())
+
+        assert texts == [p.text for p in _iter_paragraphs(body)]
+        assert texts[0] == "P1"
+        assert "T2" in texts
+        assert texts[-1] == "P3"
+
+    def it_visits_each_row_of_a_vertically_merged_cell(self, document_: Mock):
+        body = BlockItemContainer(cast(CT_Body, element("w:body")), document_)
+        table = body.add_table(2, 2, Inches(2))
+        table.cell(0, 0).text = "A"
+        table.cell(0, 1).text = "B"
+        table.cell(1, 1).text = "D"
+        table.cell(0, 0).merge(table.cell(1, 0))
+
+        texts = list(body.iter_text())
+
+        # -- the continuation of the merged cell in the second row has an empty paragraph --
+        assert texts == ["A", "B", "", "D"]
+        assert texts == [p.text for p in _iter_paragraphs(body)]
+
     @pytest.mark.parametrize(
         ("blkcntnr_cxml", "expected_count"),
         [
@@ -149,3 +188,17 @@ class DescribeBlockItemContainer:
     @pytest.fixture
     def paragraph_(self, request: FixtureRequest):
         return instance_mock(request, Paragraph)
+
+
+# -- helpers ---------------------------------------------------------------------------
+
+
+def _iter_paragraphs(blkcntnr: BlockItemContainer) -> Iterator[Paragraph]:
+    """Generate each paragraph in `blkcntnr` the slow way, using the proxy objects."""
+    for item in blkcntnr.iter_inner_content():
+        if isinstance(item, Paragraph):
+            yield item
+            continue
+        for tr in item._tbl.tr_lst:
+            for tc in tr.tc_lst:
+                yield from _iter_paragraphs(_Cell(tc, item))
@@ -5,31 +5,47 @@
 
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+import io
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, cast
+from zipfile import ZipFile
 
 import pytest
+from lxml import etree
 
+import docx
 from docx.comments import Comment, Comments
-from docx.document import Document, _Body
+from docx.document import Document, DocumentStreamWriter, _Body
 from docx.enum.section import WD_SECTION
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK
 from docx.opc.coreprops import CoreProperties
 from docx.oxml.document import CT_Body, CT_Document
+from docx.oxml.ns import qn
+from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.section import Section, Sections
 from docx.settings import Settings
 from docx.shape import InlineShape, InlineShapes
-from docx.shared import Length
+from docx.shared import Length, Pt
 from docx.styles.styles import Styles
 from docx.table import Table
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
 from .unitutil.cxml import element, xml
+from .unitutil.file import docx_path, test_file
 from .unitutil.mock import (
+    ANY,
     FixtureRequest,
     Mock,
     class_mock,
+    function_mock,
     instance_mock,
     method_mock,
     property_mock,
@@ -178,12 +194,249 @@ class DescribeDocument:
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_rows_of_cell_text(
+        self,
+        document: Document,
+        _block_width_prop_: Mock,
+        body_prop_: Mock,
+        body_: Mock,
+        table_: Mock,
+    ):
+        rows, style = [["foo", "bar"]], "Light Shading Accent 1"
+        body_prop_.return_value = body_
+        body_.add_table_from_rows.return_value = table_
+        _block_width_prop_.return_value = width = 42
+
+        table = document.add_table_from_rows(rows, style)
+
+        body_.add_table_from_rows.assert_called_once_with(rows, width)
+        assert table == table_
+        assert table.style == style
+
+    def it_can_start_streaming_to_a_file(
+        self, document: Document, DocumentStreamWriter_: Mock, stream_writer_: Mock
+    ):
+        DocumentStreamWriter_.return_value = stream_writer_
+
+        writer = document.stream_to("foobar.docx", buffer_size=42)
+
+        DocumentStreamWriter_.assert_called_once_with(document, "foobar.docx", 42)
+        assert writer is stream_writer_
+        assert document._stream_writer is stream_writer_
+
+    def but_it_raises_when_it_is_already_being_streamed(
+        self, document: Document, stream_writer_: Mock
+    ):
+        document._stream_writer = stream_writer_
+
+        with pytest.raises(ValueError, match="document is already being streamed"):
+            document.stream_to("foobar.docx")
+
+    def it_lets_the_stream_writer_know_when_a_block_is_added(
+        self,
+        document: Document,
+        body_prop_: Mock,
+        body_: Mock,
+        _block_width_prop_: Mock,
+        stream_writer_: Mock,
+    ):
+        body_prop_.return_value = body_
+        _block_width_prop_.return_value = 42
+        document._stream_writer = stream_writer_
+
+        document.add_paragraph("foo")
+        document.add_table(2, 2)
+        document.add_table_from_rows([["foo"]])
+
+        assert stream_writer_.block_added.call_count == 3
+
+    def it_closes_the_file_it_was_loaded_from_lazily_on_exit(self, tmp_path: Path):
+        path = os.path.realpath(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+
+        with docx.Document(path, lazy=True) as document:
+            assert path in _open_files()
+            text = document.paragraphs[0].text
+
+        assert path not in _open_files()
+        assert text == docx.Document(path).paragraphs[0].text
+
+    def and_it_closes_that_file_when_saved_over_it(self, tmp_path: Path):
+        path = os.path.realpath(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        document = docx.Document(path, lazy=True)
+        assert path in _open_files()
+
+        document.save(path)
+
+        assert path not in _open_files()
+        assert len(docx.Document(path).inline_shapes) == len(document.inline_shapes)
+
+    def it_can_clone_itself(self, document_part_: Mock, package_: Mock, document_: Mock):
+        document_part_.package = package_
+        package_.clone.return_value.main_document_part.document = document_
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        clone = document.clone()
+
+        package_.clone.assert_called_once_with()
+        assert clone is document_
+
+    def but_it_raises_when_cloned_while_being_streamed(
+        self, document: Document, stream_writer_: Mock
+    ):
+        document._stream_writer = stream_writer_
+
+        with pytest.raises(ValueError, match="document is being streamed, it cannot be clon"):
+            document.clone()
+
+    def and_it_raises_when_saved_while_being_streamed(self):
+        document = docx.Document()
+        stream = io.BytesIO()
+
+        with document.stream_to(stream):
+            document.add_paragraph("Foo")
+            with pytest.raises(ValueError, match="document is being streamed, it cannot be sav"):
+                document.save(io.BytesIO())
+            with pytest.raises(ValueError, match="document is being streamed, it cannot be sav"):
+                document.iter_save_chunks()
+            with pytest.raises(ValueError, match="document is being streamed, it cannot be sav"):
+                asyncio.run(document.save_async(io.BytesIO()))
+
+        assert [p.text for p in docx.Document(stream).paragraphs] == ["Foo"]
+        document.save(io.BytesIO())
+
+    def and_its_clone_can_be_changed_independently(self):
+        document = docx.Document(docx_path("having-images"))
+        text = document.text
+
+        clone = document.clone()
+        clone.add_paragraph("Added")
+        clone.add_picture(test_file("monty-truth.png"))
+
+        assert clone is not document
+        assert document.text == text
+        assert clone.text == text + "\nAdded\n"
+        assert len(clone.inline_shapes) == len(document.inline_shapes) + 1
+        assert document.part.package is not clone.part.package
+        stream = io.BytesIO()
+        clone.save(stream)
+        assert docx.Document(stream).text == clone.text
+
     def it_can_save_the_document_to_a_file(self, document_part_: Mock):
         document = Document(cast(CT_Document, element("w:document")), document_part_)
 
         document.save("foobar.docx")
 
-        document_part_.save.assert_called_once_with("foobar.docx")
+        document_part_.save.assert_called_once_with("foobar.docx", compression=None)
+
+    def it_can_compress_the_parts_using_a_pool_of_threads_when_saving(self, document_part_: Mock):
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        document.save("foobar.docx", workers=3)
+
+        document_part_.save.assert_called_once_with("foobar.docx", ANY, None)
+        executor = document_part_.save.call_args.args[1]
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == 3
+
+    def it_can_save_the_document_to_a_file_in_an_executor(self, document_part_: Mock):
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+        compression = {"bin": 0}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asyncio.run(
+                document.save_async("foobar.docx", compression=compression, executor=executor)
+            )
+
+        document_part_.save.assert_called_once_with("foobar.docx", compression=compression)
+
+    @pytest.mark.parametrize("write_method", ["write", "drain"])
+    def it_can_save_the_document_to_an_async_stream(self, write_method: str):
+        document = docx.Document(docx_path("having-images"))
+        stream = {"write": _AsyncWriteStream, "drain": _DrainedStream}[write_method]()
+
+        asyncio.run(document.save_async(stream))
+
+        saved = docx.Document(io.BytesIO(bytes(stream.data)))
+        assert len(saved.inline_shapes) == len(document.inline_shapes)
+        assert stream.awaits == len(list(document.iter_save_chunks()))
+
+    def it_stops_generating_chunks_in_the_executor_when_a_write_fails(
+        self, request: FixtureRequest, document_part_: Mock
+    ):
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+        closing_threads: list[threading.Thread] = []
+
+        def iter_save_chunks() -> Iterator[bytes]:
+            try:
+                yield b"foo"
+                yield b"bar"
+            finally:
+                closing_threads.append(threading.current_thread())
+
+        method_mock(request, Document, "iter_save_chunks", return_value=iter_save_chunks())
+
+        with pytest.raises(OSError, match="disk full"):
+            asyncio.run(document.save_async(_FailingAsyncStream()))
+
+        assert len(closing_threads) == 1
+        assert closing_threads[0] is not threading.main_thread()
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def it_can_generate_the_saved_document_a_chunk_at_a_time(self, workers: int | None):
+        document = docx.Document(docx_path("having-images"))
+
+        chunks = list(document.iter_save_chunks(workers))
+
+        assert len(chunks) > 1
+        saved = docx.Document(io.BytesIO(b"".join(chunks)))
+        assert len(saved.inline_shapes) == len(document.inline_shapes)
+        assert saved.text == document.text
+
+    def it_can_save_to_a_stream_that_cannot_seek(self):
+        document = docx.Document(docx_path("having-images"))
+        stream = io.BytesIO()
+        sink = _WriteOnlyStream(stream)
+
+        document.save(sink)  # pyright: ignore[reportArgumentType]
+
+        saved = docx.Document(stream)
+        assert len(saved.inline_shapes) == len(document.inline_shapes)
+
+    def it_can_be_saved_again_after_a_change(self):
+        document = docx.Document(docx_path("having-images"))
+        first = io.BytesIO()
+        document.save(first)
+
+        document.paragraphs[0].text = "Changed since first saved"
+        second = io.BytesIO()
+        document.save(second)
+
+        assert docx.Document(first).paragraphs[0].text != "Changed since first saved"
+        assert docx.Document(second).paragraphs[0].text == "Changed since first saved"
+
+    def it_saves_a_change_made_with_lxml_directly(self):
+        document = docx.Document(docx_path("having-images"))
+        document.save(io.BytesIO())
+        paragraph_count = len(document.paragraphs)
+
+        etree.SubElement(document.element.body, qn("w:p"))
+        stream = io.BytesIO()
+        document.save(stream)
+
+        assert len(docx.Document(stream).paragraphs) == paragraph_count + 1
+
+    def and_one_made_to_a_part_it_saved_unchanged_before(self):
+        document = docx.Document(docx_path("having-images"))
+        document.save(io.BytesIO())
+        document.save(io.BytesIO())
+
+        document.styles.add_style("Added Since Saved", WD_STYLE_TYPE.PARAGRAPH)
+        stream = io.BytesIO()
+        document.save(stream)
+
+        assert "Added Since Saved" in docx.Document(stream).styles
 
     def it_provides_access_to_the_comments(self, document_part_: Mock, comments_: Mock):
         document_part_.comments = comments_
@@ -191,6 +444,18 @@ class DescribeDocument:
 
         assert document.comments is comments_
 
+    def it_can_report_the_memory_held_by_each_of_its_parts(
+        self, request: FixtureRequest, document_part_: Mock, package_: Mock
+    ):
+        memory_report_ = function_mock(request, "docx.document.memory_report")
+        document_part_.package = package_
+        document = Document(cast(CT_Document, element("w:document")), document_part_)
+
+        report = document.memory_report()
+
+        memory_report_.assert_called_once_with(package_)
+        assert report is memory_report_.return_value
+
     def it_provides_access_to_its_core_properties(
         self, document_part_: Mock, core_properties_: Mock
     ):
@@ -256,6 +521,12 @@ class DescribeDocument:
 
         assert document.tables is tables_
 
+    def it_knows_the_text_of_its_body(self, document: Document, body_prop_: Mock, body_: Mock):
+        body_prop_.return_value = body_
+        body_.iter_text.return_value = iter(("foo", "", "bar"))
+
+        assert document.text == "foo\n\nbar"
+
     def it_provides_access_to_the_document_part(self, document_part_: Mock):
         document = Document(cast(CT_Document, element("w:document")), document_part_)
         assert document.part is document_part_
@@ -329,14 +600,30 @@ class DescribeDocument:
         document_elm = cast(CT_Document, element("w:document"))
         return Document(document_elm, document_part_)
 
+    @pytest.fixture
+    def document_(self, request: FixtureRequest):
+        return instance_mock(request, Document)
+
     @pytest.fixture
     def document_part_(self, request: FixtureRequest):
         return instance_mock(request, DocumentPart)
 
+    @pytest.fixture
+    def DocumentStreamWriter_(self, request: FixtureRequest):
+        return class_mock(request, "docx.document.DocumentStreamWriter")
+
+    @pytest.fixture
+    def stream_writer_(self, request: FixtureRequest):
+        return instance_mock(request, DocumentStreamWriter)
+
     @pytest.fixture
     def inline_shapes_(self, request: FixtureRequest):
         return instance_mock(request, InlineShapes)
 
+    @pytest.fixture
+    def package_(self, request: FixtureRequest):
+        return instance_mock(request, Package)
+
     @pytest.fixture
     def paragraph_(self, request: FixtureRequest):
         return instance_mock(request, Paragraph)
@@ -394,6 +681,70 @@ class DescribeDocument:
         return instance_mock(request, list)
 
 
+class DescribeDocumentStreamWriter:
+    """Unit-test suite for `docx.document.DocumentStreamWriter`."""
+
+    def it_writes_out_body_content_in_batches_as_it_is_added(self):
+        document = docx.Document()
+        stream = io.BytesIO()
+
+        with document.stream_to(stream, buffer_size=3):
+            for idx in range(10):
+                document.add_paragraph("P%d" % idx)
+                assert len(document.paragraphs) <= 4
+            table = document.add_table_from_rows([["A", "B"], ["C", "D"]])
+            paragraph = document.add_paragraph()
+            paragraph.add_run("Last")
+
+        assert len(document.sections) == 1
+        saved = docx.Document(stream)
+        assert [p.text for p in saved.paragraphs] == ["P%d" % i for i in range(10)] + ["Last"]
+        assert [[c.text for c in r.cells] for r in saved.tables[0].rows] == [
+            ["A", "B"],
+            ["C", "D"],
+        ]
+        assert isinstance(table, Table)
+        with ZipFile(stream) as zipf:
+            document_xml = zipf.read("word/document.xml")
+        assert document_xml.count(b'xmlns:w="') == 1
+
+    def it_writes_the_rest_of_the_package_when_closed(self):
+        document = docx.Document()
+        stream = io.BytesIO()
+
+        with document.stream_to(stream, buffer_size=1):
+            document.add_paragraph("Before")
+            document.add_picture(test_file("monty-truth.png"))
+            document.add_paragraph("After", style="Heading 1")
+            document.sections[0].header.add_paragraph("Header")
+            document.styles["Heading 1"].font.size = Pt(42)
+
+        saved = docx.Document(stream)
+        assert [p.text for p in saved.paragraphs] == ["Before", "", "After"]
+        assert len(saved.inline_shapes) == 1
+        assert saved.inline_shapes[0]._inline.graphic.graphicData.pic.blipFill.blip.embed in (
+            saved.part.rels
+        )
+        assert saved.sections[0].header.paragraphs[-1].text == "Header"
+        assert saved.paragraphs[2].style.font.size == Pt(42)
+
+    def it_closes_the_package_without_completing_it_on_error(self):
+        document = docx.Document()
+        stream = io.BytesIO()
+
+        def stream_a_paragraph_then_fail():
+            with document.stream_to(stream):
+                document.add_paragraph("Foo")
+                raise ZeroDivisionError
+
+        with pytest.raises(ZeroDivisionError):
+            stream_a_paragraph_then_fail()
+
+        assert document._stream_writer is None
+        with ZipFile(stream) as zipf:
+            assert zipf.namelist() == ["word/document.xml"]
+
+
 class Describe_Body:
     """Unit-test suite for `docx.document._Body`."""
 
@@ -421,3 +772,67 @@ class Describe_Body:
     @pytest.fixture
     def document_(self, request: FixtureRequest):
         return instance_mock(request, Document)
+
+
+# -- helpers ---------------------------------------------------------------------------
+
+
+def _open_files() -> set[str]:
+    """Path of each file this process has open; skips the test where that is not known."""
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        pytest.skip("open files of a process are not listed in /proc on this platform")
+    paths: set[str] = set()
+    for fd in os.listdir(fd_dir):
+        try:
+            paths.add(os.readlink(os.path.join(fd_dir, fd)))
+        except OSError:
+            continue
+    return paths
+
+
+class _AsyncWriteStream:
+    """Async stream having a coroutine `write()`, like a file opened with `aiofiles`."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.awaits = 0
+
+    async def write(self, data: bytes) -> int:
+        self.data += data
+        self.awaits += 1
+        return len(data)
+
+
+class _FailingAsyncStream:
+    """Async stream whose `write()` fails, like one for a file on a full disk."""
+
+    async def write(self, data: bytes) -> int:
+        raise OSError("disk full")
+
+
+class _DrainedStream:
+    """Async stream written then drained, like `asyncio.StreamWriter`."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.awaits = 0
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        self.awaits += 1
+
+
+class _WriteOnlyStream:
+    """Stream that cannot tell or seek, like a pipe or a socket."""
+
+    def __init__(self, stream: io.BytesIO):
+        self._stream = stream
+
+    def flush(self):
+        self._stream.flush()
+
+    def write(self, b: bytes) -> int:
+        return self._stream.write(b)
@@ -0,0 +1,127 @@
+"""Unit test suite for the docx.extract module."""
+
+from __future__ import annotations
+
+import io
+from zipfile import ZipFile
+
+import pytest
+
+import docx
+from docx.document import Document
+from docx.enum.text import WD_BREAK
+from docx.extract import ParagraphBlock, TableBlock, iter_blocks
+from docx.table import Table
+
+from .unitutil.file import docx_path
+
+
+class DescribeIterBlocks:
+    """Unit-test suite for `docx.extract.iter_blocks()`."""
+
+    @pytest.mark.parametrize(
+        "name", ["blk-inner-content", "having-images", "sct-inner-content", "test"]
+    )
+    def it_generates_a_record_of_each_block_in_the_document_body(self, name: str):
+        path = docx_path(name)
+
+        blocks = list(iter_blocks(path))
+
+        assert _describe(blocks) == _describe_document(docx.Document(path))
+
+    def it_extracts_the_same_text_as_the_document_api(self):
+        document = docx.Document()
+        document.add_heading("Title & <more>", level=1)
+        paragraph = document.add_paragraph("a\tb\nc ", style="List Bullet")
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        paragraph.add_run("d")
+        table = document.add_table_from_rows([["e", "f\tg"], ["h"]])
+        table.cell(1, 1).add_table(1, 1).cell(0, 0).text = "nested"
+        table.cell(1, 1).add_paragraph("i")
+        document.add_paragraph()
+        stream = io.BytesIO()
+        document.save(stream)
+
+        blocks = list(iter_blocks(stream))
+
+        assert _describe(blocks) == _describe_document(docx.Document(stream))
+        assert isinstance(blocks[2], TableBlock)
+        assert blocks[2].rows == [["e", "f\tg"], ["h", "\n\ni"]]
+
+    def it_omits_the_text_of_a_table_nested_in_a_cell_as_the_cell_text_does(self):
+        document = docx.Document()
+        cell = document.add_table(1, 1).cell(0, 0)
+        cell.text = "outer"
+        cell.add_table(1, 1).cell(0, 0).text = "nested"
+        stream = io.BytesIO()
+        document.save(stream)
+
+        (table,) = list(iter_blocks(stream))
+
+        assert isinstance(table, TableBlock)
+        assert table.rows == [["outer\n"]]
+        assert table.rows[0][0] == docx.Document(stream).tables[0].cell(0, 0).text
+
+    def it_reads_a_body_longer_than_the_chunks_it_parses_at_a_time(self):
+        document = docx.Document()
+        for i in range(2000):
+            document.add_paragraph("paragraph %d" % i, style="List Bullet" if i % 2 else None)
+            if i % 100 == 99:
+                document.add_table_from_rows([["cell %d" % i, "x"]])
+        stream = io.BytesIO()
+        document.save(stream)
+        with ZipFile(stream) as package:
+            assert len(package.read("word/document.xml")) > 2 * 64 * 1024
+
+        blocks = list(iter_blocks(stream))
+
+        assert _describe(blocks) == _describe_document(docx.Document(stream))
+
+    def it_gives_no_style_names_when_the_document_has_no_styles_part(self):
+        stream = io.BytesIO()
+        with ZipFile(docx_path("test")) as src, ZipFile(stream, "w") as dst:
+            for item in src.infolist():
+                blob = src.read(item)
+                if item.filename == "word/_rels/document.xml.rels":
+                    blob = blob.replace(b"relationships/styles", b"relationships/stylez")
+                dst.writestr(item, blob)
+
+        blocks = list(iter_blocks(stream))
+
+        assert [(b.text, b.style) for b in blocks if isinstance(b, ParagraphBlock)] == [
+            ("python-docx was here!", None),
+            ("python-docx was here too!", None),
+        ]
+
+    def but_it_raises_when_the_file_has_no_main_document(self):
+        stream = io.BytesIO()
+        with ZipFile(docx_path("test")) as src, ZipFile(stream, "w") as dst:
+            for item in src.infolist():
+                if item.filename != "_rels/.rels":
+                    dst.writestr(item, src.read(item))
+            dst.writestr("_rels/.rels", src.read("_rels/.rels").replace(b"officeDocument", b"x"))
+
+        with pytest.raises(ValueError, match="is not a Word file"):
+            next(iter_blocks(stream))
+
+
+# -- helpers ---------------------------------------------------------------------------
+
+
+def _describe(blocks: list[ParagraphBlock | TableBlock]):
+    return [
+        ("P", b.text, b.style) if isinstance(b, ParagraphBlock) else ("T", b.rows, b.style)
+        for b in blocks
+    ]
+
+
+def _describe_document(document: Document):
+    """Describe blocks the same way as `_describe()`; tables must have no merged cells."""
+    return [
+        (
+            ("T", [[c.text for c in row.cells] for row in b.rows], b.style.name)
+            if isinstance(b, Table)
+            else ("P", b.text, b.style.name)
+        )
+        for b in document.iter_inner_content()
+    ]
@@ -0,0 +1,120 @@
+"""Unit test suite for the docx.instrumentation module."""
+
+from __future__ import annotations
+
+import io
+import time
+from typing import List
+
+import pytest
+
+import docx
+from docx import instrumentation
+from docx.instrumentation import Event, Recorder, add_observer, emit, observe, remove_observer
+
+from .unitutil.file import docx_path
+
+
+class DescribeInstrumentation:
+    """Unit-test suite for the observer registry of `docx.instrumentation`."""
+
+    def it_calls_each_registered_observer_with_an_event_for_a_phase(self):
+        first, second = Recorder(), Recorder()
+        start = time.perf_counter()
+
+        with observe(first), observe(second):
+            emit("parse", start, "/word/document.xml", "text/xml", 100, None, 42)
+
+        assert instrumentation.observers == []
+        for recorder in (first, second):
+            (event,) = recorder.events
+            assert event.phase == "parse"
+            assert event.start == start
+            assert event.seconds >= 0.0
+            assert (event.partname, event.content_type) == ("/word/document.xml", "text/xml")
+            assert (event.bytes_in, event.bytes_out, event.element_count) == (100, None, 42)
+
+    def it_unregisters_an_observer_when_the_with_block_raises(self):
+        recorder = Recorder()
+
+        with pytest.raises(ZeroDivisionError), observe(recorder):
+            1 / 0
+
+        assert instrumentation.observers == []
+
+    def it_can_add_and_remove_an_observer(self):
+        events: List[Event] = []
+
+        add_observer(events.append)
+        try:
+            assert instrumentation.observers == [events.append]
+        finally:
+            remove_observer(events.append)
+
+        assert instrumentation.observers == []
+        with pytest.raises(ValueError, match="not in list"):
+            remove_observer(events.append)
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def it_times_each_phase_of_opening_and_saving_a_document(self, workers: int | None):
+        recorder = Recorder()
+
+        with observe(recorder):
+            document = docx.Document(docx_path("having-images"), workers=workers)
+            document.save(io.BytesIO(), workers=workers)
+
+        phases = {event.phase for event in recorder.events}
+        assert phases == {
+            "read_package",
+            "inflate",
+            "unmarshal",
+            "construct",
+            "parse",
+            "after_unmarshal",
+            "write_package",
+            "serialize",
+            "deflate",
+        }
+        events = {(e.phase, e.partname): e for e in recorder.events}
+        parse = events["parse", "/word/document.xml"]
+        assert parse.bytes_in == events["inflate", "/word/document.xml"].bytes_out
+        assert parse.element_count == sum(1 for _ in document.element.iter())
+        deflate = events["deflate", "/word/styles.xml"]
+        assert deflate.bytes_in == events["serialize", "/word/styles.xml"].bytes_out
+        assert 0 < (deflate.bytes_out or 0) < deflate.bytes_in
+
+    def it_times_parsing_a_lazily_loaded_part_when_it_is_first_accessed(self):
+        document = docx.Document(docx_path("having-images"), lazy=True)
+        recorder = Recorder()
+
+        with observe(recorder):
+            document.styles
+            document.styles
+
+        assert [(e.phase, e.partname) for e in recorder.events] == [
+            ("inflate", "/word/styles.xml"),
+            ("parse", "/word/styles.xml"),
+        ]
+
+
+class DescribeEvent:
+    """Unit-test suite for `docx.instrumentation.Event` objects."""
+
+    def it_has_a_helpful_repr(self):
+        assert repr(Event("parse", 1.0, 0.25, "/word/document.xml")) == (
+            "<Event parse /word/document.xml 0.250000s>"
+        )
+        assert repr(Event("unmarshal", 1.0, 0.5)) == "<Event unmarshal 0.500000s>"
+
+
+class DescribeRecorder:
+    """Unit-test suite for `docx.instrumentation.Recorder` objects."""
+
+    def it_totals_the_seconds_recorded_for_each_phase(self):
+        recorder = Recorder()
+
+        for phase, seconds in (("parse", 0.25), ("inflate", 0.5), ("parse", 0.125)):
+            recorder(Event(phase, 0.0, seconds))
+
+        assert [event.phase for event in recorder.events] == ["parse", "inflate", "parse"]
+        assert recorder.totals() == {"parse": 0.375, "inflate": 0.5}
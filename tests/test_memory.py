@@ -0,0 +1,120 @@
+"""Unit test suite for the docx.memory module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import docx
+from docx.memory import MemoryReport, PartMemory, memory_report
+from docx.opc.constants import CONTENT_TYPE as CT
+
+from .unitutil.file import docx_path
+
+
+class DescribeMemoryReport:
+    """Unit-test suite for `docx.memory.memory_report()` and |MemoryReport| objects."""
+
+    def it_reports_the_memory_held_by_each_part_of_a_package(self):
+        document = docx.Document(docx_path("having-images"))
+        package = document.part.package
+
+        report = memory_report(package)
+
+        assert [part.partname for part in report] == [p.partname for p in package.iter_parts()]
+        assert all(part.loaded for part in report)
+        parts = {part.partname: part for part in report}
+        document_xml = parts["/word/document.xml"]
+        assert document_xml.content_type == CT.WML_DOCUMENT_MAIN
+        assert document_xml.element_count == sum(1 for _ in document.element.iter())
+        assert document_xml.tree_size > len(document.part.blob)
+        assert document_xml.blob_size == 0
+        assert document_xml.rel_count == len(document.part.rels)
+        image = parts["/word/media/image1.png"]
+        assert (image.blob_size, image.element_count, image.tree_size) == (3739, 0, 0)
+        assert image.size == image.blob_size
+
+    def it_counts_the_XML_an_XML_part_keeps_from_when_it_was_last_saved(self):
+        document = docx.Document(docx_path("having-images"))
+        document.save(io.BytesIO())
+
+        report = memory_report(document.part.package)
+
+        blob = document.part.blob
+        deflated = document.part.deflated_blob(blob, None)
+        assert deflated is not None
+        assert _document_part_memory(report).blob_size == len(blob) + len(deflated[1])
+
+    def it_counts_the_values_a_part_has_cached(self):
+        document = docx.Document(docx_path("having-images"))
+        before = _document_part_memory(memory_report(document.part.package))
+
+        document.inline_shapes
+
+        after = _document_part_memory(memory_report(document.part.package))
+        assert after.cached_count == before.cached_count + 1
+
+    def it_does_not_load_a_lazily_loaded_part(self):
+        document = docx.Document(docx_path("having-images"), lazy=True)
+        package = document.part.package
+
+        parts = {part.partname: part for part in memory_report(package)}
+
+        styles = parts["/word/styles.xml"]
+        assert (styles.loaded, styles.element_count, styles.size) == (False, 0, 0)
+        assert parts["/word/document.xml"].loaded
+        styles_part = next(p for p in package.iter_parts() if p.partname == "/word/styles.xml")
+        assert "_element" not in styles_part.__dict__
+
+    def it_totals_the_memory_held_by_its_parts(self):
+        report = MemoryReport(
+            [
+                _part_memory("/word/document.xml", CT.WML_DOCUMENT_MAIN, 0, 10, 1000),
+                _part_memory("/word/media/image1.png", CT.PNG, 500, 0, 0),
+                _part_memory("/word/media/image2.png", CT.PNG, 2000, 0, 0),
+            ]
+        )
+
+        assert len(report) == 3
+        assert report[1].partname == "/word/media/image1.png"
+        assert report.total_size == 3500
+        assert report.total_element_count == 10
+        assert report.by_content_type() == {CT.WML_DOCUMENT_MAIN: 1000, CT.PNG: 2500}
+        assert [part.partname for part in report.largest(2)] == [
+            "/word/media/image2.png",
+            "/word/document.xml",
+        ]
+
+
+class DescribePartMemory:
+    """Unit-test suite for `docx.memory.PartMemory` objects."""
+
+    @pytest.mark.parametrize(("blob_size", "tree_size", "expected_size"), [(0, 0, 0), (3, 4, 7)])
+    def it_knows_the_memory_held_by_its_part(
+        self, blob_size: int, tree_size: int, expected_size: int
+    ):
+        part = PartMemory("/word/document.xml", "text/xml", True, blob_size, 2, tree_size, 1, 5)
+
+        assert (part.partname, part.content_type, part.loaded) == (
+            "/word/document.xml",
+            "text/xml",
+            True,
+        )
+        assert (part.blob_size, part.element_count, part.tree_size) == (blob_size, 2, tree_size)
+        assert (part.cached_count, part.rel_count) == (1, 5)
+        assert part.size == expected_size
+        assert repr(part) == "<PartMemory /word/document.xml %d bytes>" % expected_size
+
+
+# -- helpers ---------------------------------------------------------------------------
+
+
+def _document_part_memory(report: MemoryReport) -> PartMemory:
+    return next(part for part in report if part.partname == "/word/document.xml")
+
+
+def _part_memory(
+    partname: str, content_type: str, blob_size: int, element_count: int, tree_size: int
+) -> PartMemory:
+    return PartMemory(partname, content_type, True, blob_size, element_count, tree_size, 0, 0)
@@ -0,0 +1,156 @@
+"""Unit test suite for the docx.merge module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from typing import Any, Dict
+
+import pytest
+
+import docx
+from docx.instrumentation import Recorder, observe
+from docx.merge import MergeTemplate
+
+
+class DescribeMergeTemplate:
+    """Unit-test suite for `docx.merge.MergeTemplate` objects."""
+
+    def it_knows_the_fields_having_placeholders(self):
+        template = MergeTemplate(_template_docx())
+
+        assert template.fields == ["name", "amount", "city", "ref"]
+
+    def it_renders_a_document_from_a_record(self):
+        template = MergeTemplate(_template_docx())
+
+        document = docx.Document(io.BytesIO(template.render(_RECORD)))
+
+        (paragraph,) = document.paragraphs
+        assert paragraph.text == "Dear Ann, you owe 12.5 today, Ann."
+        assert [run.bold for run in paragraph.runs if run.text] == [None, None, None]
+        assert document.tables[0].cell(0, 1).text == "City: Leeds"
+        section = document.sections[0]
+        assert section.header.paragraphs[0].text == "Ref "
+        assert section.footer.paragraphs[0].text == "Page footer"
+
+    def it_replaces_a_placeholder_split_across_runs_in_the_first_of_them(self):
+        template = MergeTemplate(_template_docx())
+
+        document = docx.Document(io.BytesIO(template.render(_RECORD)))
+
+        runs = document.paragraphs[0].runs
+        assert [(run.text, run.bold) for run in runs[:3]] == [
+            ("Dear ", None),
+            ("Ann", None),
+            ("", True),
+        ]
+
+    def it_escapes_the_text_of_a_value_and_renders_breaks_and_tabs(self):
+        template = MergeTemplate(_template_docx())
+        record = dict(_RECORD, city="<A & B>\nLeeds\tUK")
+
+        document = docx.Document(io.BytesIO(template.render(record)))
+
+        assert document.tables[0].cell(0, 1).text == "City: <A & B>\nLeeds\tUK"
+
+    @pytest.mark.parametrize("city", ["Leeds\rUK", "Leeds\r\nUK", "Leeds\nUK"])
+    def it_renders_a_carriage_return_as_a_break_too(self, city: str):
+        template = MergeTemplate(_template_docx())
+
+        blob = template.render(dict(_RECORD, city=city))
+
+        with zipfile.ZipFile(io.BytesIO(blob)) as package:
+            document_xml = package.read("word/document.xml")
+        assert b"\r" not in document_xml
+        assert document_xml.count(b"<w:br/>") == 1
+        assert docx.Document(io.BytesIO(blob)).tables[0].cell(0, 1).text == "City: Leeds\nUK"
+
+    def it_writes_the_parts_having_no_placeholders_as_compressed_when_indexed(self):
+        template = MergeTemplate(_template_docx())
+        recorder = Recorder()
+
+        with observe(recorder):
+            first = template.render(_RECORD)
+        second = template.render(dict(_RECORD, name="Bob"))
+
+        deflated = {event.partname for event in recorder.events if event.phase == "deflate"}
+        assert deflated == {"/word/document.xml", "/word/header1.xml"}
+        with zipfile.ZipFile(io.BytesIO(first)) as a, zipfile.ZipFile(io.BytesIO(second)) as b:
+            assert a.namelist() == b.namelist()
+            assert a.read("word/styles.xml") == b.read("word/styles.xml")
+            assert a.read("word/document.xml") != b.read("word/document.xml")
+
+    def it_can_save_a_rendered_document_to_a_file(self, tmp_path: Any):
+        template = MergeTemplate(_template_docx())
+        path = str(tmp_path / "letter.docx")
+
+        template.save(_RECORD, path)
+
+        assert docx.Document(path).paragraphs[0].text.startswith("Dear Ann,")
+
+    def it_can_render_a_document_from_each_of_many_records(self):
+        template = MergeTemplate(_template_docx())
+        records = [dict(_RECORD, name=name) for name in ("Ann", "Bob", "Cy")]
+
+        blobs = list(template.iter_render(records))
+
+        names = [docx.Document(io.BytesIO(blob)).paragraphs[0].text[5:8] for blob in blobs]
+        assert names == ["Ann", "Bob", "Cy,"]
+
+    def it_can_use_another_placeholder_pattern(self):
+        document = docx.Document()
+        document.add_paragraph("Dear «name», {{name}}")
+        stream = io.BytesIO()
+        document.save(stream)
+
+        template = MergeTemplate(stream, r"«(\w+)»")
+
+        assert template.fields == ["name"]
+        rendered = docx.Document(io.BytesIO(template.render({"name": "Ann"})))
+        assert rendered.paragraphs[0].text == "Dear Ann, {{name}}"
+
+    def it_raises_on_a_record_having_no_value_for_a_field(self):
+        template = MergeTemplate(_template_docx())
+        record = dict(_RECORD)
+        del record["city"]
+
+        with pytest.raises(KeyError, match="city"):
+            template.render(record)
+
+    @pytest.mark.parametrize("city", ["nul\x00", "lone surrogate \ud800", "\udfff", "\uffff"])
+    def it_raises_on_a_value_that_cannot_appear_in_XML(self, city: str):
+        template = MergeTemplate(_template_docx())
+
+        with pytest.raises(ValueError, match="cannot appear in XML"):
+            template.render(dict(_RECORD, city=city))
+
+    def but_not_on_one_having_characters_outside_the_BMP(self):
+        template = MergeTemplate(_template_docx())
+
+        document = docx.Document(io.BytesIO(template.render(dict(_RECORD, city="\U0001f600"))))
+
+        assert document.tables[0].cell(0, 1).text == "City: \U0001f600"
+
+
+# -- helpers ---------------------------------------------------------------------------
+
+_RECORD: Dict[str, Any] = {"name": "Ann", "amount": 12.5, "city": "Leeds", "ref": None}
+
+
+def _template_docx() -> io.BytesIO:
+    """Return a stream holding a template having placeholders in a paragraph split across
+    runs, a table cell, and a header, and a footer having none."""
+    document = docx.Document()
+    paragraph = document.add_paragraph("Dear ")
+    paragraph.add_run("{{na")
+    paragraph.add_run("me}}").bold = True
+    paragraph.add_run(", you owe {{ amount }} today, {{name}}.")
+    document.add_table(rows=1, cols=2).cell(0, 1).text = "City: {{city}}"
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Ref {{ref}}"
+    section.footer.paragraphs[0].text = "Page footer"
+    stream = io.BytesIO()
+    document.save(stream)
+    stream.seek(0)
+    return stream
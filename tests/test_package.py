@@ -4,9 +4,16 @@
 
 from __future__ import annotations
 
+import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
 import pytest
 
 from docx.image.image import Image
+from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
@@ -45,6 +52,123 @@ class DescribePackage:
         assert len(image_parts) == 3
         assert all(isinstance(p, ImagePart) for p in image_parts)
 
+    def it_copies_unchanged_parts_as_is_when_saving_a_lazily_loaded_package(self):
+        src_path = docx_path("having-images")
+        package = Package.open(src_path, lazy=True)
+        package.main_document_part.element.body.add_p()
+        stream = io.BytesIO()
+
+        package.save(stream)
+
+        with ZipFile(src_path) as src_zip, ZipFile(stream) as dst_zip:
+            assert dst_zip.testzip() is None
+            for name in ("word/media/image1.png", "word/styles.xml", "word/header1.xml"):
+                src_info, dst_info = src_zip.getinfo(name), dst_zip.getinfo(name)
+                assert dst_info.compress_type == src_info.compress_type
+                assert dst_info.compress_size == src_info.compress_size
+                assert dst_info.CRC == src_info.CRC
+            src_doc = src_zip.read("word/document.xml")
+            assert dst_zip.read("word/document.xml") != src_doc
+
+    def it_reads_pending_parts_before_saving_over_the_file_they_are_read_from(self, tmp_path: Path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        package = Package.open(path, lazy=True)
+
+        package.save(path)
+
+        reloaded = Package.open(path)
+        assert len(reloaded.image_parts) == 3
+        assert all(len(p.blob) > 0 for p in reloaded.image_parts)
+
+    def and_it_reads_those_of_parts_renamed_since_they_were_loaded(self, tmp_path: Path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        with ZipFile(path) as zipf:
+            image_blob = zipf.read("word/media/image1.png")
+            header_blob = zipf.read("word/header1.xml")
+        package = Package.open(path, lazy=True)
+        parts = {str(part.partname): part for part in package.iter_parts()}
+        parts["/word/media/image1.png"].partname = PackURI("/word/media/renamed.png")
+        parts["/word/header1.xml"].partname = PackURI("/word/renamed.xml")
+
+        package.save(path)
+
+        with ZipFile(path) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("word/media/renamed.png") == image_blob
+            assert zipf.read("word/renamed.xml") == header_blob
+
+    def and_those_of_parts_already_read_but_still_copied_as_is(self, tmp_path: Path):
+        path = str(tmp_path / "having-images.docx")
+        shutil.copy(docx_path("having-images"), path)
+        with ZipFile(path) as zipf:
+            image_blobs = {name: zipf.read(name) for name in zipf.namelist() if "media" in name}
+        package = Package.open(path, lazy=True)
+        next(iter(package.image_parts)).blob
+
+        package.save(path)
+
+        with ZipFile(path) as zipf:
+            assert zipf.testzip() is None
+            assert {name: zipf.read(name) for name in image_blobs} == image_blobs
+
+    def it_can_decompress_its_parts_concurrently_when_opening(self):
+        path = docx_path("having-images")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            package = Package.open(path, executor=executor)
+
+        expected = {p.partname: p.blob for p in Package.open(path).iter_parts()}
+        assert {p.partname: p.blob for p in package.iter_parts()} == expected
+        assert len(package.image_parts) == 3
+
+    def it_gathers_the_image_parts_of_a_clone(self):
+        package = Package.open(docx_path("having-images"))
+
+        clone = package.clone()
+
+        assert len(clone.image_parts) == len(package.image_parts) == 3
+        for image_part, image_part_clone in zip(package.image_parts, clone.image_parts):
+            assert image_part_clone is not image_part
+            assert image_part_clone.partname == image_part.partname
+            assert image_part_clone.blob is image_part.blob
+
+    @pytest.mark.parametrize(
+        ("compression", "expected_compress_type"),
+        [(None, ZIP_STORED), ({}, ZIP_DEFLATED), ({CT.PNG: 9}, ZIP_DEFLATED)],
+    )
+    def it_compresses_its_parts_as_the_compression_policy_specifies(
+        self, compression: dict[str, int] | None, expected_compress_type: int
+    ):
+        package = Package.open(docx_path("having-images"))
+        stream = io.BytesIO()
+
+        package.save(stream, compression=compression)
+
+        with ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            png_infos = [i for i in zipf.infolist() if i.filename.endswith(".png")]
+            assert png_infos
+            assert all(i.compress_type == expected_compress_type for i in png_infos)
+            assert zipf.getinfo("word/document.xml").compress_type == ZIP_DEFLATED
+
+    def it_can_compress_its_parts_concurrently_when_saving(self):
+        package = Package.open(docx_path("having-images"))
+        serial_stream, parallel_stream = io.BytesIO(), io.BytesIO()
+        package.save(serial_stream)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            package.save(parallel_stream, executor)
+
+        with ZipFile(serial_stream) as serial_zip, ZipFile(parallel_stream) as parallel_zip:
+            assert parallel_zip.testzip() is None
+            assert parallel_zip.namelist() == serial_zip.namelist()
+            for serial_info, parallel_info in zip(serial_zip.infolist(), parallel_zip.infolist()):
+                assert parallel_info.compress_type == serial_info.compress_type
+                assert parallel_info.compress_size == serial_info.compress_size
+                assert parallel_info.CRC == serial_info.CRC
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -126,6 +250,52 @@ class DescribeImageParts:
 
         assert next_partname == PackURI("/word/media/image%d.png" % expected_partname_number)
 
+    def it_knows_the_next_available_image_partname_as_image_parts_are_added(
+        self, request: FixtureRequest
+    ):
+        image_parts = ImageParts()
+        for n in (1, 2, 4):
+            image_parts.append(
+                instance_mock(request, ImagePart, partname=PackURI(f"/word/media/image{n}.png"))
+            )
+
+        assert image_parts._next_image_partname("png") == PackURI("/word/media/image3.png")
+        image_parts.append(
+            instance_mock(request, ImagePart, partname=PackURI("/word/media/image3.jpeg"))
+        )
+        assert image_parts._next_image_partname("gif") == PackURI("/word/media/image5.gif")
+
+    def it_can_find_an_image_part_by_sha1(self, request: FixtureRequest):
+        image_parts = ImageParts()
+        part_1, part_2, part_3, part_4 = (
+            instance_mock(
+                request, ImagePart, partname=PackURI(f"/word/media/image{n}.png"), sha1=sha1
+            )
+            for n, sha1 in ((1, "f005ba11"), (2, "fa1afe1"), (3, "f005ba11"), (4, "feedbac"))
+        )
+        for image_part in (part_1, part_2, part_3):
+            image_parts.append(image_part)
+
+        assert image_parts._get_by_sha1("f005ba11") is part_1
+        assert image_parts._get_by_sha1("fa1afe1") is part_2
+        assert image_parts._get_by_sha1("feedbac") is None
+        image_parts.append(part_4)
+        assert image_parts._get_by_sha1("feedbac") is part_4
+
+    def it_hashes_each_image_only_once_and_only_when_needed(self, request: FixtureRequest):
+        sha1_ = property_mock(request, ImagePart, "sha1", return_value="f005ba11")
+        image_parts = ImageParts()
+        for n in (1, 2):
+            image_parts.append(ImagePart(PackURI(f"/word/media/image{n}.png"), CT.PNG, b"blob"))
+        assert sha1_.call_count == 0
+
+        image_parts._get_by_sha1("fa1afe1")
+        image_parts._get_by_sha1("fa1afe1")
+        assert sha1_.call_count == 2
+
+        image_parts.append(ImagePart(PackURI("/word/media/image3.png"), CT.PNG, b"blob"))
+        assert sha1_.call_count == 3
+
     def it_can_add_a_new_image_part(
         self,
         _next_image_partname_: Mock,
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from docx.opc.part import XmlPart
-from docx.shared import Cm, ElementProxy, Emu, Inches, Length, Mm, Pt, RGBColor, Twips
+from docx.shared import (
+    Cm,
+    ElementProxy,
+    Emu,
+    Inches,
+    Length,
+    Mm,
+    Pt,
+    RGBColor,
+    Twips,
+    is_async_readable,
+    is_async_writable,
+    spool_from_async,
+    write_async,
+)
 
 from .unitutil.cxml import element
-from .unitutil.mock import FixtureRequest, Mock, instance_mock
+from .unitutil.mock import FixtureRequest, Mock, instance_mock, var_mock
 
 
 class DescribeElementProxy:
@@ -119,3 +137,73 @@ class DescribeRGBColor:
     def it_has_a_custom_repr(self):
         rgb_color = RGBColor(0x42, 0xF0, 0xBA)
         assert repr(rgb_color) == "RGBColor(0x42, 0xf0, 0xba)"
+
+
+class DescribeAsyncStreamSupport:
+    """Unit-test suite for the asyncio stream helpers in `docx.shared`."""
+
+    def it_knows_an_async_stream_from_a_file_like_object(self):
+        class Reader:
+            async def read(self, n: int = -1) -> bytes:
+                return b""
+
+        class Writer:
+            def write(self, data: bytes) -> None: ...
+
+            async def drain(self) -> None: ...
+
+        assert is_async_readable(Reader()) is True
+        assert is_async_readable(io.BytesIO()) is False
+        assert is_async_readable("foobar.docx") is False
+        assert is_async_writable(Writer()) is True
+        assert is_async_writable(io.BytesIO()) is False
+        assert is_async_writable("foobar.docx") is False
+
+    @pytest.mark.parametrize("max_size", [1024 * 1024, 100])
+    def it_can_spool_an_async_stream(self, request: FixtureRequest, max_size: int):
+        var_mock(request, "docx.shared.SPOOL_MAX_SIZE", new=max_size)
+        var_mock(request, "docx.shared.ASYNC_CHUNK_SIZE", new=64)
+        data = bytes(range(256)) * 4
+
+        async def spool_data() -> tuple[bool, bytes]:
+            stream = asyncio.StreamReader()
+            stream.feed_data(data)
+            stream.feed_eof()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                spool = await spool_from_async(stream, executor)
+            with spool:
+                return bool(spool._rolled), spool.read()  # pyright: ignore
+
+        rolled_to_disk, spooled = asyncio.run(spool_data())
+
+        assert rolled_to_disk is (max_size < len(data))
+        assert spooled == data
+
+    def it_can_write_to_an_async_stream(self):
+        class AsyncWriteStream:
+            def __init__(self):
+                self.calls: list[str] = []
+
+            async def write(self, data: bytes) -> None:
+                self.calls.append("write %r" % data)
+
+        class DrainedStream(AsyncWriteStream):
+            def write(self, data: bytes) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+                self.calls.append("write %r" % data)
+
+            async def drain(self) -> None:
+                self.calls.append("drain")
+
+        streams = AsyncWriteStream(), DrainedStream()
+
+        async def write_to_each():
+            for stream in streams:
+                await write_async(stream, b"foo")
+                await write_async(stream, b"bar")
+
+        asyncio.run(write_to_each())
+
+        assert [stream.calls for stream in streams] == [
+            ["write b'foo'", "write b'bar'"],
+            ["write b'foo'", "drain", "write b'bar'", "drain"],
+        ]
@@ -25,7 +25,17 @@ from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import FixtureRequest, Mock, instance_mock, property_mock
+from .unitutil.mock import FixtureRequest, Mock, instance_mock, patch, property_mock
+
+
+def _grid_tcs(table: Table) -> list[CT_Tc]:
+    """`w:tc` elements of the (possibly cached) cell grid of `table`."""
+    return [cell._tc for cell in table._cells]
+
+
+def _fresh_grid_tcs(table: Table) -> list[CT_Tc]:
+    """`w:tc` elements of the cell grid of `table` built afresh, not from its cache."""
+    return [cell._tc for cell in table._build_cells(table._tbl.col_count)]
 
 
 class DescribeTable:
@@ -43,6 +53,33 @@ class DescribeTable:
         assert row._tr is table._tbl.tr_lst[-1]
         assert row._parent is table
 
+    def it_can_add_rows_of_cell_text(self, document_: Mock):
+        snippets = snippet_seq("add-row-col")
+        table = Table(cast(CT_Tbl, parse_xml(snippets[0])), document_)
+        row_count = len(table.rows)
+        table._cells  # -- populate the grid cache --
+
+        table.add_rows([["foo", "bar"], ["baz"]])
+
+        assert len(table.rows) == row_count + 2
+        assert [c.text for c in table.rows[-2].cells] == ["foo", "bar"]
+        assert [c.text for c in table.rows[-1].cells] == ["baz", ""]
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    @pytest.mark.parametrize("text", ["", "foo", " a\tb\nc ", "<&>"])
+    def it_adds_a_cell_having_the_same_XML_as_one_its_text_is_assigned_to(
+        self, document_: Mock, text: str
+    ):
+        snippets = snippet_seq("add-row-col")
+        table = Table(cast(CT_Tbl, parse_xml(snippets[0])), document_)
+        assigned = Table(cast(CT_Tbl, parse_xml(snippets[0])), document_)
+
+        table.add_rows([[text, text]])
+        for cell in assigned.add_row().cells:
+            cell.text = text
+
+        assert table._tbl.xml == assigned._tbl.xml
+
     def it_can_add_a_column(self, document_: Mock):
         snippets = snippet_seq("add-row-col")
         tbl = cast(CT_Tbl, parse_xml(snippets[0]))
@@ -286,6 +323,91 @@ class DescribeTable:
             for idx in matching_idxs[1:]:
                 assert cells[idx] is cells[comparator_idx]
 
+    def it_builds_its_cell_grid_only_once(self, table: Table):
+        cells = table._cells
+
+        with patch.object(CT_Tbl, "iter_tcs") as iter_tcs_:
+            for row_idx in range(2):
+                for col_idx in range(2):
+                    assert table.cell(row_idx, col_idx) is cells[row_idx * 2 + col_idx]
+
+        assert iter_tcs_.call_count == 0
+
+    def it_keeps_its_cell_grid_current_when_a_row_is_added(self, table: Table):
+        table.cell(0, 0)
+
+        row = table.add_row()
+
+        assert len(table._cells) == 6
+        assert [c._tc for c in table.row_cells(2)] == row._tr.tc_lst
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    def it_rebuilds_its_cell_grid_when_a_column_is_added(self, table: Table):
+        table.cell(0, 0)
+
+        table.add_column(Inches(1))
+
+        assert len(table._cells) == 6
+        assert table.cell(1, 2)._tc is table._tbl.tr_lst[1].tc_lst[2]
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    def it_rebuilds_its_cell_grid_when_cells_are_merged(self, document_: Mock):
+        tbl_cxml = (
+            "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),"
+            "w:tr/(w:tc/w:p,w:tc/w:p))"
+        )
+        table = Table(cast(CT_Tbl, element(tbl_cxml)), document_)
+        assert table.cell(1, 0) is not table.cell(0, 0)
+
+        table.cell(0, 0).merge(table.cell(1, 0))
+
+        assert table.cell(1, 0) is table.cell(0, 0)
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    def it_shares_its_cell_grid_with_other_Table_objects_for_its_element(self, document_: Mock):
+        tbl_cxml = (
+            "w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),"
+            "w:tr/(w:tc/w:p,w:tc/w:p))"
+        )
+        table = Table(cast(CT_Tbl, element(tbl_cxml)), document_)
+        other = Table(table._tbl, document_)
+        table.cell(0, 0)
+
+        other.add_row()
+        assert table.cell(2, 1)._tc is table._tbl.tr_lst[2].tc_lst[1]
+
+        other.add_column(Inches(1))
+        assert table.cell(2, 2)._tc is table._tbl.tr_lst[2].tc_lst[2]
+
+        other.cell(0, 0).merge(other.cell(1, 0))
+        assert table.cell(1, 0) is table.cell(0, 0)
+        assert table.column_cells(0)[1] is table.column_cells(0)[0]
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    def it_rebuilds_its_cell_grid_when_a_row_is_added_to_the_XML(self, table: Table):
+        table.cell(0, 0)
+
+        table._tbl.add_tr().extend([element("w:tc/w:p"), element("w:tc/w:p")])
+
+        assert len(table._cells) == 6
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
+    def and_when_a_row_other_than_the_last_is_removed_from_the_XML(self, document_: Mock):
+        tbl_cxml = (
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p),'
+            'w:tr/(w:tc/w:p/w:r/w:t"b",w:tc/w:p),w:tr/(w:tc/w:p/w:r/w:t"c",w:tc/w:p))'
+        )
+        tbl = cast(CT_Tbl, element(tbl_cxml))
+        Table(tbl, document_).cell(0, 0)
+
+        tbl.remove(tbl.tr_lst[1])
+
+        table = Table(tbl, document_)
+        assert table.cell(1, 0).text == "c"
+        with pytest.raises(IndexError):
+            table.cell(2, 0)
+        assert _grid_tcs(table) == _fresh_grid_tcs(table)
+
     def it_knows_its_column_count_to_help(self, document_: Mock):
         tbl_cxml = "w:tbl/w:tblGrid/(w:gridCol,w:gridCol,w:gridCol)"
         expected_value = 3
@@ -347,6 +469,7 @@ class Describe_Cell:
             ('w:tc/(w:p/w:r/w:t"foo",w:p/w:r/w:t"bar")', "foo\nbar"),
             ('w:tc/(w:tcPr,w:p/w:r/w:t"foobar")', "foobar"),
             ('w:tc/w:p/w:r/(w:t"fo",w:tab,w:t"ob",w:br,w:t"ar",w:br)', "fo\tob\nar\n"),
+            ('w:tc/w:p/(w:r/w:t"a",w:hyperlink/w:r/(w:t"b",w:br{w:type=page}),w:r/w:cr)', "ab\n"),
         ],
     )
     def it_knows_what_text_it_contains(self, tc_cxml: str, expected_text: str, parent_: Mock):